@@ -11,10 +11,20 @@ Requires:
 - FFmpeg
 - libcaca (with img2txt utility)
 - Python 3.6+
+- numpy (optional, renders spectrum frames without ffmpeg's showspectrum and
+  converts frames to ASCII when libcaca cannot be loaded)
+- Pillow (optional, renders ANSI frames in-process)
+- tqdm (optional, progress bars)
 """
 
 import argparse
+import ctypes
+import ctypes.util
+import hashlib
+import mmap
 import os
+import queue
+import re
 import sys
 import subprocess
 import tempfile
@@ -22,8 +32,70 @@ import shutil
 import json
 import time
 import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Dict, Tuple, Optional, Union
+from typing import List, Dict, Iterator, Tuple, Optional, Union
+
+# numpy is optional: without it spectrum frames are rendered by ffmpeg
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Pillow is optional: without it ANSI frames are rendered by terminal-to-image
+try:
+    from PIL import Image, ImageColor, ImageDraw, ImageFont
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# tqdm is optional: without it a built-in progress bar is drawn
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# FFT size used for the numpy spectrum renderer
+SPECTRUM_NFFT = 2048
+
+# Rendered ASCII frames kept per conversion run for near-duplicate frames
+ASCII_CACHE_SIZE = 2048
+
+# Standard 16-colour VGA palette used by libcaca's ANSI export
+ANSI_PALETTE = [
+    (0, 0, 0), (170, 0, 0), (0, 170, 0), (170, 85, 0),
+    (0, 0, 170), (170, 0, 170), (0, 170, 170), (170, 170, 170),
+    (85, 85, 85), (255, 85, 85), (85, 255, 85), (255, 255, 85),
+    (85, 85, 255), (255, 85, 255), (85, 255, 255), (255, 255, 255)
+]
+
+SGR_RE = re.compile(r"\x1b\[([0-9;]*)m")
+
+# Characters from darkest to brightest for the numpy ASCII renderer
+ASCII_RAMP = " .:-=+*#%@"
+
+# ITU-R BT.601 luma weights
+LUMA_WEIGHTS = (0.299, 0.587, 0.114)
+
+# Frames buffered between the renderers and the ffmpeg encoder
+SINK_QUEUE_SIZE = 4
+
+# Minimum seconds between redraws of the built-in progress bar
+PROGRESS_INTERVAL = 0.1
+
+# Where ffprobe results are cached between runs
+PROBE_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "asciisymphony"
+)
+
+# Keeps the top 4 bits of every byte so tiny colour jitter maps to one key
+_QUANTIZE = bytes(i & 0xF0 for i in range(256))
 
 @dataclass
 class VisualizationOptions:
@@ -43,164 +115,970 @@ class VisualizationOptions:
     reactive_colors: bool = True
     font_size: int = 12
     background_color: str = "black"
+    jobs: Optional[int] = None  # parallel frame workers, defaults to the CPU count
+    start: float = 0.0  # seconds into the audio to start rendering
+    end: Optional[float] = None  # seconds into the audio to stop, None for the end
+    
+    @property
+    def workers(self) -> int:
+        """Number of parallel frame workers to use"""
+        return self.jobs or os.cpu_count() or 1
+
+class ProgressBar:
+    """Thread-safe frame progress bar, redrawn at most every PROGRESS_INTERVAL"""
+    
+    def __init__(self, total_frames: int, desc: str):
+        self.total_frames = total_frames
+        self.count = 0
+        self.lock = threading.Lock()
+        self.last_draw = 0.0
+        self.bar = tqdm(total=total_frames, desc=desc, unit="frm") if TQDM_AVAILABLE else None
+    
+    def advance(self, *_):
+        """Record one finished frame; usable as a future done-callback"""
+        with self.lock:
+            self.count += 1
+            if self.bar is not None:
+                self.bar.update()
+                return
+            now = time.monotonic()
+            if now - self.last_draw >= PROGRESS_INTERVAL:
+                self.last_draw = now
+                self._draw()
+    
+    def close(self):
+        """Draw the final state of the bar"""
+        with self.lock:
+            if self.bar is not None:
+                self.bar.close()
+            else:
+                self._draw()
+    
+    def _draw(self):
+        progress = min(self.count / max(self.total_frames, 1), 1.0)
+        bar_length = 40
+        filled = int(bar_length * progress)
+        bar = "█" * filled + "░" * (bar_length - filled)
+        percent = int(progress * 100)
+        sys.stdout.write(f"\r|{bar}| {percent}% ({self.count}/{self.total_frames} frames)")
+        sys.stdout.flush()
+
+def _rainbow_lut() -> "np.ndarray":
+    """Build a 256-entry intensity -> RGB colormap resembling showspectrum's rainbow"""
+    level = np.linspace(0.0, 1.0, 256, dtype=np.float32)
+    # Hue sweeps from violet (quiet) to red (loud) while brightness ramps up
+    hue = (1.0 - level) * 0.75 * 6.0
+    sector = np.floor(hue).astype(np.int32) % 6
+    frac = hue - np.floor(hue)
+    value = np.sqrt(level)
+    rising = value * frac
+    falling = value * (1.0 - frac)
+    zero = np.zeros_like(value)
+    
+    red = np.choose(sector, [value, falling, zero, zero, rising, value])
+    green = np.choose(sector, [rising, value, value, falling, zero, zero])
+    blue = np.choose(sector, [zero, zero, rising, value, value, falling])
+    return (np.stack([red, green, blue], axis=1) * 255).astype(np.uint8)
 
 class AudioFeatures:
     """Extracts and manages audio features for visualization"""
     
     def __init__(self, audio_file: str):
         self.audio_file = audio_file
-        self.duration = self._get_duration()
-        self.sample_rate = self._get_sample_rate()
-        self.temp_dir = None
+        info = self._probe()
+        self.duration = float(info["format"]["duration"])
+        self.sample_rate = int(info["streams"][0]["sample_rate"])
+        self.frame_width = 0
+        self.frame_height = 0
+        self.total_frames = 0
     
-    def _get_duration(self) -> float:
-        """Get audio duration in seconds"""
+    def _probe(self) -> Dict:
+        """Get duration and sample rate with a single ffprobe call
+        
+        Results are cached on disk keyed by path, mtime and size, so
+        re-rendering the same file does not spawn ffprobe at all.
+        """
+        st = os.stat(self.audio_file)
+        key = hashlib.blake2b(
+            "\0".join((os.path.abspath(self.audio_file), str(st.st_mtime_ns), str(st.st_size))).encode()
+        ).hexdigest()
+        cache_path = os.path.join(PROBE_CACHE_DIR, f"{key}.json")
+        
+        try:
+            with open(cache_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+        
         cmd = [
-            "ffprobe", "-v", "error", "-show_entries", "format=duration",
-            "-of", "json", self.audio_file
+            "ffprobe", "-v", "error",
+            "-show_entries", "format=duration:stream=sample_rate",
+            "-select_streams", "a:0", "-of", "json", self.audio_file
         ]
         result = subprocess.run(cmd, capture_output=True, text=True)
         data = json.loads(result.stdout)
-        return float(data["format"]["duration"])
+        
+        # Only cache a complete answer; a transient ffprobe failure must
+        # not be replayed on every later run
+        if result.returncode != 0:
+            return data
+        try:
+            float(data["format"]["duration"])
+            int(data["streams"][0]["sample_rate"])
+        except (KeyError, IndexError, TypeError, ValueError):
+            return data
+        
+        try:
+            os.makedirs(PROBE_CACHE_DIR, exist_ok=True)
+            # Write-then-rename so a concurrent run never reads a partial file
+            temp_path = f"{cache_path}.{os.getpid()}"
+            with open(temp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            pass
+        
+        return data
     
-    def _get_sample_rate(self) -> int:
-        """Get audio sample rate"""
+    def stream_frames(self, options: VisualizationOptions) -> Iterator[bytes]:
+        """Return an iterator of raw RGB24 visualization frames
+        
+        Frames are produced in memory and consumed as they arrive, so nothing
+        is written to disk between analysis and ASCII conversion. The frame
+        geometry is available in frame_width/frame_height before iterating.
+        """
+        end = self.duration if options.end is None else min(options.end, self.duration)
+        self.total_frames = max(0, int((end - options.start) * options.fps))
+        
+        if NUMPY_AVAILABLE and options.visualization_type == "spectrum":
+            self.frame_width = options.width
+            self.frame_height = options.height
+            return self._spectrum_frames(options)
+        
+        # Render at twice the ASCII resolution so libcaca still has
+        # sub-cell detail to dither from
+        self.frame_width = options.width * 2
+        self.frame_height = options.height * 2
+        return self._ffmpeg_frames(options)
+    
+    def _ffmpeg_frames(self, options: VisualizationOptions) -> Iterator[bytes]:
+        """Yield frames rendered by ffmpeg's showspectrum straight from its stdout"""
+        filter_complex = self._get_filter_complex(options.fps)
         cmd = [
-            "ffprobe", "-v", "error", "-select_streams", "a:0", 
-            "-show_entries", "stream=sample_rate", "-of", "json", self.audio_file
+            "ffmpeg", "-v", "error", *self._seek_args(options), "-i", self.audio_file,
+            "-filter_complex", filter_complex,
+            "-f", "rawvideo", "-pix_fmt", "rgb24", "pipe:1"
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        data = json.loads(result.stdout)
-        return int(data["streams"][0]["sample_rate"])
+        frame_size = self.frame_width * self.frame_height * 3
+        
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        try:
+            while True:
+                pixels = proc.stdout.read(frame_size)
+                if len(pixels) < frame_size:
+                    break
+                yield pixels
+        finally:
+            proc.stdout.close()
+            proc.wait()
     
-    def extract_frames(self, temp_dir: str, fps: int = 25) -> str:
-        """Extract audio visualization frames to temporary directory"""
-        self.temp_dir = temp_dir
-        frames_dir = os.path.join(temp_dir, "frames")
-        os.makedirs(frames_dir, exist_ok=True)
+    @staticmethod
+    def _seek_args(options: VisualizationOptions) -> List[str]:
+        """Input options limiting decoding to the requested time range
         
-        total_frames = int(self.duration * fps)
-        print(f"⏳ Extracting {total_frames} audio visualization frames...")
+        Placed before -i so ffmpeg seeks in the container instead of
+        decoding and discarding everything up to the start point.
+        """
+        args = []
+        if options.start:
+            args += ["-ss", str(options.start)]
+        if options.end is not None:
+            args += ["-to", str(options.end)]
+        return args
+    
+    def stream_pcm(self, hop: int, seek_args: List[str] = ()):
+        """Yield mono int16 PCM blocks of `hop` samples decoded by ffmpeg"""
+        cmd = [
+            "ffmpeg", "-v", "error", *seek_args, "-i", self.audio_file,
+            "-ac", "1", "-ar", str(self.sample_rate), "-f", "s16le", "pipe:1"
+        ]
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        try:
+            while True:
+                data = proc.stdout.read(hop * 2)
+                if len(data) < 2:
+                    break
+                yield np.frombuffer(data[:len(data) & ~1], "<i2")
+        finally:
+            proc.stdout.close()
+            proc.wait()
+    
+    def _spectrum_frames(self, options: VisualizationOptions) -> Iterator[bytes]:
+        """Render spectrum frames with a numpy STFT directly at ASCII resolution
         
-        # Create a progress bar
-        progress_thread = threading.Thread(
-            target=self._show_progress,
-            args=(total_frames,)
-        )
-        progress_thread.daemon = True
-        progress_thread.start()
+        Mirrors ffmpeg's showspectrum (vertical, linear scale, slide=replace):
+        each video frame draws one new column of the spectrogram, wrapping
+        around once the right edge is reached.
+        """
+        width, height = options.width, options.height
         
-        # Generate visualization frames based on audio
-        filter_complex = self._get_filter_complex(fps)
+        hop = max(1, self.sample_rate // options.fps)
+        nfft = SPECTRUM_NFFT
+        win = np.hanning(nfft).astype(np.float32)
+        # Full-scale sine through a Hann window peaks at 32768 * nfft / 4
+        norm = 255.0 / (32768.0 * nfft / 4)
+        # Linear frequency bands, lowest frequency on the bottom row
+        edges = np.linspace(0, nfft // 2 + 1, height + 1).astype(np.intp)[:-1]
+        lut = _rainbow_lut()
         
-        cmd = [
-            "ffmpeg", "-y", "-i", self.audio_file, "-filter_complex", filter_complex,
-            "-fps_mode", "vfr", "-frame_size", "64", "-f", "rawvideo",
-            "-pix_fmt", "rgb24", os.path.join(frames_dir, "frame%05d.raw")
-        ]
+        image = np.zeros((height, width), np.uint8)
+        history = np.zeros(nfft, np.float32)
         
-        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        print("\n✅ Frame extraction complete!")
-        return frames_dir
+        count = 0
+        for block in self.stream_pcm(hop, self._seek_args(options)):
+            # Slide the analysis window forward by one hop
+            n = min(len(block), nfft)
+            history = np.roll(history, -n)
+            history[-n:] = block[-n:]
+            
+            mag = np.abs(np.fft.rfft(history * win))
+            bands = np.maximum.reduceat(mag, edges)
+            column = np.clip(bands * norm, 0, 255).astype(np.uint8)
+            image[:, count % width] = column[::-1]
+            
+            count += 1
+            yield lut[image].tobytes()
     
     def _get_filter_complex(self, fps: int) -> str:
         """Get FFmpeg filter complex string for audio visualization"""
         return (
             f"showspectrum=s=640x480:mode=combined:color=rainbow:scale=lin:slide=replace:fps={fps},"
-            "format=rgb24"
+            f"scale={self.frame_width}:{self.frame_height}:flags=area,format=rgb24"
         )
+
+def load_libcaca():
+    """Load the libcaca shared library, or return None if it is not installed"""
+    name = ctypes.util.find_library("caca")
+    if name is None:
+        return None
+    try:
+        lib = ctypes.CDLL(name)
+    except OSError:
+        return None
     
-    def _show_progress(self, total_frames: int):
-        """Display a progress bar during frame extraction"""
-        while not os.path.exists(self.temp_dir):
-            time.sleep(0.1)
+    lib.caca_create_canvas.restype = ctypes.c_void_p
+    lib.caca_create_canvas.argtypes = [ctypes.c_int, ctypes.c_int]
+    lib.caca_free_canvas.argtypes = [ctypes.c_void_p]
+    lib.caca_clear_canvas.argtypes = [ctypes.c_void_p]
+    lib.caca_create_dither.restype = ctypes.c_void_p
+    lib.caca_create_dither.argtypes = [
+        ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+        ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32
+    ]
+    lib.caca_free_dither.argtypes = [ctypes.c_void_p]
+    lib.caca_set_dither_algorithm.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+    lib.caca_set_dither_brightness.argtypes = [ctypes.c_void_p, ctypes.c_float]
+    lib.caca_set_dither_contrast.argtypes = [ctypes.c_void_p, ctypes.c_float]
+    lib.caca_set_dither_invert.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    lib.caca_dither_bitmap.argtypes = [
+        ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+        ctypes.c_void_p, ctypes.c_void_p
+    ]
+    lib.caca_export_canvas_to_memory.restype = ctypes.c_void_p
+    lib.caca_export_canvas_to_memory.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_size_t)
+    ]
+    return lib
+
+def read_png(stream) -> Optional[bytes]:
+    """Read exactly one PNG image from a binary stream, or None at end of stream"""
+    data = bytearray(stream.read(len(PNG_SIGNATURE)))
+    if len(data) < len(PNG_SIGNATURE):
+        return None
+    
+    # Walk the chunk list (length, type, payload, CRC) until IEND
+    while True:
+        header = stream.read(8)
+        if len(header) < 8:
+            return None
+        data += header
+        length = int.from_bytes(header[:4], "big")
+        body = stream.read(length + 4)
+        if len(body) < length + 4:
+            return None
+        data += body
+        if header[4:8] == b"IEND":
+            return bytes(data)
+
+class CacaRenderer:
+    """Dithers raw RGB24 frames to ASCII in-process through libcaca"""
+    
+    def __init__(self, lib, options: VisualizationOptions, frame_width: int, frame_height: int):
+        self.lib = lib
+        self.options = options
+        self.frame_width = frame_width
+        self.frame_height = frame_height
         
-        frames_dir = os.path.join(self.temp_dir, "frames")
-        prev_count = 0
+        # libcaca reads 24bpp pixels as a native-endian integer
+        if sys.byteorder == "little":
+            rmask, gmask, bmask = 0x0000FF, 0x00FF00, 0xFF0000
+        else:
+            rmask, gmask, bmask = 0xFF0000, 0x00FF00, 0x0000FF
         
-        while True:
-            if not os.path.exists(frames_dir):
-                time.sleep(0.5)
-                continue
-                
-            files = os.listdir(frames_dir)
-            count = len([f for f in files if f.startswith("frame") and f.endswith(".raw")])
+        self.canvas = lib.caca_create_canvas(options.width, options.height)
+        self.dither = lib.caca_create_dither(
+            24, frame_width, frame_height, frame_width * 3, rmask, gmask, bmask, 0
+        )
+        lib.caca_set_dither_algorithm(self.dither, options.dither.encode())
+        lib.caca_set_dither_brightness(self.dither, options.brightness)
+        lib.caca_set_dither_contrast(self.dither, options.contrast)
+        lib.caca_set_dither_invert(self.dither, int(options.invert))
+        
+        self.format = options.format.encode()
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c"))
+        self.libc.free.argtypes = [ctypes.c_void_p]
+    
+    def render(self, pixels: bytes) -> bytes:
+        """Render one raw RGB24 frame and return the exported ASCII document"""
+        self.lib.caca_clear_canvas(self.canvas)
+        self.lib.caca_dither_bitmap(
+            self.canvas, 0, 0, self.options.width, self.options.height, self.dither, pixels
+        )
+        size = ctypes.c_size_t()
+        buf = self.lib.caca_export_canvas_to_memory(self.canvas, self.format, ctypes.byref(size))
+        try:
+            return ctypes.string_at(buf, size.value)
+        finally:
+            self.libc.free(buf)
+    
+    def close(self):
+        """Release the libcaca canvas and dither"""
+        self.lib.caca_free_dither(self.dither)
+        self.lib.caca_free_canvas(self.canvas)
+
+def _bayer_matrix(size: int) -> "np.ndarray":
+    """Ordered-dither thresholds in [-0.5, 0.5) for a size x size Bayer matrix"""
+    matrix = np.zeros((1, 1))
+    while matrix.shape[0] < size:
+        matrix = np.block([[4 * matrix, 4 * matrix + 2], [4 * matrix + 3, 4 * matrix + 1]])
+    return (matrix + 0.5) / matrix.size - 0.5
+
+class NumpyAsciiRenderer:
+    """Dithers raw RGB24 frames to ASCII with numpy when libcaca is unavailable
+    
+    A drop-in for CacaRenderer: frames are averaged down to one value per
+    cell, dithered onto ASCII_RAMP and coloured with the nearest of the 16
+    ANSI colours, then exported as an ANSI, HTML or SVG document.
+    """
+    
+    def __init__(self, options: VisualizationOptions, frame_width: int, frame_height: int):
+        self.options = options
+        self.frame_width = frame_width
+        self.frame_height = frame_height
+        self.cols = options.width
+        self.rows = options.height
+        self.block_w = max(1, frame_width // self.cols)
+        self.block_h = max(1, frame_height // self.rows)
+        
+        self.ramp = np.frombuffer(ASCII_RAMP.encode(), np.uint8)
+        self.top = len(ASCII_RAMP) - 1
+        self.luma = np.array(LUMA_WEIGHTS, np.float32)
+        self.palette = np.array(ANSI_PALETTE, np.float32)
+        self.rng = np.random.default_rng(0)
+        
+        if options.dither.startswith("ordered"):
+            size = int(options.dither[len("ordered"):])
+            reps = (self.rows // size + 1, self.cols // size + 1)
+            self.thresholds = np.tile(_bayer_matrix(size), reps)[:self.rows, :self.cols]
+        
+        self._build_markup(options)
+    
+    def _build_markup(self, options: VisualizationOptions):
+        """Precompute the per-format document pieces and the 16 colour spans"""
+        hex_colors = ["#%02x%02x%02x" % rgb for rgb in ANSI_PALETTE]
+        background = options.background_color
+        
+        if options.format == "ansi":
+            self.header, self.footer = "", ""
+            self.row_start, self.row_end = "", "\x1b[0m\r\n"
+            self.spans = [
+                f"\x1b[0;{30 + c % 8}{';1' if c >= 8 else ''}m" for c in range(16)
+            ]
+            self.span_end = ""
+        elif options.format == "html":
+            self.header = (
+                f'<!DOCTYPE html><html><body style="margin:0;background:{background}">'
+                '<pre style="font-family:monospace;font-size:16px;line-height:20px;margin:0">'
+            )
+            self.footer = "</pre></body></html>\n"
+            self.row_start, self.row_end = "", "\n"
+            self.spans = [f'<span style="color:{color}">' for color in hex_colors]
+            self.span_end = "</span>"
+        else:
+            # Matches the 10x20 px cell size rsvg-convert is asked to render
+            self.header = (
+                f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.cols * 10}" '
+                f'height="{self.rows * 20}"><rect width="100%" height="100%" fill="{background}"/>'
+                '<text font-family="monospace" font-size="16" xml:space="preserve">'
+            )
+            self.footer = "</text></svg>\n"
+            # Rows are placed by their baseline, filled in per row
+            self.row_start, self.row_end = '<tspan x="0" y="{}">', "</tspan>"
+            self.spans = [f'<tspan fill="{color}">' for color in hex_colors]
+            self.span_end = "</tspan>"
+    
+    def render(self, pixels: bytes) -> bytes:
+        """Render one raw RGB24 frame and return the exported ASCII document"""
+        options = self.options
+        rows, cols, bh, bw = self.rows, self.cols, self.block_h, self.block_w
+        
+        image = np.frombuffer(pixels, np.uint8, count=self.frame_width * self.frame_height * 3)
+        image = image.reshape(self.frame_height, self.frame_width, 3)[:rows * bh, :cols * bw]
+        cells = image.reshape(rows, bh, cols, bw, 3).mean(axis=(1, 3), dtype=np.float32)
+        if options.invert:
+            cells = 255.0 - cells
+        
+        gray = (cells @ self.luma) / 255.0
+        gray = np.clip((gray * options.brightness - 0.5) * options.contrast + 0.5, 0.0, 1.0)
+        chars = self.ramp[self._dither(gray * self.top)]
+        
+        if options.color:
+            # Scale each cell to full brightness so the colour carries only
+            # the hue; the character already carries the intensity
+            peak = np.maximum(cells.max(axis=2, keepdims=True), 1.0)
+            hue = cells * (255.0 / peak)
+            colors = ((hue[:, :, None, :] - self.palette) ** 2).sum(axis=3).argmin(axis=2)
+        else:
+            colors = np.full((rows, cols), 7)
+        
+        return self._export(chars, colors).encode()
+    
+    def _dither(self, levels: "np.ndarray") -> "np.ndarray":
+        """Map fractional ramp positions to ramp indices"""
+        method = self.options.dither
+        if method == "fstein":
+            return self._floyd_steinberg(levels)
+        if method == "random":
+            levels = levels + self.rng.random(levels.shape) - 0.5
+        elif method.startswith("ordered"):
+            levels = levels + self.thresholds
+        return np.clip(np.rint(levels), 0, self.top).astype(np.intp)
+    
+    def _floyd_steinberg(self, levels: "np.ndarray") -> "np.ndarray":
+        """Serpentine Floyd-Steinberg error diffusion over the cell grid"""
+        rows, cols, top = self.rows, self.cols, self.top
+        work = levels.tolist()
+        out = np.empty((rows, cols), np.intp)
+        
+        for y in range(rows):
+            row = work[y]
+            below = work[y + 1] if y + 1 < rows else None
+            step = -1 if y % 2 else 1
+            result = [0] * cols
             
-            if count != prev_count:
-                progress = min(count / total_frames, 1.0)
-                bar_length = 40
-                filled = int(bar_length * progress)
-                bar = "█" * filled + "░" * (bar_length - filled)
-                percent = int(progress * 100)
-                sys.stdout.write(f"\r|{bar}| {percent}% ({count}/{total_frames} frames)")
-                sys.stdout.flush()
-                prev_count = count
+            for x in (range(cols - 1, -1, -1) if step < 0 else range(cols)):
+                old = row[x]
+                new = min(top, max(0, int(old + 0.5)))
+                result[x] = new
+                error = old - new
+                ahead, behind = x + step, x - step
+                if 0 <= ahead < cols:
+                    row[ahead] += error * 0.4375
+                if below is not None:
+                    if 0 <= behind < cols:
+                        below[behind] += error * 0.1875
+                    below[x] += error * 0.3125
+                    if 0 <= ahead < cols:
+                        below[ahead] += error * 0.0625
             
-            if count >= total_frames:
-                break
-                
-            time.sleep(0.5)
+            out[y] = result
+        
+        return out
+    
+    def _export(self, chars: "np.ndarray", colors: "np.ndarray") -> str:
+        """Build the document, opening a new colour span only where the colour changes"""
+        spans, span_end = self.spans, self.span_end
+        parts = [self.header]
+        
+        for y in range(self.rows):
+            text = chars[y].tobytes().decode("ascii")
+            row_colors = colors[y]
+            starts = [0, *(np.flatnonzero(np.diff(row_colors)) + 1).tolist()]
+            ends = starts[1:] + [self.cols]
+            
+            parts.append(self.row_start.format(y * 20 + 16))
+            for start, end in zip(starts, ends):
+                parts.append(spans[row_colors[start]])
+                parts.append(text[start:end])
+                parts.append(span_end)
+            parts.append(self.row_end)
+        
+        parts.append(self.footer)
+        return "".join(parts)
+
+def frame_signature(pixels: bytes, frame_width: int, frame_height: int,
+                    cols: int, rows: int) -> bytes:
+    """Hash a raw RGB24 frame sampled once per ASCII cell and quantized to 4 bits
+    
+    Frames that only differ below the cell grid or in the low colour bits
+    share a signature, so they can reuse the same rendered ASCII.
+    """
+    step_x = max(1, frame_width // cols)
+    step_y = max(1, frame_height // rows)
+    
+    if NUMPY_AVAILABLE:
+        image = np.frombuffer(pixels, np.uint8, count=frame_width * frame_height * 3)
+        small = image.reshape(frame_height, frame_width, 3)[::step_y, ::step_x] & 0xF0
+        data = small.tobytes()
+    else:
+        stride = frame_width * 3
+        data = b"".join(
+            pixels[y * stride + x * 3:y * stride + x * 3 + 3]
+            for y in range(0, frame_height, step_y)
+            for x in range(0, frame_width, step_x)
+        ).translate(_QUANTIZE)
+    
+    return hashlib.blake2b(data, digest_size=8).digest()
+
+class AsciiCache:
+    """Bounded LRU of rendered ASCII documents keyed by frame signature"""
+    
+    def __init__(self, capacity: int = ASCII_CACHE_SIZE):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+    
+    def get(self, key: bytes) -> Optional[bytes]:
+        """Return the cached document for key, marking it most recently used"""
+        with self.lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+            return value
+    
+    def put(self, key: bytes, value: bytes):
+        """Store a rendered document, evicting the least recently used one"""
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
+
+def scratch_dir(options: VisualizationOptions) -> Optional[str]:
+    """Directory for short-lived scratch files, in RAM when /dev/shm exists"""
+    return "/dev/shm" if os.path.isdir("/dev/shm") else options.temp_dir
+
+class FrameRing:
+    """Fixed ring of raw frame slots in a memory-mapped file shared with pool workers
+    
+    The parent copies each frame into a slot once; workers read it in place
+    instead of receiving megabytes of pickled pixels through a pipe.
+    """
+    
+    def __init__(self, path: str, frame_size: int, slots: int, create: bool = False):
+        self.path = path
+        self.frame_size = frame_size
+        self.slots = slots
+        
+        fd = os.open(path, os.O_RDWR | (os.O_CREAT if create else 0), 0o600)
+        try:
+            if create:
+                os.ftruncate(fd, frame_size * slots)
+            self.mm = mmap.mmap(fd, frame_size * slots)
+        finally:
+            os.close(fd)
+    
+    def put(self, slot: int, pixels: bytes):
+        """Copy one frame into a slot"""
+        offset = slot * self.frame_size
+        self.mm[offset:offset + self.frame_size] = pixels
+    
+    def frame(self, slot: int):
+        """Zero-copy view of a slot that libcaca can read directly"""
+        return (ctypes.c_char * self.frame_size).from_buffer(self.mm, slot * self.frame_size)
+    
+    def close(self):
+        """Unmap the ring"""
+        self.mm.close()
+
+# Per-process ASCII renderer, ASCII cache and frame ring owned by each pool worker
+_worker_renderer = None
+_worker_cache = None
+_worker_ring = None
+
+def _init_worker(options: VisualizationOptions, frame_width: int, frame_height: int,
+                 ring_path: str, ring_slots: int, backend: str):
+    """Create the ASCII renderer, a fresh ASCII cache and the ring mapping once per worker"""
+    global _worker_renderer, _worker_cache, _worker_ring
+    if backend == "libcaca":
+        _worker_renderer = CacaRenderer(load_libcaca(), options, frame_width, frame_height)
+    else:
+        _worker_renderer = NumpyAsciiRenderer(options, frame_width, frame_height)
+    _worker_cache = AsciiCache()
+    _worker_ring = FrameRing(ring_path, frame_width * frame_height * 3, ring_slots)
+
+def _convert_one(slot: int, output_path: str):
+    """Convert the frame in one ring slot to ASCII inside a pool worker"""
+    renderer = _worker_renderer
+    pixels = _worker_ring.frame(slot)
+    key = frame_signature(
+        pixels, renderer.frame_width, renderer.frame_height,
+        renderer.options.width, renderer.options.height
+    )
+    document = _worker_cache.get(key)
+    if document is None:
+        document = renderer.render(pixels)
+        _worker_cache.put(key, document)
+    
+    with open(output_path, "wb") as f:
+        f.write(document)
 
 class AsciiRenderer:
-    """Converts raw frames to ASCII art using libcaca"""
+    """Converts raw frames to ASCII art using libcaca
+    
+    The libcaca and numpy backends run in a pool of long-lived worker
+    processes that set up their renderer once and then convert frame
+    after frame, so no process is spawned per frame. img2txt, the last
+    resort, can only be run once per image.
+    """
     
     def __init__(self, options: VisualizationOptions):
         self.options = options
+        self.libcaca = load_libcaca()
+        
+        # Prefer libcaca in-process, then the numpy renderer, then img2txt
+        if self.libcaca is not None:
+            self.backend = "libcaca"
+        elif NUMPY_AVAILABLE:
+            self.backend = "numpy"
+        else:
+            self.backend = "img2txt"
+        
+        # The img2txt arguments never change between frames, so build them
+        # once; an absolute path lets subprocess use posix_spawn for each frame
+        self._img2txt_prefix = (
+            shutil.which("img2txt") or "img2txt", "-W", str(options.width), "-H", str(options.height),
+            "-f", options.format, "-d", options.dither,
+            "-b", str(options.brightness), "-c", str(options.contrast)
+        ) + (("--invert",) if options.invert else ())
     
-    def convert_frames(self, frames_dir: str, ascii_dir: str):
-        """Convert raw frames to ASCII art"""
-        os.makedirs(ascii_dir, exist_ok=True)
+    def convert_frames(self, frames: Iterator[bytes], ascii_dir: str,
+                       frame_width: int, frame_height: int, total_frames: int) -> int:
+        """Convert a stream of raw RGB24 frames to ASCII art files
         
-        frames = sorted([f for f in os.listdir(frames_dir) if f.endswith(".raw")])
-        total_frames = len(frames)
+        Returns the number of frames written, named frame00001, frame00002, ...
+        """
+        os.makedirs(ascii_dir, exist_ok=True)
         
         print(f"🎨 Converting {total_frames} frames to ASCII art...")
         
-        frame_width = 640
-        frame_height = 480
-        
-        for i, frame in enumerate(frames):
-            progress = (i + 1) / total_frames
-            bar_length = 40
-            filled = int(bar_length * progress)
-            bar = "█" * filled + "░" * (bar_length - filled)
-            percent = int(progress * 100)
-            sys.stdout.write(f"\r|{bar}| {percent}% ({i+1}/{total_frames} frames)")
-            sys.stdout.flush()
-            
-            # Use img2txt to convert raw frame to ASCII
-            input_path = os.path.join(frames_dir, frame)
-            output_path = os.path.join(ascii_dir, frame.replace(".raw", f".{self.options.format}"))
-            
-            # Convert raw to PNG first
-            temp_png = input_path.replace(".raw", ".png")
-            raw_to_png_cmd = [
-                "ffmpeg", "-y", "-f", "rawvideo", "-pixel_format", "rgb24",
-                "-video_size", f"{frame_width}x{frame_height}",
-                "-i", input_path, "-frames:v", "1", temp_png
-            ]
-            subprocess.run(raw_to_png_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            
-            # Now convert to ASCII with img2txt
-            cmd = [
-                "img2txt", "-W", str(self.options.width), "-H", str(self.options.height),
-                "-f", self.options.format, "-d", self.options.dither,
-                "-b", str(self.options.brightness), "-c", str(self.options.contrast)
-            ]
-            
-            if self.options.invert:
-                cmd.append("--invert")
-            
-            cmd.append(temp_png)
-            
-            with open(output_path, "w") as f:
-                subprocess.run(cmd, stdout=f, stderr=subprocess.DEVNULL)
-            
-            # Clean up temporary PNG
-            os.remove(temp_png)
+        output_fmt = os.path.join(ascii_dir, f"frame%05d.{self.options.format}")
+        if self.backend != "img2txt":
+            count = self._convert_in_pool(
+                frames, output_fmt, frame_width, frame_height, total_frames
+            )
+        else:
+            count = self._convert_with_img2txt(
+                frames, output_fmt, frame_width, frame_height, total_frames
+            )
         
         print("\n✅ ASCII conversion complete!")
-        return ascii_dir
+        return count
+    
+    def _convert_in_pool(self, frames: Iterator[bytes], output_fmt: str,
+                         frame_width: int, frame_height: int, total_frames: int) -> int:
+        """Dither raw frames in-process across a pool of worker processes"""
+        workers = self.options.workers
+        window = workers * 4
+        
+        # ordered_map keeps at most `window` frames in flight, so a ring of
+        # that many slots is never overwritten while a worker still reads it
+        fd, ring_path = tempfile.mkstemp(suffix=".raw", dir=scratch_dir(self.options))
+        os.close(fd)
+        ring = FrameRing(ring_path, frame_width * frame_height * 3, window, create=True)
+        
+        def tasks():
+            for i, pixels in enumerate(frames):
+                slot = i % window
+                ring.put(slot, pixels)
+                yield slot, output_fmt % (i + 1)
+        
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.options, frame_width, frame_height, ring_path, window,
+                          self.backend)
+            ) as executor:
+                progress = ProgressBar(total_frames, "ASCII")
+                for _ in ordered_map(executor, _convert_one, tasks(), window):
+                    progress.advance()
+                progress.close()
+        finally:
+            ring.close()
+            os.remove(ring_path)
+        return progress.count
+    
+    def _convert_with_img2txt(self, frames: Iterator[bytes], output_fmt: str,
+                              frame_width: int, frame_height: int, total_frames: int) -> int:
+        """Encode all raw frames to PNG with one ffmpeg process, then run img2txt on each"""
+        raw_to_png_cmd = [
+            "ffmpeg", "-v", "error", "-f", "rawvideo", "-pixel_format", "rgb24",
+            "-video_size", f"{frame_width}x{frame_height}",
+            "-i", "pipe:0", "-f", "image2pipe", "-vcodec", "png", "pipe:1"
+        ]
+        encoder = subprocess.Popen(
+            raw_to_png_cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        
+        # Feed the raw frames from a separate thread so the encoder never
+        # blocks on a full stdout pipe while we are still writing its input;
+        # the feeder also hands each frame back for the ASCII cache lookup
+        pending = queue.Queue()
+        feeder = threading.Thread(
+            target=self._feed_raw_frames,
+            args=(encoder.stdin, frames, pending)
+        )
+        feeder.daemon = True
+        feeder.start()
+        
+        # img2txt runs in its own process, so threads are enough to keep
+        # every core busy while the main thread splits the PNG stream
+        workers = self.options.workers
+        progress = ProgressBar(total_frames, "ASCII")
+        cache = AsciiCache()
+        devnull = open(os.devnull, "wb")
+        # img2txt only reads named files, so each worker thread reuses one
+        # scratch PNG, kept in RAM when /dev/shm is available
+        scratch = tempfile.TemporaryDirectory(dir=scratch_dir(self.options))
+        local = threading.local()
+        # Bounds how many encoded PNGs wait in memory for a free worker
+        slots = threading.BoundedSemaphore(workers * 4)
+        
+        def finished(future):
+            slots.release()
+            progress.advance()
+        
+        index = 0
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                while True:
+                    png = read_png(encoder.stdout)
+                    if png is None:
+                        break
+                    pixels = pending.get()
+                    
+                    index += 1
+                    output_path = output_fmt % index
+                    
+                    # Near-duplicate frames (silence, sustained tones) reuse
+                    # an earlier img2txt result instead of spawning it again
+                    key = frame_signature(
+                        pixels, frame_width, frame_height,
+                        self.options.width, self.options.height
+                    )
+                    document = cache.get(key)
+                    if document is not None:
+                        with open(output_path, "wb") as f:
+                            f.write(document)
+                        progress.advance()
+                        continue
+                    
+                    slots.acquire()
+                    future = executor.submit(
+                        self._run_img2txt, png, output_path, cache, key,
+                        devnull, scratch.name, local
+                    )
+                    future.add_done_callback(finished)
+        finally:
+            devnull.close()
+            encoder.stdout.close()
+            feeder.join()
+            encoder.wait()
+            scratch.cleanup()
+            progress.close()
+        return index
+    
+    def _run_img2txt(self, png: bytes, output_path: str, cache: AsciiCache, key: bytes,
+                     devnull, scratch_dir: str, local: threading.local):
+        """Convert one PNG to ASCII with img2txt and cache the result"""
+        temp_png = getattr(local, "path", None)
+        if temp_png is None:
+            temp_png = local.path = os.path.join(
+                scratch_dir, f"worker{threading.get_ident()}.png"
+            )
+        with open(temp_png, "wb") as f:
+            f.write(png)
+        
+        # With an absolute program path, close_fds=False lets CPython launch
+        # img2txt with posix_spawn instead of fork+exec
+        result = subprocess.run(
+            self._img2txt_prefix + (temp_png,),
+            stdout=subprocess.PIPE, stderr=devnull, close_fds=False
+        )
+        with open(output_path, "wb") as f:
+            f.write(result.stdout)
+        cache.put(key, result.stdout)
+    
+    @staticmethod
+    def _feed_raw_frames(pipe, frames: Iterator[bytes], pending: queue.Queue):
+        """Write raw frames into the PNG encoder's stdin, remembering each one"""
+        try:
+            for pixels in frames:
+                pending.put(pixels)
+                pipe.write(pixels)
+        except BrokenPipeError:
+            pass
+        finally:
+            try:
+                pipe.close()
+            except BrokenPipeError:
+                pass
+
+class VideoSink:
+    """A single ffmpeg encoder fed frame by frame through its stdin
+    
+    Frames are handed to a writer thread through a small bounded queue, so
+    rendering the next frame overlaps with ffmpeg consuming the previous one.
+    """
+    
+    def __init__(self, input_args: List[str], output_file: str):
+        cmd = [
+            "ffmpeg", "-y", *input_args, "-i", "pipe:0",
+            "-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", "18",
+            output_file
+        ]
+        self.cmd = cmd
+        self.process = subprocess.Popen(
+            cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL, bufsize=0
+        )
+        self.queue = queue.Queue(maxsize=SINK_QUEUE_SIZE)
+        self.writer = threading.Thread(target=self._write_frames)
+        self.writer.daemon = True
+        self.writer.start()
+    
+    def write(self, frame: bytes):
+        """Queue one encoded image or raw frame for the encoder"""
+        self.queue.put(frame)
+    
+    def close(self):
+        """Flush the queue, close ffmpeg's stdin and wait for the encode to finish"""
+        self.queue.put(None)
+        self.writer.join()
+        return self.process.wait()
+    
+    def _write_frames(self):
+        """Drain the queue into ffmpeg's stdin"""
+        stdin = self.process.stdin
+        broken = False
+        while True:
+            frame = self.queue.get()
+            if frame is None:
+                break
+            if broken:
+                continue
+            try:
+                stdin.write(frame)
+            except BrokenPipeError:
+                # Keep draining so producers never block on a dead encoder
+                broken = True
+        try:
+            stdin.close()
+        except BrokenPipeError:
+            pass
+
+class AnsiImageRenderer:
+    """Renders libcaca ANSI documents to RGB24 bitmaps with Pillow
+    
+    One image and draw context are allocated up front and redrawn for
+    every frame.
+    """
+    
+    def __init__(self, options: VisualizationOptions):
+        self.cols = options.width
+        self.rows = options.height
+        
+        try:
+            self.font = ImageFont.truetype("DejaVuSansMono.ttf", options.font_size)
+        except OSError:
+            self.font = ImageFont.load_default()
+        left, top, right, bottom = self.font.getbbox("M")
+        self.cell_width = max(1, right - left)
+        self.cell_height = max(1, bottom - top + options.font_size // 4)
+        
+        # yuv420p needs even dimensions
+        width = self.cols * self.cell_width
+        height = self.rows * self.cell_height
+        self.size = (width + width % 2, height + height % 2)
+        
+        self.background = ImageColor.getrgb(options.background_color)
+        self.image = Image.new("RGB", self.size, self.background)
+        self.draw = ImageDraw.Draw(self.image)
+    
+    def render(self, document: bytes) -> bytes:
+        """Draw one ANSI document and return the raw RGB24 bytes"""
+        draw = self.draw
+        draw.rectangle((0, 0, self.size[0], self.size[1]), fill=self.background)
+        
+        fg, bg, bold, blink = 7, None, False, False
+        x = y = 0
+        parts = SGR_RE.split(document.decode("cp437"))
+        
+        for index, part in enumerate(parts):
+            if index % 2:
+                # Odd entries are SGR parameter lists
+                for code in (part.split(";") if part else ["0"]):
+                    code = int(code or 0)
+                    if code == 0:
+                        fg, bg, bold, blink = 7, None, False, False
+                    elif code == 1:
+                        bold = True
+                    elif code == 5:
+                        blink = True
+                    elif 30 <= code <= 37:
+                        fg = code - 30
+                    elif 40 <= code <= 47:
+                        bg = code - 40
+                    elif 90 <= code <= 97:
+                        fg = code - 90 + 8
+                    elif 100 <= code <= 107:
+                        bg = code - 100 + 8
+                continue
+            
+            # Even entries are text runs drawn with the current attributes
+            for line_index, run in enumerate(part.split("\n")):
+                if line_index:
+                    x, y = 0, y + 1
+                run = run.replace("\r", "")
+                if not run or y >= self.rows:
+                    continue
+                
+                left = x * self.cell_width
+                top = y * self.cell_height
+                if bg is not None:
+                    background = ANSI_PALETTE[bg + 8 if blink and bg < 8 else bg]
+                    draw.rectangle(
+                        (left, top, left + len(run) * self.cell_width - 1,
+                         top + self.cell_height - 1),
+                        fill=background
+                    )
+                foreground = ANSI_PALETTE[fg + 8 if bold and fg < 8 else fg]
+                draw.text((left, top), run, fill=foreground, font=self.font)
+                x += len(run)
+        
+        return self.image.tobytes()
+
+def ordered_map(executor, fn, items: List, window: int):
+    """Like executor.map, but keeps at most `window` results in flight"""
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(fn, *item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
 
 class VideoGenerator:
     """Compiles ASCII frames into a video"""
@@ -208,166 +1086,154 @@ class VideoGenerator:
     def __init__(self, options: VisualizationOptions):
         self.options = options
     
-    def create_video(self, ascii_dir: str, output_file: str):
+    def create_video(self, ascii_dir: str, output_file: str, frame_count: int):
         """Create video from ASCII frames"""
         print("🎬 Generating final video...")
         
-        frames = sorted([f for f in os.listdir(ascii_dir) 
-                        if f.endswith(f".{self.options.format}")])
+        # convert_frames names its output frame00001..frameNNNNN, so paths
+        # are derived from the index rather than listed and sorted
+        frame_fmt = os.path.join(ascii_dir, f"frame%05d.{self.options.format}")
         
         if self.options.format == "ansi":
-            self._compile_ansi_to_video(ascii_dir, frames, output_file)
+            self._compile_ansi_to_video(frame_fmt, frame_count, output_file)
         elif self.options.format == "html":
-            self._compile_html_to_video(ascii_dir, frames, output_file)
+            self._compile_html_to_video(frame_fmt, frame_count, output_file)
         elif self.options.format == "svg":
-            self._compile_svg_to_video(ascii_dir, frames, output_file)
+            self._compile_svg_to_video(frame_fmt, frame_count, output_file)
         else:
             print(f"❌ Unsupported output format: {self.options.format}")
             return
         
         print(f"✅ Video created successfully: {output_file}")
     
-    def _compile_ansi_to_video(self, ascii_dir: str, frames: List[str], output_file: str):
+    def _png_sink(self, output_file: str) -> VideoSink:
+        """Encoder reading a stream of PNG images"""
+        return VideoSink(
+            ["-f", "image2pipe", "-framerate", str(self.options.fps)], output_file
+        )
+    
+    def _stream_frames(self, frame_count: int, render_one, workers: int, sink: VideoSink):
+        """Render every ASCII frame in parallel and stream them, in order, into the sink
+        
+        render_one is called with the 1-based frame index. Raises
+        CalledProcessError if the encoder exits with an error.
+        """
+        tasks = ((i,) for i in range(1, frame_count + 1))
+        
+        progress = ProgressBar(frame_count, "Video")
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for image in ordered_map(executor, render_one, tasks, workers * 2):
+                    if image:
+                        sink.write(image)
+                    progress.advance()
+            progress.close()
+            print("\n🔄 Finishing video encode...")
+        finally:
+            # Always release the encoder, even when a frame failed to render,
+            # so ffmpeg never sits blocked on its stdin
+            returncode = sink.close()
+        
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, sink.cmd)
+    
+    def _compile_ansi_to_video(self, frame_fmt: str, frame_count: int, output_file: str):
         """Compile ANSI frames to video"""
-        # First convert ANSI frames to PNGs using a terminal emulator
-        png_dir = os.path.join(os.path.dirname(ascii_dir), "png_frames")
+        if PIL_AVAILABLE:
+            self._compile_ansi_in_process(frame_fmt, frame_count, output_file)
+            return
+        
+        # Without Pillow, convert ANSI frames to PNGs using a terminal emulator
+        if shutil.which("terminal-to-image") is None:
+            print("\n❌ Pillow or terminal-to-image is required to convert ANSI frames. "
+                  "Install Pillow with: pip install pillow")
+            return
+        
+        png_dir = os.path.join(os.path.dirname(os.path.dirname(frame_fmt)), "png_frames")
         os.makedirs(png_dir, exist_ok=True)
+        png_fmt = os.path.join(png_dir, "frame%05d.png")
         
         terminal_width = self.options.width + 5  # Add some margin
         terminal_height = self.options.height + 5
         
-        for i, frame in enumerate(frames):
-            progress = (i + 1) / len(frames)
-            bar_length = 40
-            filled = int(bar_length * progress)
-            bar = "█" * filled + "░" * (bar_length - filled)
-            percent = int(progress * 100)
-            sys.stdout.write(f"\r|{bar}| {percent}% ({i+1}/{len(frames)} frames)")
-            sys.stdout.flush()
-            
-            frame_path = os.path.join(ascii_dir, frame)
-            png_path = os.path.join(png_dir, frame.replace(f".{self.options.format}", ".png"))
-            
-            # Use xterm or similar to render ANSI to image
+        def render_terminal(index: int) -> bytes:
+            png_path = png_fmt % index
             term_cmd = [
                 "terminal-to-image", 
                 "--cols", str(terminal_width),
                 "--rows", str(terminal_height),
                 "--font-size", str(self.options.font_size),
                 "--background", self.options.background_color,
-                frame_path, png_path
+                frame_fmt % index, png_path
             ]
-            
-            try:
-                subprocess.run(term_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            except FileNotFoundError:
-                # Fall back to xterm if terminal-to-image is not available
-                xterm_cmd = [
-                    "xterm", "-geometry", f"{terminal_width}x{terminal_height}",
-                    "-e", f"cat {frame_path}; sleep 0.5"
-                ]
-                subprocess.run(xterm_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                
-                # Take a screenshot of xterm (not ideal but works as fallback)
-                shot_cmd = [
-                    "import", "-window", "xterm", png_path
-                ]
-                subprocess.run(shot_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        
-        print("\n🔄 Converting frames to video...")
-        
-        # Now create video from PNGs
-        video_cmd = [
-            "ffmpeg", "-y", "-framerate", str(self.options.fps),
-            "-pattern_type", "glob", "-i", f"{png_dir}/*.png",
-            "-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", "18",
+            subprocess.run(term_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if not os.path.exists(png_path):
+                return b""
+            with open(png_path, "rb") as f:
+                data = f.read()
+            os.remove(png_path)
+            return data
+        
+        sink = self._png_sink(output_file)
+        self._stream_frames(frame_count, render_terminal, self.options.workers, sink)
+    
+    def _compile_ansi_in_process(self, frame_fmt: str, frame_count: int, output_file: str):
+        """Draw ANSI frames with Pillow and pipe raw RGB straight into ffmpeg"""
+        renderer = AnsiImageRenderer(self.options)
+        width, height = renderer.size
+        sink = VideoSink(
+            ["-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}",
+             "-r", str(self.options.fps)],
             output_file
-        ]
-        subprocess.run(video_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        )
+        
+        # The renderer reuses a single image buffer, so frames are drawn one at a time
+        def render_ansi(index: int) -> bytes:
+            with open(frame_fmt % index, "rb") as f:
+                return renderer.render(f.read())
+        
+        self._stream_frames(frame_count, render_ansi, 1, sink)
     
-    def _compile_html_to_video(self, ascii_dir: str, frames: List[str], output_file: str):
+    def _compile_html_to_video(self, frame_fmt: str, frame_count: int, output_file: str):
         """Compile HTML frames to video using a headless browser"""
-        # Convert HTML to PNGs using a headless browser
-        png_dir = os.path.join(os.path.dirname(ascii_dir), "png_frames")
-        os.makedirs(png_dir, exist_ok=True)
+        if shutil.which("wkhtmltoimage") is None:
+            print("\n❌ wkhtmltoimage not found. Please install it to convert HTML frames.")
+            return
         
-        for i, frame in enumerate(frames):
-            progress = (i + 1) / len(frames)
-            bar_length = 40
-            filled = int(bar_length * progress)
-            bar = "█" * filled + "░" * (bar_length - filled)
-            percent = int(progress * 100)
-            sys.stdout.write(f"\r|{bar}| {percent}% ({i+1}/{len(frames)} frames)")
-            sys.stdout.flush()
-            
-            frame_path = os.path.join(ascii_dir, frame)
-            png_path = os.path.join(png_dir, frame.replace(f".{self.options.format}", ".png"))
-            
-            # Use wkhtmltopng or similar to render HTML to image
+        def render_html(index: int) -> bytes:
+            # Render HTML to a PNG on stdout
             html_cmd = [
-                "wkhtmltoimage", "--width", str(self.options.width * 10),
+                "wkhtmltoimage", "--quiet", "--format", "png",
+                "--width", str(self.options.width * 10),
                 "--height", str(self.options.height * 20),
-                frame_path, png_path
+                frame_fmt % index, "-"
             ]
-            
-            try:
-                subprocess.run(html_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            except FileNotFoundError:
-                print("\n❌ wkhtmltoimage not found. Please install it to convert HTML frames.")
-                return
-        
-        print("\n🔄 Converting frames to video...")
+            return subprocess.run(
+                html_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            ).stdout
         
-        # Now create video from PNGs
-        video_cmd = [
-            "ffmpeg", "-y", "-framerate", str(self.options.fps),
-            "-pattern_type", "glob", "-i", f"{png_dir}/*.png",
-            "-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", "18",
-            output_file
-        ]
-        subprocess.run(video_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        sink = self._png_sink(output_file)
+        self._stream_frames(frame_count, render_html, self.options.workers, sink)
     
-    def _compile_svg_to_video(self, ascii_dir: str, frames: List[str], output_file: str):
+    def _compile_svg_to_video(self, frame_fmt: str, frame_count: int, output_file: str):
         """Compile SVG frames to video"""
-        # Convert SVGs to PNGs using rsvg-convert or similar
-        png_dir = os.path.join(os.path.dirname(ascii_dir), "png_frames")
-        os.makedirs(png_dir, exist_ok=True)
+        if shutil.which("rsvg-convert") is None:
+            print("\n❌ rsvg-convert not found. Please install it to convert SVG frames.")
+            return
         
-        for i, frame in enumerate(frames):
-            progress = (i + 1) / len(frames)
-            bar_length = 40
-            filled = int(bar_length * progress)
-            bar = "█" * filled + "░" * (bar_length - filled)
-            percent = int(progress * 100)
-            sys.stdout.write(f"\r|{bar}| {percent}% ({i+1}/{len(frames)} frames)")
-            sys.stdout.flush()
-            
-            frame_path = os.path.join(ascii_dir, frame)
-            png_path = os.path.join(png_dir, frame.replace(f".{self.options.format}", ".png"))
-            
-            # Use rsvg-convert to render SVG to image
+        def render_svg(index: int) -> bytes:
+            # rsvg-convert writes the PNG to stdout when no -o is given
             svg_cmd = [
                 "rsvg-convert", "-w", str(self.options.width * 10),
                 "-h", str(self.options.height * 20),
-                "-o", png_path, frame_path
+                frame_fmt % index
             ]
-            
-            try:
-                subprocess.run(svg_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            except FileNotFoundError:
-                print("\n❌ rsvg-convert not found. Please install it to convert SVG frames.")
-                return
+            return subprocess.run(
+                svg_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            ).stdout
         
-        print("\n🔄 Converting frames to video...")
-        
-        # Now create video from PNGs
-        video_cmd = [
-            "ffmpeg", "-y", "-framerate", str(self.options.fps),
-            "-pattern_type", "glob", "-i", f"{png_dir}/*.png",
-            "-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", "18",
-            output_file
-        ]
-        subprocess.run(video_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        sink = self._png_sink(output_file)
+        self._stream_frames(frame_count, render_svg, self.options.workers, sink)
 
 def check_dependencies():
     """Check if required dependencies are installed"""
@@ -377,6 +1243,10 @@ def check_dependencies():
         "img2txt": "img2txt (part of libcaca) is required for ASCII conversion"
     }
     
+    # img2txt is only needed when neither libcaca nor numpy can convert in-process
+    if load_libcaca() is not None or NUMPY_AVAILABLE:
+        del dependencies["img2txt"]
+    
     missing = []
     
     for dep, message in dependencies.items():
@@ -418,6 +1288,12 @@ def main():
     parser.add_argument("-v", "--visualization", choices=["spectrum", "waveform", "spectrogram"],
                         default="spectrum", help="Visualization type")
     parser.add_argument("--keep-temp", action="store_true", help="Keep temporary files")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Parallel frame workers (default: number of CPUs)")
+    parser.add_argument("--start", type=float, default=0.0,
+                        help="Start rendering this many seconds into the audio")
+    parser.add_argument("--end", type=float, default=None,
+                        help="Stop rendering this many seconds into the audio")
     
     args = parser.parse_args()
     
@@ -436,7 +1312,10 @@ def main():
         output_file=args.output,
         visualization_type=args.visualization,
         font_size=args.font_size,
-        background_color=args.background
+        background_color=args.background,
+        jobs=args.jobs,
+        start=args.start,
+        end=args.end
     )
     
     # Create temporary directory
@@ -445,18 +1324,23 @@ def main():
         
         print(f"🎵 Processing audio file: {args.input_file}")
         
-        # Extract audio features and create visualization frames
+        # Analyse the audio and convert its visualization frames to ASCII art
         audio = AudioFeatures(args.input_file)
-        frames_dir = audio.extract_frames(temp_dir, options.fps)
+        frames = audio.stream_frames(options)
         
-        # Convert frames to ASCII art
         ascii_renderer = AsciiRenderer(options)
         ascii_dir = os.path.join(temp_dir, "ascii_frames")
-        ascii_renderer.convert_frames(frames_dir, ascii_dir)
+        frame_count = ascii_renderer.convert_frames(
+            frames, ascii_dir, audio.frame_width, audio.frame_height, audio.total_frames
+        )
         
         # Generate the final video
         video_generator = VideoGenerator(options)
-        video_generator.create_video(ascii_dir, options.output_file)
+        try:
+            video_generator.create_video(ascii_dir, options.output_file, frame_count)
+        except subprocess.CalledProcessError as e:
+            print(f"\n❌ FFmpeg encoder failed with exit code {e.returncode}")
+            sys.exit(1)
         
         if args.keep_temp:
             # Copy temporary files to a permanent location if requested
@@ -16,26 +16,38 @@ Cross-platform support
 """
 
 import argparse
+import array
+import atexit
 import base64
+import cmath
+import collections
 import datetime
 import fcntl
+import functools
+import importlib.util
+import itertools
 import json
 import logging
+import logging.handlers
+import math
 import os
 import platform
 import queue
 import re
 import shlex
+import shutil
+import signal
 import struct
 import subprocess
 import sys
 import tempfile
-import termios
 import threading
 import time
 import wave
-from enum import Enum, auto
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
 from pathlib import Path
+from types import MappingProxyType
 
 # Conditionally import numpy and pyaudio - these may not be available on all systems
 try:
@@ -45,12 +57,28 @@ except ImportError:
     NUMPY_AVAILABLE = False
     # Define a minimal replacement for commonly used numpy functions
     class NumpyShim:
-        """A minimal shim providing basic numpy functionality when numpy is not available."""
+        """A minimal shim providing basic numpy functionality when numpy is not available.
+
+        Arrays are stdlib ``array.array`` objects, so sample data is stored
+        unboxed and decoded by C code rather than element by element.
+        """
+
+        # dtypes are represented by their array module typecodes
+        int8 = 'b'
+        uint8 = 'B'
+        int16 = 'h'
+        int32 = 'i'
+        float32 = 'f'
+        float64 = 'd'
 
         @staticmethod
         def frombuffer(buffer, dtype=None):
-            """Simple replacement for numpy's frombuffer function."""
-            return buffer
+            """Interpret a little-endian buffer as a typed array."""
+            arr = array.array(dtype or 'd')
+            arr.frombytes(bytes(buffer))
+            if sys.byteorder == 'big' and arr.itemsize > 1:
+                arr.byteswap()
+            return arr
 
         @staticmethod
         def array(data, dtype=None):
@@ -68,13 +96,18 @@ except ImportError:
                     size *= dim
             else:
                 size = shape
-            return [0] * size
+            typecode = dtype or 'd'
+            return array.array(typecode, bytes(size * array.array(typecode).itemsize))
 
         @staticmethod
         def linspace(start, stop, num=50):
             """Create a linear space between start and stop with num points."""
+            if num == 1:
+                return array.array('d', [start])
             step = (stop - start) / (num - 1)
-            return [start + step * i for i in range(num)]
+            arr = array.array('d')
+            arr.extend(start + step * i for i in range(num))
+            return arr
 
         @staticmethod
         def arange(start, stop=None, step=1):
@@ -82,55 +115,117 @@ except ImportError:
             if stop is None:
                 stop = start
                 start = 0
-            return list(range(start, stop, step))
+            if all(isinstance(v, int) for v in (start, stop, step)):
+                return array.array('q', range(start, stop, step))
+            count = max(0, math.ceil((stop - start) / step))
+            arr = array.array('d')
+            arr.extend(start + step * i for i in range(count))
+            return arr
 
         @staticmethod
         def abs(x):
             """Absolute value, element-wise."""
-            if isinstance(x, (list, tuple)):
-                return [abs(i) for i in x]
+            if isinstance(x, (list, tuple, array.array)):
+                return array.array('d', map(abs, x))
             return abs(x)
 
         @staticmethod
         def mean(a, axis=None):
             """Calculate the mean of array elements."""
-            if not a:
-                return 0
-            if isinstance(a, (list, tuple)):
-                return sum(a) / len(a)
+            if isinstance(a, (list, tuple, array.array)):
+                if not len(a):
+                    return 0
+                return math.fsum(a) / len(a)
             return a
 
         @staticmethod
         def max(a, axis=None):
             """Return the maximum of an array or maximum along an axis."""
-            if isinstance(a, (list, tuple)):
-                if not a:
+            if isinstance(a, (list, tuple, array.array)):
+                if not len(a):
                     return 0
                 return max(a)
             return a
 
         class fft:
-            """Minimal FFT shim."""
+            """Pure-Python FFT used when numpy is unavailable."""
+            @staticmethod
+            def _fft(x):
+                """Iterative radix-2 FFT, with a direct DFT for other lengths."""
+                n = len(x)
+                if n & (n - 1):
+                    return [
+                        sum(x[t] * cmath.exp(-2j * math.pi * k * t / n) for t in range(n))
+                        for k in range(n)
+                    ]
+
+                # Bit-reversal permutation followed by in-place butterflies
+                out = list(x)
+                j = 0
+                for i in range(1, n):
+                    bit = n >> 1
+                    while j & bit:
+                        j ^= bit
+                        bit >>= 1
+                    j |= bit
+                    if i < j:
+                        out[i], out[j] = out[j], out[i]
+
+                size = 2
+                while size <= n:
+                    step = cmath.exp(-2j * math.pi / size)
+                    half = size // 2
+                    for start in range(0, n, size):
+                        w = 1
+                        for k in range(start, start + half):
+                            t = w * out[k + half]
+                            out[k + half] = out[k] - t
+                            out[k] += t
+                            w *= step
+                    size *= 2
+                return out
+
             @staticmethod
             def rfft(x):
-                """Return a dummy frequency spectrum."""
-                if isinstance(x, (list, tuple)):
-                    size = len(x) // 2 + 1
-                    return [0] * size
-                return [0]
+                """Return the non-negative frequency terms of a real signal."""
+                if not isinstance(x, (list, tuple, array.array)):
+                    x = [x]
+                if not len(x):
+                    return []
+                return NumpyShim.fft._fft([complex(v) for v in x])[:len(x) // 2 + 1]
 
     # Replace numpy with our shim
     np = NumpyShim()
 
+# orjson is optional; it parses and serializes presets several times faster
 try:
-    import pyaudio
-    PYAUDIO_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    PYAUDIO_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+# Importing pyaudio initializes PortAudio, which probes every ALSA/JACK host
+# API; only check that it is installed and import it on first real use
+PYAUDIO_AVAILABLE = importlib.util.find_spec("pyaudio") is not None
+
+@functools.lru_cache(maxsize=1)
+def _load_pyaudio():
+    """Import and return the pyaudio module."""
+    import pyaudio
+    return pyaudio
+
+def __getattr__(name):
+    # PEP 562: keep `module.pyaudio` working for callers without an eager import
+    if name == "pyaudio" and PYAUDIO_AVAILABLE:
+        return _load_pyaudio()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
+# Queried once; os.cpu_count() reads sysfs on every call
+_CPU_COUNT = os.cpu_count() or 2
+
 class Config:
     """Configuration management class."""
     def __init__(self):
@@ -144,9 +239,10 @@ class Config:
             'charset': 'unicode',
             'dither': 'fstein',
             'colors': 'thermal',
-            'threads': os.cpu_count() // 2 if os.cpu_count() else 2,
+            'threads': _CPU_COUNT // 2 or 1,
             'gpu': 'auto',
             'latency': 'normal',
+            'viz_precision': 'normal',
             'buffer_size': 1024,
             'sample_rate': 44100,
             'channels': 2,
@@ -157,6 +253,10 @@ class Config:
         """Get a configuration value."""
         return self.settings.get(key, default)
 
+    def set(self, key, value):
+        """Set a single configuration value."""
+        self.settings[key] = value
+
     def update(self, settings):
         """Update configuration with new settings."""
         self.settings.update(settings)
@@ -172,96 +272,181 @@ def setup_logging(debug=False):
 
     log_level = logging.DEBUG if debug else logging.INFO
 
+    formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s')
+    handlers = [
+        logging.StreamHandler(sys.stderr),
+        logging.FileHandler(log_file)
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # Log calls only enqueue the record; a listener thread does the
+    # formatting and the stderr/file I/O off the caller's path
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
     # Configure logging
-    logging.basicConfig(
-        level=log_level,
-        format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stderr),
-            logging.FileHandler(log_file)
-        ]
-    )
+    logging.basicConfig(level=log_level, handlers=[queue_handler])
 
     return logging.getLogger("asciisymphony")
 
 # ============================================================================
 # ERROR HANDLING
 # ============================================================================
-class ErrorClass(Enum):
-    """Error classification based on the Core Architecture Model."""
-    TECHNICAL = auto()  # T-Class errors
-    CREATIVE = auto()   # C-Class errors
-    HYBRID = auto()     # H-Class errors
+class ErrorClass(IntEnum):
+    """Error classification based on the Core Architecture Model.
+
+    Values index ErrorHandler's handler dispatch tuple.
+    """
+    TECHNICAL = 0  # T-Class errors
+    CREATIVE = 1   # C-Class errors
+    HYBRID = 2     # H-Class errors
+
+# Probed FFmpeg capabilities, reused until the ffmpeg binary changes
+CAPS_CACHE_FILE = (
+    Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / ".cache")
+    / "ffmpeg-scripts" / "caps.json"
+)
+
+# Simpler mode to fall back to when a mode's filters fail
+_FILTER_FALLBACK_MODES = MappingProxyType({
+    "neural": "spectrum",
+    "typography": "waves",
+    "particles": "waves",
+    "fractal": "cqt",
+    "spectrosynth": "spectrum",
+    "vortex": "waves",
+    "kaleidoscope": "spectrum"
+})
+
+# Most basic configuration, used when no targeted fallback applies
+_BASIC_CONFIG = MappingProxyType({
+    "mode": "waves",
+    "quality": "low",
+    "fps": 15,
+    "gpu": 0,
+    "effects": "none",
+    "charset": "ascii"
+})
+
+@functools.lru_cache(maxsize=1)
+def _probe_ffmpeg(ffmpeg_bin):
+    """Run the FFmpeg probes once per process for the given binary.
+
+    Returns a (has_caca, has_vulkan, has_libplacebo) tuple; use
+    _probe_ffmpeg.cache_clear() to force a fresh probe.
+    """
+    # Raw bytes are enough for substring tests, so skip decoding the listings
+    probe_args = dict(
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        check=True,
+        creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0)
+    )
+    
+    # The two probes are independent, so pay for one ffmpeg startup, not two
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # One -filters listing answers both the libcaca and libplacebo checks;
+        # a failing probe already tells us FFmpeg is missing or broken
+        filters = executor.submit(
+            subprocess.run, [ffmpeg_bin, "-hide_banner", "-filters"], **probe_args
+        )
+        # Check for GPU acceleration support
+        hwaccels = executor.submit(
+            subprocess.run, [ffmpeg_bin, "-hide_banner", "-hwaccels"], **probe_args
+        )
+        filters_out = filters.result().stdout
+        hwaccels_out = hwaccels.result().stdout
+    
+    caca = b"caca" in filters_out
+    libplacebo = b"libplacebo" in filters_out
+    vulkan = b"vulkan" in hwaccels_out
+    
+    return caca, vulkan, libplacebo
 
 class ErrorHandler:
     """Handles errors and implements fallback mechanisms."""
+    __slots__ = (
+        "app", "logger", "config", "max_fallback_attempts", "max_fallback_seconds",
+        "_deadline", "_attempts", "_dispatch", "caps_cache", "_recent", "_counts",
+        "_capabilities"
+    )
+
     def __init__(self, app):
         self.app = app
         self.logger = app.logger
         self.config = app.config
-        self.fallback_attempts = 0
         self.max_fallback_attempts = 3
+        self.max_fallback_seconds = 5.0
+        # Set on the first error; recovery gives up once it has passed
+        self._deadline = None
+        # next() on a count is atomic, so concurrent callers cannot both
+        # slip under the attempt limit
+        self._attempts = itertools.count(1)
+        # Indexed by ErrorClass
+        self._dispatch = (
+            self._handle_technical_error,
+            self._handle_creative_error,
+            self._handle_hybrid_error
+        )
+        self.caps_cache = CAPS_CACHE_FILE
+        self._capabilities = None
+        # Signatures of the most recent errors, for suppressing log bursts
+        self._recent = collections.deque(maxlen=32)
+        self._counts = collections.Counter()
 
     def handle_error(self, error, error_class=ErrorClass.TECHNICAL):
         """Handle an error with appropriate fallback."""
-        self.logger.error(f"Error encountered: {str(error)}")
+        self._log_error(error)
         
-        if self.fallback_attempts >= self.max_fallback_attempts:
-            self.logger.critical("Maximum fallback attempts reached, giving up")
+        now = time.monotonic()
+        if self._deadline is None:
+            self._deadline = now + self.max_fallback_seconds
+        elif now > self._deadline:
+            self.logger.critical("Fallback time budget exhausted, giving up")
             raise error
         
-        self.fallback_attempts += 1
+        # run() retries recursively, so attempts stay bounded even within the budget
+        if next(self._attempts) > self.max_fallback_attempts:
+            self.logger.critical("Maximum fallback attempts reached, giving up")
+            raise error
         
         # Handle different error classes
-        if error_class == ErrorClass.TECHNICAL:
-            return self._handle_technical_error(error)
-        elif error_class == ErrorClass.CREATIVE:
-            return self._handle_creative_error(error)
-        else:  # HYBRID
-            return self._handle_hybrid_error(error)
+        return self._dispatch[error_class](error)
+
+    def _log_error(self, error):
+        """Log an error, collapsing bursts of the same error into one notice."""
+        sig = (type(error).__name__, str(error)[:80])
+        
+        # Slide the window, forgetting the signature that falls out of it
+        if len(self._recent) == self._recent.maxlen:
+            evicted = self._recent[0]
+            self._counts[evicted] -= 1
+            if not self._counts[evicted]:
+                del self._counts[evicted]
+        self._recent.append(sig)
+        self._counts[sig] += 1
+        
+        count = self._counts[sig]
+        if count <= self._LOG_REPEAT_LIMIT:
+            self.logger.error("Error encountered: %s", error)
+        elif count == self._LOG_REPEAT_LIMIT + 1:
+            self.logger.error("Error %s repeated %dx, suppressing", sig, count)
 
     def _handle_technical_error(self, error):
         """Handle technical errors (T-Class)."""
         self.logger.info("Handling technical error with T-Mitigation")
+        found = self._error_keywords(error)
         
-        # Check error type and apply appropriate fallback
-        if "GPU" in str(error) or "hardware" in str(error).lower():
-            # Disable GPU acceleration
-            self.logger.info("Disabling GPU acceleration")
-            self.config.update({"gpu": 0})
-            return True
-        
-        elif "memory" in str(error).lower():
-            # Reduce quality
-            quality = self.config.get("quality", "balanced")
-            if quality == "ultra":
-                new_quality = "high"
-            elif quality == "high":
-                new_quality = "balanced"
-            else:
-                new_quality = "low"
-            
-            self.logger.info(f"Reducing quality from {quality} to {new_quality}")
-            self.config.update({"quality": new_quality})
-            return True
-        
-        elif "filter" in str(error).lower():
-            # Fall back to simpler visualization mode
-            current_mode = self.config.get("mode", "waves")
-            fallback_modes = {
-                "neural": "spectrum",
-                "typography": "waves",
-                "particles": "waves",
-                "fractal": "cqt",
-                "spectrosynth": "spectrum",
-                "vortex": "waves",
-                "kaleidoscope": "spectrum"
-            }
-            
-            new_mode = fallback_modes.get(current_mode, "waves")
-            self.logger.info(f"Falling back from {current_mode} to {new_mode}")
-            self.config.update({"mode": new_mode})
-            return True
+        # Apply the first fallback whose keyword appears in the error
+        for keyword, fallback in self._TECHNICAL_RULES:
+            if keyword in found:
+                return fallback(self)
         
         # No specific fallback found
         return False
@@ -269,122 +454,379 @@ class ErrorHandler:
     def _handle_creative_error(self, error):
         """Handle creative errors (C-Class)."""
         self.logger.info("Handling creative error with C-Revision")
+        found = self._error_keywords(error)
         
         # Typically these are errors related to styling or aesthetic issues
-        if "color" in str(error).lower():
-            # Reset to default color scheme
-            self.logger.info("Resetting to default color scheme")
-            self.config.update({"colors": "thermal"})
-            return True
-        
-        elif "effect" in str(error).lower():
-            # Disable effects
-            self.logger.info("Disabling effects")
-            self.config.update({"effects": "none"})
-            return True
+        for keyword, fallback in self._CREATIVE_RULES:
+            if keyword in found:
+                return fallback(self)
         
         # No specific fallback found
         return False
 
+    def _error_keywords(self, error):
+        """Return the set of rule keywords mentioned in the error message.
+
+        All keywords are matched in one regex pass; the rule tables then
+        only do set lookups, so their order still decides precedence.
+        """
+        return {match.lower() for match in self._KEYWORD_RE.findall(str(error))}
+
+    def _gpu_fallback(self):
+        """Disable GPU acceleration."""
+        self.logger.info("Disabling GPU acceleration")
+        self.config.set("gpu", 0)
+        return True
+
+    def _memory_fallback(self):
+        """Reduce quality."""
+        settings = self.config.settings
+        quality = settings.get("quality", "balanced")
+        new_quality = self._QUALITY_DOWNGRADE.get(quality, "low")
+        
+        self.logger.info("Reducing quality from %s to %s", quality, new_quality)
+        settings["quality"] = new_quality
+        return True
+
+    def _filter_fallback(self):
+        """Fall back to simpler visualization mode."""
+        settings = self.config.settings
+        current_mode = settings.get("mode", "waves")
+        new_mode = _FILTER_FALLBACK_MODES.get(current_mode, "waves")
+        self.logger.info("Falling back from %s to %s", current_mode, new_mode)
+        settings["mode"] = new_mode
+        return True
+
+    def _color_fallback(self):
+        """Reset to default color scheme."""
+        self.logger.info("Resetting to default color scheme")
+        self.config.set("colors", "thermal")
+        return True
+
+    def _effects_fallback(self):
+        """Disable effects."""
+        self.logger.info("Disabling effects")
+        self.config.set("effects", "none")
+        return True
+
+    # Identical errors logged in full within the recent-error window
+    _LOG_REPEAT_LIMIT = 3
+
+    # One step down the quality ladder; anything unknown drops to "low"
+    _QUALITY_DOWNGRADE = MappingProxyType({
+        "ultra": "high",
+        "high": "balanced",
+        "balanced": "low",
+        "low": "low"
+    })
+
+    # Keyword -> fallback tables, checked in order against the lower-cased error
+    _TECHNICAL_RULES = (
+        ("gpu", _gpu_fallback),
+        ("hardware", _gpu_fallback),
+        ("memory", _memory_fallback),
+        ("filter", _filter_fallback),
+    )
+    _CREATIVE_RULES = (
+        ("color", _color_fallback),
+        ("effect", _effects_fallback),
+    )
+    _HYBRID_RULES = _TECHNICAL_RULES + _CREATIVE_RULES
+    _KEYWORD_RE = re.compile("|".join(keyword for keyword, _ in _HYBRID_RULES), re.IGNORECASE)
+
     def _handle_hybrid_error(self, error):
         """Handle hybrid errors (H-Class)."""
         self.logger.info("Handling hybrid error with Cross-Domain Review")
         
-        # These are more complex errors that might require multiple changes
-        # First try technical fallback
-        if self._handle_technical_error(error):
-            return True
+        found = self._error_keywords(error)
         
-        # Then try creative fallback
-        if self._handle_creative_error(error):
-            return True
+        # These are more complex errors that might require multiple changes;
+        # technical fallbacks take precedence over creative ones
+        for keyword, fallback in self._HYBRID_RULES:
+            if keyword in found:
+                return fallback(self)
         
         # If all else fails, reset to most basic configuration
         self.logger.info("Resetting to basic configuration")
-        basic_config = {
-            "mode": "waves",
-            "quality": "low",
-            "fps": 15,
-            "gpu": 0,
-            "effects": "none",
-            "charset": "ascii"
-        }
-        self.config.update(basic_config)
+        self.config.update(_BASIC_CONFIG)
         return True
 
+    @property
+    def capabilities(self):
+        """FFmpeg capabilities, probed on first access and reused afterwards."""
+        if self._capabilities is None:
+            self._capabilities = self._detect_capabilities()
+        return self._capabilities
+
     def check_ffmpeg_capabilities(self):
         """Check FFmpeg capabilities and set fallback paths if needed."""
+        caps = self.capabilities
+        self.config.update({"vulkan": caps["vulkan"], "gpu": caps["gpu"]})
+        return caps["ffmpeg"]
+
+    def _detect_capabilities(self):
+        """Look up or probe what the installed FFmpeg supports."""
+        # Assume minimal capabilities until FFmpeg proves otherwise
+        minimal = {"ffmpeg": False, "caca": False, "vulkan": 0, "gpu": 0}
+        
+        # Resolve ffmpeg once: a missing binary is a cheap branch rather
+        # than a FileNotFoundError, and the probes reuse the absolute path
+        ffmpeg_bin = shutil.which("ffmpeg")
+        if ffmpeg_bin is None:
+            self.logger.error("ffmpeg not found")
+            return minimal
+        
         try:
-            # Check if FFmpeg is installed
-            result = subprocess.run(
-                ["ffmpeg", "-version"], 
-                capture_output=True, 
-                text=True, 
-                check=True
-            )
+            caps = self._load_caps_cache(ffmpeg_bin)
+            if caps is None:
+                caca, vulkan, libplacebo = _probe_ffmpeg(ffmpeg_bin)
+                caps = {"ffmpeg": True, "caca": caca, "vulkan": int(vulkan), "gpu": int(libplacebo)}
+                self._save_caps_cache(ffmpeg_bin, caps)
             
-            # Check for libcaca support
-            result = subprocess.run(
-                ["ffmpeg", "-filters"], 
-                capture_output=True, 
-                text=True, 
-                check=True
-            )
-            
-            if "caca" not in result.stdout:
+            if not caps["caca"]:
                 self.logger.warning("FFmpeg does not have libcaca support, ASCII output may be limited")
             
-            # Check for GPU acceleration support
-            result = subprocess.run(
-                ["ffmpeg", "-hwaccels"], 
-                capture_output=True, 
-                text=True, 
-                check=True
-            )
-            
-            # Update config based on available hardware acceleration
-            if "vulkan" in result.stdout:
+            # Report available hardware acceleration
+            if caps["vulkan"]:
                 self.logger.info("Vulkan hardware acceleration available")
-                self.config.update({"vulkan": 1})
-            else:
-                self.config.update({"vulkan": 0})
-            
-            # Check for libplacebo support
-            result = subprocess.run(
-                ["ffmpeg", "-v", "quiet", "-filters"], 
-                capture_output=True, 
-                text=True, 
-                check=True
-            )
-            
-            if "libplacebo" in result.stdout:
+            if caps["gpu"]:
                 self.logger.info("libplacebo GPU processing available")
-                self.config.update({"gpu": 1})
-            else:
-                self.config.update({"gpu": 0})
             
-            return True
+            return caps
             
         except (subprocess.SubprocessError) as e:
-            self.logger.error(f"Error checking FFmpeg capabilities: {str(e)}")
-            # Assume minimal capabilities
-            self.config.update({"vulkan": 0, "gpu": 0})
-            return False
+            self.logger.error("Error checking FFmpeg capabilities: %s", e)
+            return minimal
         except Exception as e:
-            self.logger.error(f"Unexpected error checking FFmpeg: {str(e)}")
-            return False
+            self.logger.error("Unexpected error checking FFmpeg: %s", e)
+            return minimal
+
+    @staticmethod
+    def _caps_cache_key(ffmpeg_path):
+        """Identify an ffmpeg binary by its path, mtime and size."""
+        st = os.stat(ffmpeg_path)
+        return [ffmpeg_path, st.st_mtime_ns, st.st_size]
+
+    def _load_caps_cache(self, ffmpeg_path):
+        """Return cached capabilities for this ffmpeg binary, or None."""
+        try:
+            with open(self.caps_cache) as f:
+                cached = json.load(f)
+            if cached["key"] == self._caps_cache_key(ffmpeg_path) and "ffmpeg" in cached["caps"]:
+                return cached["caps"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def _save_caps_cache(self, ffmpeg_path, caps):
+        """Store probed capabilities, replacing the cache file atomically."""
+        try:
+            self.caps_cache.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.caps_cache.with_name(f"{self.caps_cache.name}.{os.getpid()}")
+            with open(temp_path, "w") as f:
+                json.dump({"key": self._caps_cache_key(ffmpeg_path), "caps": caps}, f)
+            os.replace(temp_path, self.caps_cache)
+        except OSError as e:
+            self.logger.debug("Could not write FFmpeg capability cache: %s", e)
 
 # ============================================================================
 # AUDIO DEVICE MANAGEMENT
 # ============================================================================
+# How long enumeration output stays fresh; device lists change when hardware
+# is plugged in
+DEVICE_DISCOVERY_TTL = 5.0
+
+# pactl subscribe events that change the set of capture devices
+_PULSE_EVENT_RE = re.compile(r"Event '(?:new|change|remove)' on (?:sink|source) #")
+
+# The FFmpeg capture thread picks up at least this many chunks, and at
+# least CAPTURE_READ_BYTES, with one read
+CAPTURE_READ_BATCH = 8
+CAPTURE_READ_BYTES = 64 * 1024
+
+# Kernel pipe buffer requested for the capture pipe, so ffmpeg can run
+# ahead of a briefly stalled reader instead of blocking on a full pipe
+CAPTURE_PIPE_SIZE = 1 << 20
+
+# Patterns for parsing device listings
+_PULSE_SOURCE_RE = re.compile(r'^[ \t]*Source #(\d+)[^\n]*(?:\n(?![ \t]*Source #)[^\n]*)*', re.MULTILINE)
+_PULSE_NAME_RE = re.compile(r'^[ \t]*Name:[ \t]*([^\n]*?)\s*$', re.MULTILINE)
+_PULSE_CHANNELS_LINE_RE = re.compile(r'^[ \t]*Channels:[ \t]*([^\n]*?)\s*$', re.MULTILINE)
+_PULSE_CHANNELS_RE = re.compile(r'(\d+)')
+_AVF_LINE_RE = re.compile(r'\[(\d+)\] (.+)')
+_AVF_PREFIX_RE = re.compile(r'\[\d+\]')
+_DSHOW_NAME_RE = re.compile(r'"([^"]+)"')
+
+class _SubprocCache:
+    """Process-wide TTL cache for the output of enumeration subprocesses.
+
+    Results are keyed by (tag, command, uid) so cached listings are never
+    shared across users. Only successful runs are cached; exceptions
+    propagate to the caller untouched.
+    """
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_run(self, cmd, ttl, tag=None, **kwargs):
+        """Return a cached CompletedProcess for cmd, running it if stale."""
+        return self.get_or_call(cmd, ttl, functools.partial(subprocess.run, cmd, **kwargs), tag)
+
+    def get_or_call(self, cmd, ttl, func, tag=None):
+        """Return the cached result for cmd, calling func() to refresh it if stale."""
+        key = (tag, tuple(cmd), os.getuid() if hasattr(os, "getuid") else None)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        result = func()
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, result)
+        return result
+
+    def invalidate(self, tag=None):
+        """Drop cached results for tag, or everything when tag is None."""
+        with self._lock:
+            if tag is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == tag]:
+                    del self._entries[key]
+
+_SUBPROC_CACHE = _SubprocCache()
+
+def _parse_channels(ch_str):
+    """Map a pactl channel description to a channel count (default 2)."""
+    ch_str = ch_str.lower()
+    if "mono" in ch_str:
+        return 1
+    if "stereo" in ch_str:
+        return 2
+    if "surround" in ch_str:
+        return 6
+    # Try to parse the number
+    ch_match = _PULSE_CHANNELS_RE.search(ch_str)
+    return int(ch_match.group(1)) if ch_match else 2
+
+def _list_device_section(cmd, section_header):
+    """Return the stripped log lines of one ffmpeg -list_devices section.
+
+    stderr is read as ffmpeg writes it and ffmpeg is stopped as soon as the
+    section ends, rather than waiting for it to fail on the dummy input.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1
+    )
+    lines = []
+    try:
+        reading = False
+        for line in proc.stderr:
+            line = line.strip()
+            if section_header in line:
+                reading = True
+            elif reading:
+                # Device entries are "[indev @ 0x...]" log lines; the next
+                # section header or ffmpeg's own error ends the list
+                if "devices:" in line or not line.startswith("["):
+                    break
+                lines.append(line)
+    finally:
+        proc.terminate()
+        proc.stderr.close()
+        try:
+            proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+    return lines
+_pulse_watcher_started = False
+_pulse_watcher_proc = None
+_pulse_watcher_lock = threading.Lock()
+
+def _watch_pulse_events(proc):
+    """Invalidate cached PulseAudio listings whenever a sink/source changes."""
+    try:
+        for line in proc.stdout:
+            if _PULSE_EVENT_RE.search(line):
+                _SUBPROC_CACHE.invalidate("pulse")
+    finally:
+        # Without the subscription we can no longer trust cached listings
+        _SUBPROC_CACHE.invalidate("pulse")
+        _stop_pulse_watcher()
+        proc.stdout.close()
+
+def _stop_pulse_watcher():
+    """Terminate the pactl subscribe child, if one is running."""
+    global _pulse_watcher_proc
+    with _pulse_watcher_lock:
+        proc, _pulse_watcher_proc = _pulse_watcher_proc, None
+    if proc is None:
+        return
+    if proc.poll() is None:
+        proc.terminate()
+    try:
+        proc.wait(timeout=1)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+def _start_pulse_watcher():
+    """Start the pactl subscribe child and its reader thread once per process."""
+    global _pulse_watcher_started, _pulse_watcher_proc
+    with _pulse_watcher_lock:
+        if _pulse_watcher_started:
+            return
+        _pulse_watcher_started = True
+        try:
+            proc = subprocess.Popen(
+                ["pactl", "subscribe"],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
+            )
+        except OSError:
+            return
+        _pulse_watcher_proc = proc
+    atexit.register(_stop_pulse_watcher)
+    threading.Thread(target=_watch_pulse_events, args=(proc,), name="pactl-subscribe", daemon=True).start()
+
 class AudioDeviceManager:
     """Manages audio device detection and selection across platforms."""
     def __init__(self, config):
         self.config = config
         self.logger = logging.getLogger("asciisymphony.audio")
-        self.devices = []
+        self._subproc_cache = _SUBPROC_CACHE
+        self._by_index = {}
         self.system = self._detect_system()
 
+    @functools.cached_property
+    def devices(self):
+        """Detected audio input devices, enumerated on first access."""
+        return self.detect_devices()
+
+    @property
+    def cache_hits(self):
+        """Number of enumeration subprocesses answered from the cache."""
+        return self._subproc_cache.hits
+
+    @property
+    def cache_misses(self):
+        """Number of enumeration subprocesses that actually ran."""
+        return self._subproc_cache.misses
+
     def _detect_system(self):
         """Detect the audio system to use based on platform."""
         system = platform.system()
@@ -406,17 +848,15 @@ class AudioDeviceManager:
         # Default fallback
         return "default"
 
-    def _command_exists(self, cmd):
-        """Check if a command exists in the system path."""
-        try:
-            subprocess.run(
-                ["which", cmd], 
-                capture_output=True, 
-                check=True
-            )
-            return True
-        except subprocess.SubprocessError:
-            return False
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _command_exists(cmd):
+        """Check if a command exists in the system path.
+
+        PATH is searched in-process and the answer is memoized for the
+        lifetime of the process.
+        """
+        return shutil.which(cmd) is not None
 
     def detect_devices(self):
         """Detect available audio input devices."""
@@ -436,11 +876,16 @@ class AudioDeviceManager:
         if not self.devices:
             self._add_default_device()
 
+        # Index lookup table; built in reverse so the first device with a
+        # given index wins, as with a linear scan
+        self._by_index = {device['index']: device for device in reversed(self.devices)}
+
         return self.devices
 
     def _detect_devices_pyaudio(self):
         """Detect audio devices using PyAudio."""
         try:
+            pyaudio = _load_pyaudio()
             pa = pyaudio.PyAudio()
 
             try:
@@ -502,63 +947,32 @@ class AudioDeviceManager:
 
     def _detect_devices_pulse(self):
         """Detect PulseAudio input devices."""
+        # Cached listings are only trustworthy while the subscription runs
+        _start_pulse_watcher()
         try:
             # Use pactl to list sources
-            result = subprocess.run(
+            result = self._subproc_cache.get_or_run(
                 ["pactl", "list", "sources"],
+                DEVICE_DISCOVERY_TTL,
+                tag="pulse",
                 capture_output=True,
                 text=True,
                 check=True
             )
 
-            source_index = None
-            source_name = None
-            channels = 2
-
-            for line in result.stdout.splitlines():
-                line = line.strip()
-
-                if line.startswith("Source #"):
-                    # Start of a new source
-                    if source_index is not None and source_name is not None:
-                        self.devices.append({
-                            'index': source_index,
-                            'name': source_name,
-                            'channels': channels,
-                            'sample_rate': 44100,
-                            'system': 'pulse'
-                        })
-
-                    source_index = int(line.split('#')[1])
-                    source_name = None
-                    channels = 2
-
-                elif "Name:" in line:
-                    source_name = line.split("Name:")[1].strip()
-
-                elif "Channels:" in line:
-                    try:
-                        ch_str = line.split("Channels:")[1].strip()
-                        if "mono" in ch_str.lower():
-                            channels = 1
-                        elif "stereo" in ch_str.lower():
-                            channels = 2
-                        elif "surround" in ch_str.lower():
-                            channels = 6
-                        else:
-                            # Try to parse the number
-                            ch_match = re.search(r'(\d+)', ch_str)
-                            if ch_match:
-                                channels = int(ch_match.group(1))
-                    except:
-                        channels = 2
+            # Each match spans one source block; its fields are searched
+            # within the block's bounds, so parsing stays in the re engine
+            stdout = result.stdout
+            for block in _PULSE_SOURCE_RE.finditer(stdout):
+                name_match = _PULSE_NAME_RE.search(stdout, block.start(), block.end())
+                if name_match is None:
+                    continue
 
-            # Add last device if there was one
-            if source_index is not None and source_name is not None:
+                channels_match = _PULSE_CHANNELS_LINE_RE.search(stdout, block.start(), block.end())
                 self.devices.append({
-                    'index': source_index,
-                    'name': source_name,
-                    'channels': channels,
+                    'index': int(block.group(1)),
+                    'name': name_match.group(1),
+                    'channels': _parse_channels(channels_match.group(1)) if channels_match else 2,
                     'sample_rate': 44100,
                     'system': 'pulse'
                 })
@@ -571,8 +985,10 @@ class AudioDeviceManager:
         """Detect ALSA input devices."""
         try:
             # Use arecord to list devices
-            result = subprocess.run(
+            result = self._subproc_cache.get_or_run(
                 ["arecord", "-L"],
+                DEVICE_DISCOVERY_TTL,
+                tag="alsa",
                 capture_output=True,
                 text=True,
                 check=True
@@ -602,31 +1018,20 @@ class AudioDeviceManager:
 
     def _detect_devices_avfoundation(self):
         """Detect AVFoundation (macOS) input devices."""
+        cmd = ["ffmpeg", "-f", "avfoundation", "-list_devices", "true", "-i", ""]
         try:
             # Use ffmpeg to list devices
-            result = subprocess.run(
-                ["ffmpeg", "-f", "avfoundation", "-list_devices", "true", "-i", ""],
-                capture_output=True,
-                text=True
+            lines = self._subproc_cache.get_or_call(
+                cmd,
+                DEVICE_DISCOVERY_TTL,
+                functools.partial(_list_device_section, cmd, "AVFoundation audio devices"),
+                tag="avfoundation"
             )
 
-            current_index = 0
-            reading_audio = False
-
-            for line in result.stderr.splitlines():
-                line = line.strip()
-
-                if "AVFoundation audio devices" in line:
-                    reading_audio = True
-                    continue
-
-                if "AVFoundation video devices" in line:
-                    reading_audio = False
-                    continue
-
-                if reading_audio and re.search(r'\[\d+\]', line):
+            for line in lines:
+                if _AVF_PREFIX_RE.search(line):
                     # Extract device info
-                    match = re.search(r'\[(\d+)\] (.+)', line)
+                    match = _AVF_LINE_RE.search(line)
                     if match:
                         device_index = int(match.group(1))
                         device_name = match.group(2)
@@ -639,37 +1044,27 @@ class AudioDeviceManager:
                             'system': 'avfoundation'
                         })
 
-        except (subprocess.SubprocessError, ValueError) as e:
+        except (subprocess.SubprocessError, OSError, ValueError) as e:
             self.logger.error(f"Error detecting AVFoundation devices: {str(e)}")
             self._add_default_device()
 
     def _detect_devices_dshow(self):
         """Detect DirectShow (Windows) input devices."""
+        cmd = ["ffmpeg", "-f", "dshow", "-list_devices", "true", "-i", "dummy"]
         try:
             # Use ffmpeg to list devices
-            result = subprocess.run(
-                ["ffmpeg", "-f", "dshow", "-list_devices", "true", "-i", "dummy"],
-                capture_output=True,
-                text=True
+            lines = self._subproc_cache.get_or_call(
+                cmd,
+                DEVICE_DISCOVERY_TTL,
+                functools.partial(_list_device_section, cmd, "DirectShow audio devices"),
+                tag="dshow"
             )
 
             current_index = 0
-            reading_audio = False
-
-            for line in result.stderr.splitlines():
-                line = line.strip()
-
-                if "DirectShow audio devices" in line:
-                    reading_audio = True
-                    continue
-
-                if "DirectShow video devices" in line:
-                    reading_audio = False
-                    continue
-
-                if reading_audio and "Alternative name" not in line:
+            for line in lines:
+                if "Alternative name" not in line:
                     # Extract device info
-                    match = re.search(r'"([^"]+)"', line)
+                    match = _DSHOW_NAME_RE.search(line)
                     if match:
                         device_name = match.group(1)
 
@@ -682,7 +1077,7 @@ class AudioDeviceManager:
                         })
                         current_index += 1
 
-        except (subprocess.SubprocessError, ValueError) as e:
+        except (subprocess.SubprocessError, OSError, ValueError) as e:
             self.logger.error(f"Error detecting DirectShow devices: {str(e)}")
             self._add_default_device()
 
@@ -712,23 +1107,22 @@ class AudioDeviceManager:
 
     def get_device_by_id(self, device_id):
         """Get device information by ID."""
-        if not self.devices:
-            self.detect_devices()
-        
+        devices = self.devices
+
         # If device_id is None, return the default device
         if device_id is None:
             # Return the first device or None if no devices
-            return self.devices[0] if self.devices else None
+            return devices[0] if devices else None
         
         # If device_id is an integer, use it as an index
         if isinstance(device_id, int):
-            for device in self.devices:
-                if device['index'] == device_id:
-                    return device
+            device = self._by_index.get(device_id)
+            if device is not None:
+                return device
         
         # If device_id is a string, try to match by name
         elif isinstance(device_id, str):
-            for device in self.devices:
+            for device in devices:
                 if device_id in device['name']:
                     return device
         
@@ -737,26 +1131,156 @@ class AudioDeviceManager:
 
     def list_devices(self):
         """List all available audio input devices."""
-        if not self.devices:
-            self.detect_devices()
-        
         return [(device['index'], device['name']) for device in self.devices]
 
+@functools.lru_cache(maxsize=16)
+def _build_ffmpeg_args(system, index, name, sample_rate, channels, buffer_size, latency):
+    """Build the FFmpeg live-capture input arguments as a tuple.
+
+    Memoized, since the arguments only change with the device or config.
+    """
+    # System-specific arguments
+    if system == 'pulse':
+        args = ('-f', 'pulse', '-i', str(index))
+    elif system == 'alsa':
+        args = ('-f', 'alsa', '-i', f"hw:{index}")
+    elif system == 'avfoundation':
+        args = ('-f', 'avfoundation', '-i', f":{index}")
+    elif system == 'dshow':
+        args = ('-f', 'dshow', '-audio_buffer_size', str(buffer_size),
+                '-i', f"audio={name}")
+    else:
+        # Generic fallback
+        args = ('-f', 'pulse', '-i', str(index))
+    
+    # Common arguments
+    args += ('-sample_rate', str(sample_rate), '-channels', str(channels))
+    
+    # Low latency options
+    if latency == 'low':
+        args += ('-avioflags', 'direct', '-fflags', 'nobuffer',
+                 '-flags', 'low_delay', '-strict', 'experimental')
+    
+    return args
+
+class AudioArrayShim:
+    """Minimal numpy-like view of 16-bit PCM data when NumPy isn't available.
+
+    Samples are decoded once into an ``array.array('h')`` so the reductions
+    run in C and are exact rather than sampled.
+    """
+    def __init__(self, data):
+        self.data = data
+        self._arr = array.array('h')
+        self._arr.frombytes(data[:len(data) - len(data) % 2])
+        if sys.byteorder == 'big':
+            self._arr.byteswap()
+        self.shape = (len(self._arr),)
+
+    def __len__(self):
+        return len(self._arr)
+
+    def mean(self):
+        return sum(self._arr) / len(self._arr) if self._arr else 0
+
+    def max(self):
+        return max(self._arr) if self._arr else 0
+
+    def min(self):
+        return min(self._arr) if self._arr else 0
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return self._arr[idx].tolist()
+        return self._arr[idx] if 0 <= idx < len(self._arr) else 0
+
+class SPSCQueue:
+    """Bounded single-producer/single-consumer queue for captured audio blocks.
+
+    Follows the queue.Queue interface used here, but the producer only
+    stores into a preallocated slot and bumps an index; the consumer waits
+    on an Event only when it finds the queue empty. Safe for exactly one
+    putting thread and one getting thread.
+    """
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._slots = [None] * maxsize
+        self._head = 0  # next slot to read, only advanced by the consumer
+        self._tail = 0  # next slot to write, only advanced by the producer
+        self._ready = threading.Event()
+
+    def qsize(self):
+        return self._tail - self._head
+
+    def empty(self):
+        return self._tail == self._head
+
+    def full(self):
+        return self._tail - self._head >= self.maxsize
+
+    def put(self, item, block=False):
+        """Add an item; the capture threads never block, so a full queue raises queue.Full."""
+        if self.full():
+            raise queue.Full
+        self._slots[self._tail % self.maxsize] = item
+        self._tail += 1
+        self._ready.set()
+
+    def put_nowait(self, item):
+        self.put(item, block=False)
+
+    def get(self, block=True, timeout=None):
+        """Remove and return the oldest item, waiting for one if block is true."""
+        if self._tail == self._head:
+            if not block:
+                raise queue.Empty
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while self._tail == self._head:
+                # Re-check after clearing so a put() racing the clear isn't missed
+                self._ready.clear()
+                if self._tail != self._head:
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Empty
+                self._ready.wait(remaining)
+
+        index = self._head % self.maxsize
+        item = self._slots[index]
+        self._slots[index] = None
+        self._head += 1
+        return item
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def clear(self):
+        """Drop every queued item; call from the consumer side."""
+        self._slots = [None] * self.maxsize
+        self._head = self._tail
+
 class LiveAudioProcessor:
     """Processes live audio input for visualization."""
     def __init__(self, config, device_manager):
         self.config = config
         self.device_manager = device_manager
         self.logger = logging.getLogger("asciisymphony.audio")
-        self.audio_queue = queue.Queue(maxsize=100)
+        self.audio_queue = SPSCQueue(maxsize=100)
         self.stop_event = threading.Event()
         self.audio_thread = None
+        self.low_precision = False
 
         if not PYAUDIO_AVAILABLE:
             self.logger.warning("PyAudio not available. Live audio capture will use FFmpeg instead.")
 
     def start_capture(self, device_id=None):
-        """Start capturing audio from the specified device."""
+        """Start capturing audio from the specified device.
+
+        Returns the queue the capture thread fills with
+        (samples, (max, min, mean)) tuples. Samples are int16, or int8
+        (the high byte of each sample, stats on the same scale) when
+        viz_precision is 'low'.
+        """
         device = self.device_manager.get_device_by_id(device_id)
 
         if not device:
@@ -764,9 +1288,11 @@ class LiveAudioProcessor:
 
         self.logger.info(f"Starting audio capture from device: {device['name']}")
 
+        # Level-only visualizations can take the top byte of each sample
+        self.low_precision = NUMPY_AVAILABLE and self.config.get('viz_precision') == 'low'
+
         # Clear queue and reset stop event
-        while not self.audio_queue.empty():
-            self.audio_queue.get()
+        self.audio_queue.clear()
 
         self.stop_event.clear()
 
@@ -799,6 +1325,7 @@ class LiveAudioProcessor:
         buffer_size = int(self.config.get('buffer_size', 1024))
 
         # Initialize PyAudio
+        pyaudio = _load_pyaudio()
         pa = pyaudio.PyAudio()
 
         try:
@@ -818,11 +1345,16 @@ class LiveAudioProcessor:
                     audio_data = stream.read(buffer_size)
 
                     # Convert to numpy array for easier processing
-                    audio_array = np.frombuffer(audio_data, dtype=np.int16)
+                    if NUMPY_AVAILABLE:
+                        audio_array = np.frombuffer(audio_data, dtype=np.int16)
+                        if self.low_precision:
+                            audio_array = (audio_array >> 8).astype(np.int8)
+                    else:
+                        audio_array = self._create_audio_array_shim(audio_data)
 
                     # Put in queue if not full
                     if not self.audio_queue.full():
-                        self.audio_queue.put(audio_array, block=False)
+                        self.audio_queue.put((audio_array, self._pcm_stats(audio_array)), block=False)
 
                 except (IOError, OSError) as e:
                     self.logger.error(f"Error reading audio: {str(e)}")
@@ -855,55 +1387,57 @@ class LiveAudioProcessor:
         cmd = ['ffmpeg'] + ffmpeg_args
         self.logger.info(f"Starting FFmpeg audio capture: {' '.join(cmd)}")
 
-        # Use universal_newlines=False to get binary output
-        ffmpeg_process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            bufsize=1024 * 8,  # Buffer size
-            universal_newlines=False
-        )
+        ffmpeg_process = self._spawn_ffmpeg(cmd)
 
         buffer_size = int(self.config.get('buffer_size', 1024))
         bytes_per_sample = 2  # 16-bit = 2 bytes
         channels = int(self.config.get('channels', 2))
         chunk_size = buffer_size * bytes_per_sample * channels
 
+        # Chunks are read in place into a preallocated ring and handed out as
+        # views, so no per-chunk buffers are allocated. Every chunk the queue
+        # can hold, the one the consumer is working on and a read batch ahead
+        # of the write cursor each need their own slot.
+        read_batch = max(CAPTURE_READ_BATCH, CAPTURE_READ_BYTES // chunk_size)
+        ring_size = chunk_size * (self.audio_queue.maxsize + 1 + read_batch)
+        self._ring = bytearray(ring_size)
+        self._wpos = 0
+        ring_view = memoryview(self._ring)
+        pending = 0  # bytes read past the write cursor, less than one chunk
+
         try:
             # Read audio data from FFmpeg output
             while not self.stop_event.is_set():
                 try:
-                    audio_data = ffmpeg_process.stdout.read(chunk_size)
-                    if not audio_data:
+                    # A single read drains up to a batch of chunks FFmpeg has
+                    # already written, rather than one syscall per chunk
+                    window_end = min(self._wpos + chunk_size * read_batch, ring_size)
+                    nbytes = self._read_available(
+                        ffmpeg_process.stdout, ring_view[self._wpos + pending:window_end]
+                    )
+                    if not nbytes:
+                        # Flush the trailing partial chunk
+                        if pending:
+                            self._queue_chunk(pending, chunk_size)
+                            pending = 0
+
                         # If we've reached EOF, restart the stream if possible
                         if ffmpeg_process.poll() is not None:
                             self.logger.warning("FFmpeg process ended, restarting...")
                             ffmpeg_process.terminate()
-                            ffmpeg_process = subprocess.Popen(
-                                cmd,
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE,
-                                bufsize=1024 * 8,
-                                universal_newlines=False
-                            )
+                            ffmpeg_process = self._spawn_ffmpeg(cmd)
                             continue
                         else:
                             break
 
-                    # Convert to data structure for processing
-                    if NUMPY_AVAILABLE:
-                        try:
-                            audio_array = np.frombuffer(audio_data, dtype=np.int16)
-                        except Exception as np_err:
-                            self.logger.warning(f"NumPy error: {str(np_err)}, falling back to raw data")
-                            audio_array = audio_data
-                    else:
-                        # Create a basic structure that mimics some numpy array behaviors
-                        audio_array = self._create_audio_array_shim(audio_data)
-
-                    # Put in queue if not full
-                    if not self.audio_queue.full():
-                        self.audio_queue.put(audio_array, block=False)
+                    pending += nbytes
+                    while pending >= chunk_size:
+                        pending -= chunk_size
+                        if not self._queue_chunk(chunk_size, chunk_size) and pending:
+                            # Queue is full: drop the chunk and reuse its slot
+                            # for the bytes read after it
+                            ring_view[self._wpos:self._wpos + pending] = \
+                                self._ring[self._wpos + chunk_size:self._wpos + chunk_size + pending]
 
                 except Exception as e:
                     self.logger.error(f"Error reading FFmpeg audio: {str(e)}")
@@ -917,77 +1451,102 @@ class LiveAudioProcessor:
             except:
                 ffmpeg_process.kill()
 
+    def _spawn_ffmpeg(self, cmd):
+        """Start the FFmpeg capture child with its stdout on a pipe.
+
+        Passing an absolute executable and close_fds=False lets subprocess
+        use posix_spawn/vfork instead of fork+exec, so the child does not
+        clone our page tables first. Our own descriptors are already
+        non-inheritable (PEP 446), so nothing extra leaks into ffmpeg.
+        """
+        # Nobody reads ffmpeg's stderr unless we are debugging; an undrained
+        # pipe would eventually fill up and stall the capture
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
+        # stdout is read unbuffered, straight from the fd
+        process = subprocess.Popen(
+            cmd,
+            executable=shutil.which(cmd[0]) or cmd[0],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE if debug else subprocess.DEVNULL,
+            bufsize=0,
+            close_fds=False
+        )
+
+        if debug:
+            threading.Thread(
+                target=self._drain_ffmpeg_stderr,
+                args=(process.stderr,),
+                name="ffmpeg-capture-stderr",
+                daemon=True
+            ).start()
+
+        # Enlarge the pipe on Linux; it is only a hint, so keep the default
+        # size if the kernel refuses (e.g. above fs.pipe-max-size)
+        if sys.platform.startswith("linux"):
+            try:
+                fcntl.fcntl(process.stdout.fileno(), getattr(fcntl, "F_SETPIPE_SZ", 1031), CAPTURE_PIPE_SIZE)
+            except OSError:
+                pass
+
+        return process
+
+    def _drain_ffmpeg_stderr(self, stderr):
+        """Forward the capture child's stderr to the debug log."""
+        with stderr:
+            for line in stderr:
+                self.logger.debug(f"ffmpeg: {line.decode(errors='replace').rstrip()}")
+
+    @staticmethod
+    def _read_available(stream, view):
+        """Read whatever a pipe has buffered into view, blocking for at least one byte."""
+        # readv() goes straight to the fd; elsewhere make a single raw read
+        if hasattr(os, "readv"):
+            return os.readv(stream.fileno(), [view])
+        return stream.readinto(view) or 0
+
+    def _queue_chunk(self, nbytes, slot_size):
+        """Queue a view of the ring slot at the write cursor; False if the queue is full."""
+        if self.audio_queue.full():
+            return False
+
+        # Convert to data structure for processing
+        if NUMPY_AVAILABLE:
+            try:
+                audio_array = np.frombuffer(
+                    self._ring, dtype=np.int16, count=nbytes // 2, offset=self._wpos
+                )
+                if self.low_precision:
+                    audio_array = (audio_array >> 8).astype(np.int8)
+            except Exception as np_err:
+                self.logger.warning(f"NumPy error: {str(np_err)}, falling back to raw data")
+                audio_array = bytes(self._ring[self._wpos:self._wpos + nbytes])
+        else:
+            # Create a basic structure that mimics some numpy array behaviors
+            audio_array = self._create_audio_array_shim(
+                memoryview(self._ring)[self._wpos:self._wpos + nbytes]
+            )
+
+        self.audio_queue.put((audio_array, self._pcm_stats(audio_array)), block=False)
+        self._wpos = (self._wpos + slot_size) % len(self._ring)
+        return True
+
+    @staticmethod
+    def _pcm_stats(audio_array):
+        """Return (max, min, mean) of a block of int16 samples.
+
+        Computed once in the capture thread and queued with the block, so
+        consumers don't each rescan the samples.
+        """
+        if isinstance(audio_array, bytes):
+            audio_array = AudioArrayShim(audio_array)
+        if not len(audio_array):
+            return (0, 0, 0.0)
+        return (int(audio_array.max()), int(audio_array.min()), float(audio_array.mean()))
+
     def _create_audio_array_shim(self, audio_data):
         """Create a simple shim for audio data when NumPy isn't available."""
-        # This provides a minimal object with some properties similar to numpy arrays
-        class AudioArrayShim:
-            def __init__(self, data):
-                self.data = data
-                self.shape = (len(data) // 2,)  # Assume 16-bit samples
-
-            def __len__(self):
-                return self.shape[0]
-
-            def mean(self):
-                # Crude approximation of mean for 16-bit PCM data
-                if not self.data:
-                    return 0
-                # Sample a few values for efficiency
-                samples = min(100, len(self.data) // 2)
-                total = 0
-                for i in range(0, len(self.data), len(self.data) // samples):
-                    if i + 1 < len(self.data):
-                        # Convert two bytes to signed 16-bit int
-                        value = int.from_bytes(self.data[i:i+2], byteorder='little', signed=True)
-                        total += value
-                return total / samples
-
-            def max(self):
-                # Crude approximation of max for 16-bit PCM data
-                if not self.data:
-                    return 0
-                # Sample values for efficiency
-                samples = min(100, len(self.data) // 2)
-                max_val = -32768  # Minimum 16-bit signed value
-                for i in range(0, len(self.data), len(self.data) // samples):
-                    if i + 1 < len(self.data):
-                        value = int.from_bytes(self.data[i:i+2], byteorder='little', signed=True)
-                        max_val = max(max_val, value)
-                return max_val
-
-            def min(self):
-                # Crude approximation of min for 16-bit PCM data
-                if not self.data:
-                    return 0
-                # Sample values for efficiency
-                samples = min(100, len(self.data) // 2)
-                min_val = 32767  # Maximum 16-bit signed value
-                for i in range(0, len(self.data), len(self.data) // samples):
-                    if i + 1 < len(self.data):
-                        value = int.from_bytes(self.data[i:i+2], byteorder='little', signed=True)
-                        min_val = min(min_val, value)
-                return min_val
-
-            def __getitem__(self, idx):
-                if isinstance(idx, slice):
-                    # Handle slice notation
-                    start = idx.start if idx.start is not None else 0
-                    stop = idx.stop if idx.stop is not None else len(self.data) // 2
-                    step = idx.step if idx.step is not None else 1
-
-                    result = []
-                    for i in range(start, stop, step):
-                        if i*2+1 < len(self.data):
-                            result.append(int.from_bytes(self.data[i*2:i*2+2],
-                                                        byteorder='little', signed=True))
-                    return result
-                else:
-                    # Handle integer indexing
-                    if idx*2+1 < len(self.data):
-                        return int.from_bytes(self.data[idx*2:idx*2+2],
-                                             byteorder='little', signed=True)
-                    return 0
-
         return AudioArrayShim(audio_data)
 
     def create_temp_wav(self, duration=5):
@@ -1017,6 +1576,7 @@ class LiveAudioProcessor:
     def _create_temp_wav_pyaudio(self, temp_filename, device, duration, sample_rate, channels, buffer_size):
         """Create a temporary WAV file using PyAudio."""
         # Initialize PyAudio
+        pyaudio = _load_pyaudio()
         pa = pyaudio.PyAudio()
 
         try:
@@ -1039,13 +1599,10 @@ class LiveAudioProcessor:
             # Record audio
             self.logger.info(f"Recording {duration} seconds of audio to {temp_filename} using PyAudio")
 
-            frames = []
+            # Stream each block straight to the file; close() patches the
+            # header with the final length
             for _ in range(0, int(sample_rate / buffer_size * duration)):
-                data = stream.read(buffer_size)
-                frames.append(data)
-
-            # Write to file
-            wf.writeframes(b''.join(frames))
+                wf.writeframesraw(stream.read(buffer_size))
             wf.close()
 
             # Clean up audio
@@ -1103,65 +1660,61 @@ class LiveAudioProcessor:
         """Create a silent WAV file as fallback."""
         self.logger.warning(f"Creating silent WAV file as fallback: {temp_filename}")
 
-        # Create WAV file
-        wf = wave.open(temp_filename, 'wb')
-        wf.setnchannels(channels)
-        wf.setsampwidth(2)  # 16-bit
-        wf.setframerate(sample_rate)
-
-        # Generate silence (all zeros)
         frames_count = int(duration * sample_rate)
-        silence_data = b'\x00\x00' * frames_count * channels
-
-        # Write silence to file
-        wf.writeframes(silence_data)
-        wf.close()
+        block_align = channels * 2  # 16-bit
+        data_size = frames_count * block_align
+
+        # Write a canonical 44-byte PCM header, then extend the file with
+        # truncate(): the silence is zero-filled (sparse where supported)
+        # without building it in memory
+        with open(temp_filename, 'wb') as f:
+            f.write(struct.pack(
+                '<4sI4s4sIHHIIHH4sI',
+                b'RIFF', 36 + data_size, b'WAVE',
+                b'fmt ', 16, 1, channels, sample_rate, sample_rate * block_align, block_align, 16,
+                b'data', data_size
+            ))
+            f.truncate(44 + data_size)
 
         return temp_filename
 
     def get_ffmpeg_input_args(self, device_id=None):
-        """Get FFmpeg input arguments for live audio capture."""
-        device = self.device_manager.get_device_by_id(device_id)
+        """Get FFmpeg input arguments for live audio capture.
+
+        device_id may also be an already resolved device dict.
+        """
+        if isinstance(device_id, dict):
+            device = device_id
+        else:
+            device = self.device_manager.get_device_by_id(device_id)
         
         if not device:
             raise ValueError("No audio input device available")
         
-        # Get configuration
-        sample_rate = self.config.get('sample_rate', device['sample_rate'])
-        channels = self.config.get('channels', min(device['channels'], 2))
-        buffer_size = self.config.get('buffer_size', 1024)
-        latency = self.config.get('latency', 'normal')
-        
-        # Base arguments
-        args = []
-        
-        # System-specific arguments
-        if device['system'] == 'pulse':
-            args.extend(['-f', 'pulse', '-i', str(device['index'])])
-        elif device['system'] == 'alsa':
-            args.extend(['-f', 'alsa', '-i', f"hw:{device['index']}"])
-        elif device['system'] == 'avfoundation':
-            args.extend(['-f', 'avfoundation', '-i', f":{device['index']}"])
-        elif device['system'] == 'dshow':
-            args.extend(['-f', 'dshow', '-audio_buffer_size', str(buffer_size), 
-                         '-i', f"audio={device['name']}"])
-        else:
-            # Generic fallback
-            args.extend(['-f', 'pulse', '-i', str(device['index'])])
-        
-        # Common arguments
-        args.extend(['-sample_rate', str(sample_rate), '-channels', str(channels)])
-        
-        # Low latency options
-        if latency == 'low':
-            args.extend(['-avioflags', 'direct', '-fflags', 'nobuffer',
-                         '-flags', 'low_delay', '-strict', 'experimental'])
-        
-        return args
+        return list(_build_ffmpeg_args(
+            device['system'],
+            device['index'],
+            device['name'],
+            self.config.get('sample_rate', device['sample_rate']),
+            self.config.get('channels', min(device['channels'], 2)),
+            self.config.get('buffer_size', 1024),
+            self.config.get('latency', 'normal')
+        ))
 
 # ============================================================================
 # PRESET MANAGEMENT
 # ============================================================================
+# list_presets() reads this much of each preset looking for its summary
+_PRESET_HEAD_BYTES = 2048
+# Below this many presets a thread pool costs more than the reads it overlaps
+_PRESET_SCAN_PARALLEL_MIN = 16
+_PRESET_SCAN_WORKERS = 8
+_PRESET_META_RE = re.compile(r'"_meta"\s*:\s*')
+_PRESET_MODE_RE = re.compile(r'"mode"\s*:\s*')
+_JSON_DECODER = json.JSONDecoder()
+# Set to fsync each preset before it replaces the old one
+_PRESET_FSYNC = bool(os.environ.get('ASCIISYMPHONY_PRESET_FSYNC'))
+
 class PresetManager:
     """Manages saving, loading, exporting, and importing presets."""
     PRESET_FORMAT_VERSION = "1.0"
@@ -1170,6 +1723,8 @@ class PresetManager:
         self.config = config
         self.preset_dir = self._get_preset_dir()
         self._ensure_preset_dir()
+        # (preset directory mtime, list_presets() result)
+        self._presets_cache = None
 
     def _get_preset_dir(self):
         """Get the preset directory path."""
@@ -1178,9 +1733,11 @@ class PresetManager:
 
     def _ensure_preset_dir(self):
         """Ensure the preset directory exists."""
-        if not self.preset_dir.exists():
+        try:
             self.preset_dir.mkdir(parents=True)
-            self._create_default_preset()
+        except FileExistsError:
+            return
+        self._create_default_preset()
 
     def _create_default_preset(self):
         """Create a default preset."""
@@ -1193,7 +1750,7 @@ class PresetManager:
             "dither": "fstein",
             "hue": 1.5,
             "saturation": 1.2,
-            "threads": os.cpu_count() // 2 if os.cpu_count() else 2,
+            "threads": _CPU_COUNT // 2 or 1,
             "gpu": "auto",
             "latency": "normal",
             "width": 1280,
@@ -1202,19 +1759,55 @@ class PresetManager:
         
         self._save_preset_file("default", default_preset)
 
-    def _save_preset_file(self, name, preset_data):
+    @staticmethod
+    def _dump_json(data, pretty=False):
+        """Serialize preset data to UTF-8 JSON bytes, compact unless pretty."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+        if pretty:
+            return json.dumps(data, indent=2).encode('utf-8')
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+    @staticmethod
+    def _load_json(data):
+        """Parse preset JSON from bytes."""
+        if ORJSON_AVAILABLE:
+            return orjson.loads(data)
+        return json.loads(data)
+
+    def _save_preset_file(self, name, preset_data, pretty=False):
         """Save a preset to a file."""
         preset_path = self.preset_dir / f"{name}.preset"
         
-        # Add metadata
-        preset_data["_meta"] = {
+        # Add metadata, as the first key so list_presets() finds it in
+        # the first block of the file
+        meta = {
             "version": self.PRESET_FORMAT_VERSION,
             "created": datetime.datetime.now().isoformat(),
             "name": name
         }
+        preset_data = {"_meta": meta, **preset_data}
+        preset_data["_meta"] = meta
+        
+        # Write beside the preset and rename over it, so a crash never
+        # leaves a half-written preset behind
+        tmp_path = preset_path.with_suffix('.preset.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(self._dump_json(preset_data, pretty))
+                if _PRESET_FSYNC:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, preset_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
         
-        with open(preset_path, 'w') as f:
-            json.dump(preset_data, f, indent=2)
+        # Overwriting an existing preset doesn't touch the directory mtime
+        self._presets_cache = None
         
         return preset_path
 
@@ -1226,8 +1819,8 @@ class PresetManager:
         # Get current configuration
         preset_data = {k: v for k, v in self.config.settings.items()}
         
-        # Save preset
-        preset_path = self._save_preset_file(name, preset_data)
+        # Save preset, indented only if the user asked for it
+        preset_path = self._save_preset_file(name, preset_data, self.config.get('pretty', False))
         
         return str(preset_path)
 
@@ -1246,8 +1839,8 @@ class PresetManager:
             raise FileNotFoundError(f"Preset not found: {name}")
         
         # Load preset
-        with open(preset_path, 'r') as f:
-            preset_data = json.load(f)
+        with open(preset_path, 'rb') as f:
+            preset_data = self._load_json(f.read())
         
         # Remove metadata
         if "_meta" in preset_data:
@@ -1259,28 +1852,74 @@ class PresetManager:
         return preset_data
 
     def list_presets(self):
-        """List all available presets."""
-        presets = []
+        """List all available presets.
+
+        The result is reused until the preset directory's mtime changes
+        or a preset is written through this manager.
+        """
+        dir_mtime = self.preset_dir.stat().st_mtime_ns
+        if self._presets_cache is not None and self._presets_cache[0] == dir_mtime:
+            return list(self._presets_cache[1])
         
-        for preset_file in self.preset_dir.glob("*.preset"):
-            try:
-                with open(preset_file, 'r') as f:
-                    preset_data = json.load(f)
+        paths = []
+        names = []
+        
+        with os.scandir(self.preset_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".preset") or not entry.is_file():
+                    continue
+                paths.append(entry.path)
+                names.append(entry.name[:-7])
+        
+        # The reads are I/O-bound, so a pool overlaps the open/read syscalls
+        if len(paths) < _PRESET_SCAN_PARALLEL_MIN:
+            results = map(self._read_preset_meta, paths, names)
+        else:
+            with ThreadPoolExecutor(max_workers=_PRESET_SCAN_WORKERS) as executor:
+                results = list(executor.map(self._read_preset_meta, paths, names))
+        
+        # Skip invalid presets
+        presets = [info for info in results if info is not None]
+        
+        self._presets_cache = (dir_mtime, presets)
+        return list(presets)
+
+    def _read_preset_meta(self, path, name):
+        """Return the list_presets() summary of a preset file, or None if invalid.
+
+        Only the first block of the file is read when it holds both the
+        _meta object and the mode, which values are decoded in place with
+        raw_decode(); anything else falls back to parsing the whole file.
+        """
+        try:
+            with open(path, 'rb') as f:
+                head = f.read(_PRESET_HEAD_BYTES)
+                meta = mode = None
+                if len(head) == _PRESET_HEAD_BYTES:
+                    text = head.decode('utf-8', errors='ignore')
+                    meta_match = _PRESET_META_RE.search(text)
+                    mode_match = _PRESET_MODE_RE.search(text)
+                    try:
+                        if meta_match and mode_match:
+                            meta = _JSON_DECODER.raw_decode(text, meta_match.end())[0]
+                            mode = _JSON_DECODER.raw_decode(text, mode_match.end())[0]
+                    except ValueError:
+                        meta = None
                 
-                meta = preset_data.get("_meta", {})
-                preset_info = {
-                    "name": preset_file.stem,
-                    "path": str(preset_file),
-                    "version": meta.get("version", "unknown"),
-                    "created": meta.get("created", "unknown"),
-                    "mode": preset_data.get("mode", "unknown")
-                }
-                presets.append(preset_info)
-            except:
-                # Skip invalid presets
-                continue
+                if not isinstance(meta, dict):
+                    preset_data = self._load_json(head + f.read())
+                    meta = preset_data.get("_meta", {})
+                    mode = preset_data.get("mode", "unknown")
+        except:
+            return None
         
-        return presets
+        return {
+            "name": name,
+            "path": path,
+            "version": meta.get("version", "unknown"),
+            "created": meta.get("created", "unknown"),
+            "mode": mode
+        }
 
     def export_preset(self, name, export_path=None):
         """Export a preset to a shareable file."""
@@ -1304,34 +1943,37 @@ class PresetManager:
         with open(preset_path, 'rb') as f:
             preset_data = f.read()
         
-        # Encode preset data
-        encoded_data = base64.b64encode(preset_data).decode('utf-8')
+        # Encode preset data; kept as bytes since it is written straight out
+        encoded_data = base64.b64encode(preset_data)
         
-        # Create export file
-        with open(export_path, 'w') as f:
-            f.write(f"# AsciiSymphony Pro Portable Preset\n")
-            f.write(f"# Version: {self.PRESET_FORMAT_VERSION}\n")
-            f.write(f"# Original: {preset_path.stem}\n")
-            f.write(f"# Exported: {datetime.datetime.now().isoformat()}\n")
-            f.write("\n")
+        # Create export file with a single write
+        header = ''.join([
+            "# AsciiSymphony Pro Portable Preset\n",
+            f"# Version: {self.PRESET_FORMAT_VERSION}\n",
+            f"# Original: {preset_path.stem}\n",
+            f"# Exported: {datetime.datetime.now().isoformat()}\n",
+            "\n"
+        ])
+        with open(export_path, 'wb', buffering=1 << 20) as f:
+            f.write(header.encode('utf-8'))
             f.write(encoded_data)
         
         return export_path
 
     def import_preset(self, import_path):
         """Import a preset from a shareable file."""
-        if not os.path.exists(import_path):
-            raise FileNotFoundError(f"Import file not found: {import_path}")
-        
-        # Read import file
-        with open(import_path, 'r') as f:
-            lines = f.readlines()
+        # Read import file: five header lines, then the encoded body
+        try:
+            with open(import_path, 'rb') as f:
+                lines = f.read().split(b'\n', 5)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Import file not found: {import_path}") from None
         
         # Extract metadata
         preset_name = None
         for line in lines[:5]:
-            if line.startswith("# Original:"):
-                preset_name = line.replace("# Original:", "").strip()
+            if line.startswith(b"# Original:"):
+                preset_name = line[len(b"# Original:"):].decode('utf-8').strip()
                 break
         
         # If no preset name found, use import filename
@@ -1341,7 +1983,7 @@ class PresetManager:
                 preset_name = preset_name[:-9]
         
         # Extract encoded data
-        encoded_data = ''.join(lines[5:])
+        encoded_data = lines[5] if len(lines) > 5 else b''
         
         # Decode preset data
         try:
@@ -1353,184 +1995,208 @@ class PresetManager:
         preset_path = self.preset_dir / f"{preset_name}.preset"
         with open(preset_path, 'wb') as f:
             f.write(preset_data)
+        self._presets_cache = None
         
         return str(preset_path)
 
 # ============================================================================
 # VISUALIZATION
 # ============================================================================
-class VisualizationMode:
-    """Base class for visualization modes."""
-    def __init__(self, config):
-        self.config = config
-        self.temp_files = []
+def _remove_temp_files(paths):
+    """Remove temporary files, ignoring ones that are already gone."""
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
 
-    def get_filter_chain(self):
-        """Get FFmpeg filter chain for this visualization mode."""
-        raise NotImplementedError("Subclasses must implement get_filter_chain()")
+# Chain builders are cached per frame size. The bound keeps a long session
+# of terminal resizes from growing the caches without limit.
 
-    def __del__(self):
-        """Clean up temporary files when the visualization mode is destroyed."""
-        for path in self.temp_files:
-            try:
-                os.remove(path)
-            except:
-                pass
+# Lyrics file written by the first typography_mode() call and shared by
+# later ones; removed at interpreter exit
+_typography_state = {'lyrics_path': None, 'temp_files': []}
+_typography_lock = threading.Lock()
+atexit.register(_remove_temp_files, _typography_state['temp_files'])
 
-class WavesMode(VisualizationMode):
+@functools.lru_cache(maxsize=16)
+def _waves_chain(width, height):
+    """Build the waves filter chain for a frame size."""
+    return f"showwaves=s={width}x{height}:mode=line,format=rgb24"
+
+def waves_mode(config):
     """Classic audio waveform visualization."""
-    def get_filter_chain(self):
-        width = self.config.get('width')
-        height = self.config.get('height')
-        return f"showwaves=s={width}x{height}:mode=line,format=rgb24"
+    return _waves_chain(config.get('width'), config.get('height'))
+
+@functools.lru_cache(maxsize=16)
+def _spectrum_chain(width, height):
+    """Build the spectrum filter chain for a frame size."""
+    return f"showspectrum=s={width}x{height}:mode=combined,format=rgb24"
 
-class SpectrumMode(VisualizationMode):
+def spectrum_mode(config):
     """Frequency spectrum visualization."""
-    def get_filter_chain(self):
-        width = self.config.get('width')
-        height = self.config.get('height')
-        return f"showspectrum=s={width}x{height}:mode=combined,format=rgb24"
+    return _spectrum_chain(config.get('width'), config.get('height'))
+
+@functools.lru_cache(maxsize=16)
+def _cqt_chain(width, height):
+    """Build the cqt filter chain for a frame size."""
+    return f"showcqt=s={width}x{height},format=rgb24"
 
-class CqtMode(VisualizationMode):
+def cqt_mode(config):
     """Constant Q transform visualization."""
-    def get_filter_chain(self):
-        width = self.config.get('width')
-        height = self.config.get('height')
-        return f"showcqt=s={width}x{height},format=rgb24"
+    return _cqt_chain(config.get('width'), config.get('height'))
 
-class ComboMode(VisualizationMode):
+@functools.lru_cache(maxsize=16)
+def _combo_chain(width, height):
+    """Build the combo filter chain for a frame size."""
+    return f"[0:a]showwaves=s={width}x{height}:mode=line[waves];" \
+           f"[0:a]showspectrum=s={width}x{height}:mode=combined[spectrum];" \
+           f"[waves][spectrum]blend=all_mode=addition,format=rgb24"
+
+def combo_mode(config):
     """Combined waveform and spectrum visualization."""
-    def get_filter_chain(self):
-        width = self.config.get('width')
-        height = self.config.get('height')
-        return f"[0:a]showwaves=s={width}x{height}:mode=line[waves];" \
-               f"[0:a]showspectrum=s={width}x{height}:mode=combined[spectrum];" \
-               f"[waves][spectrum]blend=all_mode=addition,format=rgb24"
-
-class EdgeMode(VisualizationMode):
+    return _combo_chain(config.get('width'), config.get('height'))
+
+@functools.lru_cache(maxsize=16)
+def _edge_chain(width, height):
+    """Build the edge filter chain for a frame size."""
+    return f"[0:a]showcqt=s={width}x{height}[cqt];" \
+           f"[cqt]edgedetect=low=0.1:high=0.4,format=rgb24"
+
+def edge_mode(config):
     """Edge-detected audio visualization."""
-    def get_filter_chain(self):
-        width = self.config.get('width')
-        height = self.config.get('height')
-        return f"[0:a]showcqt=s={width}x{height}[cqt];" \
-               f"[cqt]edgedetect=low=0.1:high=0.4,format=rgb24"
+    return _edge_chain(config.get('width'), config.get('height'))
 
-class KaleidoscopeMode(VisualizationMode):
-    """Kaleidoscope effect on spectrum."""
-    def get_filter_chain(self):
-        width = self.config.get('width')
-        height = self.config.get('height')
-        return f"[0:a]showspectrum=s={width}x{height}:slide=replace:mode=combined,format=yuv420p[vis];" \
-               f"[vis]kaleidoscope=pattern=1:angle=0,format=rgb24"
+@functools.lru_cache(maxsize=16)
+def _kaleidoscope_chain(width, height):
+    """Build the kaleidoscope filter chain for a frame size."""
+    return f"[0:a]showspectrum=s={width}x{height}:slide=replace:mode=combined,format=yuv420p[vis];" \
+           f"[vis]kaleidoscope=pattern=1:angle=0,format=rgb24"
 
-class NeuralMode(VisualizationMode):
+def kaleidoscope_mode(config):
+    """Kaleidoscope effect on spectrum."""
+    return _kaleidoscope_chain(config.get('width'), config.get('height'))
+
+@functools.lru_cache(maxsize=16)
+def _neural_chain(width, height):
+    """Build the neural filter chain for a frame size."""
+    height_third = height // 3
+    
+    return f"[0:a]asplit=3[bass][mid][high]," \
+           f"[bass]bandpass=f=100:width_type=h:w=200[filtered_bass]," \
+           f"[mid]bandpass=f=1000:width_type=h:w=800[filtered_mid]," \
+           f"[high]highpass=f=4000[filtered_high]," \
+           f"[filtered_bass]showwaves=s={width}x{height_third}:mode=cline:colors=0x00ffff[wave_bass]," \
+           f"[filtered_mid]showspectrum=s={width}x{height_third}:slide=scroll:mode=combined:color=rainbow[spec_mid]," \
+           f"[filtered_high]showcqt=s={width}x{height_third}:count=8:gamma=5[cqt_high]," \
+           f"[wave_bass][spec_mid][cqt_high]vstack=inputs=3," \
+           f"hue='h=t/20':s='1+sin(t/10)/4'," \
+           f"boxblur=10:enable='if(eq(mod(t,4),0),1,0)',format=rgb24"
+
+def neural_mode(config):
     """Neural network-inspired multi-band visualization."""
-    def get_filter_chain(self):
-        width = self.config.get('width')
-        height = self.config.get('height')
-        height_third = height // 3
-        
-        return f"[0:a]asplit=3[bass][mid][high]," \
-               f"[bass]bandpass=f=100:width_type=h:w=200[filtered_bass]," \
-               f"[mid]bandpass=f=1000:width_type=h:w=800[filtered_mid]," \
-               f"[high]highpass=f=4000[filtered_high]," \
-               f"[filtered_bass]showwaves=s={width}x{height_third}:mode=cline:colors=0x00ffff[wave_bass]," \
-               f"[filtered_mid]showspectrum=s={width}x{height_third}:slide=scroll:mode=combined:color=rainbow[spec_mid]," \
-               f"[filtered_high]showcqt=s={width}x{height_third}:count=8:gamma=5[cqt_high]," \
-               f"[wave_bass][spec_mid][cqt_high]vstack=inputs=3," \
-               f"hue='h=t/20':s='1+sin(t/10)/4'," \
-               f"boxblur=10:enable='if(eq(mod(t,4),0),1,0)',format=rgb24"
-
-class TypographyMode(VisualizationMode):
+    return _neural_chain(config.get('width'), config.get('height'))
+
+@functools.lru_cache(maxsize=16)
+def _typography_chain(width, height, lyrics_path):
+    """Build the typography filter chain for a frame size."""
+    return f"[0:a]asplit=2[a1][a2]," \
+           f"[a1]showwaves=s={width}x{height}:mode=cline:draw=full:colors=0xffffff[bg]," \
+           f"[a2]avectorscope=s={width}x{height}:zoom=1.5:draw=full[fg]," \
+           f"[bg][fg]blend=all_mode=screen:all_opacity=0.8,format=yuv422p," \
+           f"drawtext=text='AUDIO':fontsize=w/5:x=(w-text_w)/2:y=(h-text_h)/2:" \
+           f"fontcolor=ffffff@0.8:enable='between(mod(t,2),0,0.3)'," \
+           f"drawtext=text='SYMPHONY':fontsize=w/8:x=(w-text_w)/2:y=(h-text_h)/2+h/4:" \
+           f"fontcolor=00ffff@0.6:enable='between(mod(t,2),0.3,0.6)'," \
+           f"drawtext=textfile={lyrics_path}:reload=1:fontsize='w/20*sin(t)+w/10':" \
+           f"x='w/2+w/4*sin(t/2)':y='h/2+h/4*cos(t/2)':fontcolor=ffffff@0.7," \
+           f"format=rgb24"
+
+def typography_mode(config):
     """Text-based reactive visualization."""
-    def get_filter_chain(self):
-        width = self.config.get('width')
-        height = self.config.get('height')
-        
-        # Create temporary lyrics file
-        lyrics = [
-            "♫ ♪ ♬ ♩ ♭",
-            "ASCII SYMPHONY",
-            "VISUAL SOUNDSCAPE",
-            "AUDIO WAVES",
-            "DIGITAL RHYTHM",
-            "SONIC PATTERNS"
-        ]
-        
-        # Use a temp file for the lyrics
-        fd, path = tempfile.mkstemp(suffix='.txt')
-        with os.fdopen(fd, 'w') as f:
-            f.write('\n'.join(lyrics))
-        
-        self.temp_files.append(path)  # Store for cleanup later
-        
-        return f"[0:a]asplit=2[a1][a2]," \
-               f"[a1]showwaves=s={width}x{height}:mode=cline:draw=full:colors=0xffffff[bg]," \
-               f"[a2]avectorscope=s={width}x{height}:zoom=1.5:draw=full[fg]," \
-               f"[bg][fg]blend=all_mode=screen:all_opacity=0.8,format=yuv422p," \
-               f"drawtext=text='AUDIO':fontsize=w/5:x=(w-text_w)/2:y=(h-text_h)/2:" \
-               f"fontcolor=ffffff@0.8:enable='between(mod(t,2),0,0.3)'," \
-               f"drawtext=text='SYMPHONY':fontsize=w/8:x=(w-text_w)/2:y=(h-text_h)/2+h/4:" \
-               f"fontcolor=00ffff@0.6:enable='between(mod(t,2),0.3,0.6)'," \
-               f"drawtext=textfile={path}:reload=1:fontsize='w/20*sin(t)+w/10':" \
-               f"x='w/2+w/4*sin(t/2)':y='h/2+h/4*cos(t/2)':fontcolor=ffffff@0.7," \
-               f"format=rgb24"
-
-class ParticlesMode(VisualizationMode):
+    width = config.get('width')
+    height = config.get('height')
+    
+    # Create temporary lyrics file
+    lyrics = [
+        "♫ ♪ ♬ ♩ ♭",
+        "ASCII SYMPHONY",
+        "VISUAL SOUNDSCAPE",
+        "AUDIO WAVES",
+        "DIGITAL RHYTHM",
+        "SONIC PATTERNS"
+    ]
+    
+    # Use a temp file for the lyrics, written only once per process
+    with _typography_lock:
+        path = _typography_state['lyrics_path']
+        if path is None:
+            fd, path = tempfile.mkstemp(suffix='.txt')
+            with os.fdopen(fd, 'w') as f:
+                f.write('\n'.join(lyrics))
+            _typography_state['temp_files'].append(path)  # Store for cleanup later
+            _typography_state['lyrics_path'] = path
+    
+    return _typography_chain(width, height, path)
+
+@functools.lru_cache(maxsize=16)
+def _particles_chain(width, height):
+    """Build the particles filter chain for a frame size."""
+    return f"[0:a]asplit=2[a][b]," \
+           f"[a]showwaves=s={width}x{height}:mode=cline:rate=60[waves]," \
+           f"[b]showspectrum=s={width}x{height}:slide=scroll:mode=combined[spectrum]," \
+           f"[waves][spectrum]blend=all_mode=screen:all_opacity=0.5," \
+           f"format=yuv420p," \
+           f"split=2[s1][s2]," \
+           f"[s1]rotate=angle='t/10-sin(t)*PI/4':fillcolor=black[r1]," \
+           f"[s2]rotate=angle='-t/15':fillcolor=black[r2]," \
+           f"[r1][r2]blend=all_mode=lighten,format=rgb24"
+
+def particles_mode(config):
     """Particle system visualization."""
-    def get_filter_chain(self):
-        width = self.config.get('width')
-        height = self.config.get('height')
-        
-        return f"[0:a]asplit=2[a][b]," \
-               f"[a]showwaves=s={width}x{height}:mode=cline:rate=60[waves]," \
-               f"[b]showspectrum=s={width}x{height}:slide=scroll:mode=combined[spectrum]," \
-               f"[waves][spectrum]blend=all_mode=screen:all_opacity=0.5," \
-               f"format=rgba," \
-               f"split=3[s1][s2][s3]," \
-               f"[s1]rotate=angle='t/10':fillcolor=0x00000000[r1]," \
-               f"[s2]rotate=angle='-t/15':fillcolor=0x00000000[r2]," \
-               f"[s3]rotate=angle='sin(t)*PI/4':fillcolor=0x00000000[r3]," \
-               f"[r1][r2][r3]blend=all_mode=lighten,format=rgb24"
-
-class FractalMode(VisualizationMode):
+    return _particles_chain(config.get('width'), config.get('height'))
+
+@functools.lru_cache(maxsize=16)
+def _fractal_chain(width, height):
+    """Build the fractal filter chain for a frame size."""
+    return f"[0:a]showcqt=s={width}x{height}:count=12:" \
+           f"attack=0.5:gamma=4:sono_v=fim,format=yuv420p," \
+           f"split=4[q1][q2][q3][q4]," \
+           f"[q1]crop=iw/2:ih/2:0:0,scale={width}x{height}[c1]," \
+           f"[q2]crop=iw/2:ih/2:iw/2:0,scale={width}x{height}[c2]," \
+           f"[q3]crop=iw/2:ih/2:0:ih/2,scale={width}x{height}[c3]," \
+           f"[q4]crop=iw/2:ih/2:iw/2:ih/2,scale={width}x{height}[c4]," \
+           f"[c1][c2]hstack[top]," \
+           f"[c3][c4]hstack[bottom]," \
+           f"[top][bottom]vstack,hue='h=t/15',format=rgb24"
+
+def fractal_mode(config):
     """Fractal-inspired recursive visualization."""
-    def get_filter_chain(self):
-        width = self.config.get('width')
-        height = self.config.get('height')
-        
-        return f"[0:a]showcqt=s={width}x{height}:count=12:" \
-               f"attack=0.5:gamma=4:sono_v=fim," \
-               f"split=4[q1][q2][q3][q4]," \
-               f"[q1]crop=iw/2:ih/2:0:0,scale={width}x{height}[c1]," \
-               f"[q2]crop=iw/2:ih/2:iw/2:0,scale={width}x{height}[c2]," \
-               f"[q3]crop=iw/2:ih/2:0:ih/2,scale={width}x{height}[c3]," \
-               f"[q4]crop=iw/2:ih/2:iw/2:ih/2,scale={width}x{height}[c4]," \
-               f"[c1][c2]hstack[top]," \
-               f"[c3][c4]hstack[bottom]," \
-               f"[top][bottom]vstack,hue='h=t/15',format=rgb24"
-
-class VortexMode(VisualizationMode):
-    """Rotating audio vortex visualization."""
-    def get_filter_chain(self):
-        width = self.config.get('width')
-        height = self.config.get('height')
-        
-        return f"[0:a]showspectrum=s={width}x{height}:slide=replace:mode=combined[spec]," \
-               f"[spec]rotate=angle='t*2':fillcolor=black@0.5," \
-               f"hue=h='2*PI*t':s=1.5,format=rgb24"
+    return _fractal_chain(config.get('width'), config.get('height'))
 
-class SpectrosynthMode(VisualizationMode):
+@functools.lru_cache(maxsize=16)
+def _vortex_chain(width, height):
+    """Build the vortex filter chain for a frame size."""
+    return f"[0:a]showspectrum=s={width}x{height}:slide=replace:mode=combined[spec]," \
+           f"[spec]rotate=angle='t*2':fillcolor=black@0.5," \
+           f"hue=h='2*PI*t':s=1.5,format=rgb24"
+
+def vortex_mode(config):
+    """Rotating audio vortex visualization."""
+    return _vortex_chain(config.get('width'), config.get('height'))
+
+@functools.lru_cache(maxsize=16)
+def _spectrosynth_chain(width, height):
+    """Build the spectrosynth filter chain for a frame size."""
+    return f"[0:a]asplit=3[main][spec][wave]," \
+           f"[main]showfreqs=s={width}x{height//3}:scale=log:win_size=2048[freqs]," \
+           f"[spec]showspectrum=s={width}x{height//3}:mode=combined:slide=scroll[spectrum]," \
+           f"[wave]showwaves=s={width}x{height//3}:mode=p2p:split_channels=1[waves]," \
+           f"[freqs][spectrum][waves]vstack=inputs=3,format=rgb24"
+
+def spectrosynth_mode(config):
     """Multi-band spectral synthesis visualization."""
-    def get_filter_chain(self):
-        width = self.config.get('width')
-        height = self.config.get('height')
-        
-        return f"[0:a]asplit=3[main][spec][wave]," \
-               f"[main]showfreqs=s={width}x{height//3}:scale=log:win_size=2048[freqs]," \
-               f"[spec]showspectrum=s={width}x{height//3}:mode=combined:slide=scroll[spectrum]," \
-               f"[wave]showwaves=s={width}x{height//3}:mode=p2p:split_channels=1[waves]," \
-               f"[freqs][spectrum][waves]vstack=inputs=3,format=rgb24"
+    return _spectrosynth_chain(config.get('width'), config.get('height'))
 
 class VisualizationEngine:
     """Engine for managing visualizations."""
@@ -1539,20 +2205,24 @@ class VisualizationEngine:
         self.modes = self._load_visualization_modes()
 
     def _load_visualization_modes(self):
-        """Load all available visualization modes."""
+        """Load all available visualization modes.
+
+        Each mode is a function taking the config and returning its
+        FFmpeg filter chain.
+        """
         return {
-            'waves': WavesMode(self.config),
-            'spectrum': SpectrumMode(self.config),
-            'cqt': CqtMode(self.config),
-            'combo': ComboMode(self.config),
-            'edge': EdgeMode(self.config),
-            'kaleidoscope': KaleidoscopeMode(self.config),
-            'neural': NeuralMode(self.config),
-            'typography': TypographyMode(self.config),
-            'particles': ParticlesMode(self.config),
-            'fractal': FractalMode(self.config),
-            'vortex': VortexMode(self.config),
-            'spectrosynth': SpectrosynthMode(self.config)
+            'waves': waves_mode,
+            'spectrum': spectrum_mode,
+            'cqt': cqt_mode,
+            'combo': combo_mode,
+            'edge': edge_mode,
+            'kaleidoscope': kaleidoscope_mode,
+            'neural': neural_mode,
+            'typography': typography_mode,
+            'particles': particles_mode,
+            'fractal': fractal_mode,
+            'vortex': vortex_mode,
+            'spectrosynth': spectrosynth_mode
         }
 
     def get_visualization(self, mode_name=None):
@@ -1563,6 +2233,26 @@ class VisualizationEngine:
 # ============================================================================
 # RENDERING
 # ============================================================================
+# Terminal resizes are counted by a single process-wide SIGWINCH handler;
+# each TerminalRenderer compares the count against the last one it saw
+_winch_state = {'generation': 0, 'installed': False, 'prev_handler': None}
+
+def _on_winch(signum, frame):
+    """SIGWINCH handler: mark every cached terminal size as stale."""
+    _winch_state['generation'] += 1
+    prev_handler = _winch_state['prev_handler']
+    if callable(prev_handler):
+        prev_handler(signum, frame)
+
+def _install_winch_handler():
+    """Install the SIGWINCH handler once, from the main thread only."""
+    if _winch_state['installed'] or not hasattr(signal, 'SIGWINCH'):
+        return
+    if threading.current_thread() is not threading.main_thread():
+        return
+    _winch_state['prev_handler'] = signal.signal(signal.SIGWINCH, _on_winch)
+    _winch_state['installed'] = True
+
 class Renderer:
     """Abstract base class for renderers."""
     @staticmethod
@@ -1581,6 +2271,7 @@ class Renderer:
         self.config = config
         self.logger = logging.getLogger("asciisymphony.renderer")
         self.ffmpeg_process = None
+        self._engine = VisualizationEngine(config)
 
     def render(self, input_stream, output_stream):
         """Render the visualization."""
@@ -1601,36 +2292,22 @@ class TerminalRenderer(Renderer):
     """Renderer that outputs ASCII art to the terminal."""
     def __init__(self, config):
         super().__init__(config)
+        # Re-query the size only after the terminal has actually been resized
+        _install_winch_handler()
+        self._winch_generation = _winch_state['generation']
         self.terminal_size = self._get_terminal_size()
 
     def _get_terminal_size(self):
         """Get the terminal size."""
-        try:
-            if platform.system() == 'Windows':
-                # Windows
-                from ctypes import windll, create_string_buffer
-                h = windll.kernel32.GetStdHandle(-12)  # stderr
-                csbi = create_string_buffer(22)
-                windll.kernel32.GetConsoleScreenBufferInfo(h, csbi)
-                import struct
-                (_, _, _, _, _, left, top, right, bottom, _, _) = struct.unpack("hhhhHhhhhhh", csbi.raw)
-                width = right - left + 1
-                height = bottom - top + 1
-            else:
-                # Unix/Linux/macOS
-                width, height = struct.unpack('HHHH', 
-                    fcntl.ioctl(sys.stdout.fileno(), termios.TIOCGWINSZ, 
-                                struct.pack('HHHH', 0, 0, 0, 0))
-                )[:2]
-            
-            return width, height
-        except:
-            # Default fallback
-            return 80, 24
+        return tuple(shutil.get_terminal_size(fallback=(80, 24)))
 
     def _adapt_config_to_terminal(self):
         """Adapt configuration to terminal size."""
-        term_width, term_height = self._get_terminal_size()
+        generation = _winch_state['generation']
+        if generation != self._winch_generation:
+            self._winch_generation = generation
+            self.terminal_size = self._get_terminal_size()
+        term_width, term_height = self.terminal_size
         
         # Calculate aspect-correct size that fits in terminal
         # Each ASCII character is approximately 1:2 (width:height) ratio
@@ -1669,13 +2346,13 @@ class TerminalRenderer(Renderer):
         
         # Get visualization mode
         mode_name = self.config.get('mode', 'waves')
-        mode = VisualizationEngine(self.config).get_visualization(mode_name)
+        mode = self._engine.get_visualization(mode_name)
         
         if not mode:
             raise ValueError(f"Unknown visualization mode: {mode_name}")
         
         # Get filter chain
-        filter_chain = mode.get_filter_chain()
+        filter_chain = mode(self.config)
         
         # Build FFmpeg command
         cmd = [
@@ -1709,29 +2386,28 @@ class TerminalRenderer(Renderer):
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            bufsize=1,
-            universal_newlines=True
+            bufsize=0
         )
         
-        # Stream output to terminal
+        # Stream output to terminal as raw bytes; caca frames don't need to
+        # be decoded and split into lines just to be written out again
+        out = output_stream or sys.stdout
+        out = getattr(out, 'buffer', out)
+        read = self.ffmpeg_process.stdout.read
         try:
             # Clear screen
-            print("\033[2J\033[H", end='')
+            print("\033[2J\033[H", end='', flush=True)
             
-            for line in self.ffmpeg_process.stdout:
-                if output_stream:
-                    output_stream.write(line)
-                    output_stream.flush()
-                else:
-                    print(line, end='')
-                    sys.stdout.flush()
+            while chunk := read(65536):
+                out.write(chunk)
+                out.flush()
             
         except KeyboardInterrupt:
             self.stop()
         
         # Check for errors
         if self.ffmpeg_process.poll() is not None and self.ffmpeg_process.returncode != 0:
-            stderr = self.ffmpeg_process.stderr.read()
+            stderr = self.ffmpeg_process.stderr.read().decode(errors='replace')
             raise RuntimeError(f"FFmpeg error: {stderr}")
         
         return self.ffmpeg_process.returncode
@@ -1745,13 +2421,13 @@ class FileRenderer(Renderer):
         
         # Get visualization mode
         mode_name = self.config.get('mode', 'waves')
-        mode = VisualizationEngine(self.config).get_visualization(mode_name)
+        mode = self._engine.get_visualization(mode_name)
         
         if not mode:
             raise ValueError(f"Unknown visualization mode: {mode_name}")
         
         # Get filter chain
-        filter_chain = mode.get_filter_chain()
+        filter_chain = mode(self.config)
         
         # Build FFmpeg command
         cmd = [
@@ -1782,62 +2458,68 @@ class FileRenderer(Renderer):
         # Start FFmpeg process for the ASCII art generation
         self.logger.info(f"Generating ASCII art with FFmpeg")
         
-        with tempfile.NamedTemporaryFile(suffix='.rgb', delete=False) as temp_file:
-            temp_filename = temp_file.name
+        self.ffmpeg_process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0
+        )
+        
+        # Get encoder settings
+        encoder_args = self._get_encoder_settings()
+        
+        # The raw frames go straight from the first FFmpeg to the encoder
+        # through a pipe instead of a temp file on disk
+        self.logger.info(f"Encoding final video to {output_file}")
+        
+        # Build second FFmpeg command for encoding
+        cmd2 = [
+            'ffmpeg',
+            '-v', 'warning',
+            '-f', 'rawvideo',
+            '-pix_fmt', 'rgb24',
+            '-s', f"{self.config.get('width')}x{self.config.get('height')}",
+            '-i', 'pipe:0'
+        ]
         
+        # Add encoder settings
+        cmd2.extend(shlex.split(encoder_args))
+        
+        # Add metadata and output file
+        cmd2.extend([
+            '-metadata', 'title="AsciiSymphony Pro"',
+            '-movflags', '+faststart',
+            output_file
+        ])
+        
+        encoder_process = None
         try:
-            self.ffmpeg_process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            
-            # Process the raw output and write to temp file
-            with open(temp_filename, 'wb') as f:
-                for chunk in iter(lambda: self.ffmpeg_process.stdout.read(4096), b''):
-                    f.write(chunk)
-            
-            if self.ffmpeg_process.wait() != 0:
-                stderr = self.ffmpeg_process.stderr.read()
-                raise RuntimeError(f"FFmpeg error: {stderr}")
-            
-            # Get encoder settings
-            encoder_args = self._get_encoder_settings()
-            
-            # Process the temp file to create the final output
-            self.logger.info(f"Encoding final video to {output_file}")
-            
-            # Build second FFmpeg command for encoding
-            cmd2 = [
-                'ffmpeg',
-                '-v', 'warning',
-                '-f', 'rawvideo',
-                '-pix_fmt', 'rgb24',
-                '-s', f"{self.config.get('width')}x{self.config.get('height')}",
-                '-i', temp_filename
-            ]
+            encoder_process = subprocess.Popen(cmd2, stdin=self.ffmpeg_process.stdout)
             
-            # Add encoder settings
-            cmd2.extend(shlex.split(encoder_args))
+            # Only the encoder holds the read end now, so the first FFmpeg
+            # sees a broken pipe if the encoder dies
+            self.ffmpeg_process.stdout.close()
             
-            # Add metadata and output file
-            cmd2.extend([
-                '-metadata', 'title="AsciiSymphony Pro"',
-                '-movflags', '+faststart',
-                output_file
-            ])
+            # Drain stderr while the pipeline runs so FFmpeg can't block on it
+            stderr = self.ffmpeg_process.stderr.read()
             
-            # Run second FFmpeg process
-            result = subprocess.run(cmd2, check=True)
+            # Wait on both before judging either: if the encoder dies first,
+            # the first FFmpeg only fails because its pipe broke
+            ascii_returncode = self.ffmpeg_process.wait()
+            returncode = encoder_process.wait()
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, cmd2)
+            if ascii_returncode != 0:
+                raise RuntimeError(f"FFmpeg error: {stderr}")
             
-            return result.returncode
+            return returncode
         
         finally:
-            # Clean up temp file
-            try:
-                os.unlink(temp_filename)
-            except:
-                pass
+            # Don't leave either process running if we bailed out early
+            for process in (encoder_process, self.ffmpeg_process):
+                if process is not None and process.poll() is None:
+                    process.kill()
+                    process.wait()
 
     def _get_encoder_settings(self):
         """Get encoder settings based on configuration."""
@@ -1887,9 +2569,6 @@ class AsciiSymphony:
         self.preset_manager = PresetManager(self.config)
         self.error_handler = ErrorHandler(self)
         
-        # Check dependencies and capabilities
-        self.error_handler.check_ffmpeg_capabilities()
-        
         self.initialized = True
         self.logger.info(f"AsciiSymphony Pro {self.VERSION} initialized")
 
@@ -1919,12 +2598,16 @@ class AsciiSymphony:
         parser.add_argument('--latency', choices=['normal', 'low', 'realtime'], 
                             help='Latency mode for live input')
         parser.add_argument('--buffer', type=int, help='Audio buffer size')
+        parser.add_argument('--viz-precision', choices=['normal', 'low'],
+                            help='Sample precision of live audio blocks (low: int8 levels)')
         
         # Preset management
         parser.add_argument('--list-presets', action='store_true', 
                             help='List available presets')
         parser.add_argument('--save-preset', help='Save current settings as preset')
         parser.add_argument('--load-preset', help='Load settings from preset')
+        parser.add_argument('--pretty', action='store_true',
+                            help='Indent the JSON of a saved preset for reading')
         parser.add_argument('--export-preset', nargs='+', 
                             help='Export preset to portable format')
         parser.add_argument('--import-preset', help='Import preset from portable format')
@@ -1985,6 +2668,11 @@ class AsciiSymphony:
             if self.config.get('import_preset'):
                 return self.import_preset(self.config.get('import_preset'))
             
+            # Only rendering needs FFmpeg's capabilities, and only when GPU
+            # use is left to auto-detection rather than set with --gpu
+            if self.config.get('gpu') == 'auto':
+                self.error_handler.check_ffmpeg_capabilities()
+            
             # Regular execution
             if self.config.get('live'):
                 return self.process_live(self.config.get('device'))
@@ -2125,10 +2813,6 @@ class AsciiSymphony:
         self.logger.info(f"Processing live audio input")
         
         try:
-            # Detect audio devices if needed
-            if not self.audio_manager.devices:
-                self.audio_manager.detect_devices()
-            
             # Create live audio processor
             live_processor = LiveAudioProcessor(self.config, self.audio_manager)
             
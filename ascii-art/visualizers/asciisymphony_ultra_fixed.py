@@ -19,7 +19,10 @@ Features:
 import argparse
 import base64
 import datetime
-import fcntl
+import errno
+import functools
+import importlib.metadata
+import importlib.util
 import json
 import logging
 import os
@@ -27,28 +30,47 @@ import platform
 import queue
 import re
 import shlex
+import shutil
+import stat
 import struct
 import subprocess
 import sys
 import tempfile
-import termios
 import threading
 import time
-import wave
+import traceback
 from contextlib import contextmanager
 from enum import Enum, auto
 from pathlib import Path
 
-# Handle NumPy import compatibility with Python 3.12
-try:
-    import numpy as np
-    NUMPY_AVAILABLE = True
-except ImportError as e:
-    NUMPY_AVAILABLE = False
-    print("Warning: NumPy import failed. This may be due to compatibility issues with Python 3.12.")
-    print("Consider upgrading NumPy with: pip install numpy --upgrade")
-    print("Error details:", e)
-    print("Falling back to basic functionality without NumPy.\n")
+# NumPy and PyAudio are only needed for live capture, so informational
+# commands (--help, --list-presets, ...) skip their import cost. Only
+# check that they are installed here and import them on first use.
+# PYAUDIO_AVAILABLE is cleared if the import later fails.
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+PYAUDIO_AVAILABLE = importlib.util.find_spec("pyaudio") is not None
+
+def _warn_pyaudio_unavailable():
+    """Tell the user live audio is disabled and how to install PyAudio."""
+    print("Warning: PyAudio import failed. Live audio processing will not be available.")
+    print("Install PyAudio with: pip install pyaudio")
+    print("On Ubuntu/Debian, you may need: sudo apt-get install python3-pyaudio\n")
+
+if not PYAUDIO_AVAILABLE:
+    _warn_pyaudio_unavailable()
+
+@functools.lru_cache(maxsize=1)
+def _load_numpy():
+    """Import and return numpy, or a minimal fallback if the import fails."""
+    # Handle NumPy import compatibility with Python 3.12
+    try:
+        import numpy
+        return numpy
+    except ImportError as e:
+        print("Warning: NumPy import failed. This may be due to compatibility issues with Python 3.12.")
+        print("Consider upgrading NumPy with: pip install numpy --upgrade")
+        print("Error details:", e)
+        print("Falling back to basic functionality without NumPy.\n")
 
     # Create a minimal numpy-like array implementation for basic functionality
     class NumpyArrayFallback:
@@ -61,6 +83,8 @@ except ImportError as e:
 
     # Create a minimal numpy module fallback
     class NumpyFallback:
+        int16 = 'int16'
+
         def frombuffer(self, buffer, dtype=None):
             # Convert bytes to a list of integers when NumPy is not available
             if dtype == 'int16':
@@ -68,26 +92,47 @@ except ImportError as e:
                 import array
                 return NumpyArrayFallback(array.array('h', buffer))
             return NumpyArrayFallback(list(buffer))
-        
-    # Use fallback if NumPy is not available
-    if not NUMPY_AVAILABLE:
-        np = NumpyFallback()
 
-# Check PyAudio availability
-try:
-    import pyaudio
-    PYAUDIO_AVAILABLE = True
-except ImportError:
-    PYAUDIO_AVAILABLE = False
-    print("Warning: PyAudio import failed. Live audio processing will not be available.")
-    print("Install PyAudio with: pip install pyaudio")
-    print("On Ubuntu/Debian, you may need: sudo apt-get install python3-pyaudio\n")
+    return NumpyFallback()
+
+@functools.lru_cache(maxsize=1)
+def _load_pyaudio():
+    """Import and return the pyaudio module, or None if it can't be imported."""
+    global PYAUDIO_AVAILABLE
+    if not PYAUDIO_AVAILABLE:
+        return None
+    # The package may be installed while its native library is missing
+    try:
+        import pyaudio
+        return pyaudio
+    except ImportError:
+        PYAUDIO_AVAILABLE = False
+        _warn_pyaudio_unavailable()
+        return None
+
+def __getattr__(name):
+    # PEP 562: keep `module.np` and `module.pyaudio` working for callers
+    # without an eager import
+    if name == "np":
+        return _load_numpy()
+    if name == "pyaudio":
+        pyaudio = _load_pyaudio()
+        if pyaudio is not None:
+            return pyaudio
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
+# Queried once; both are fixed for the life of the process and
+# platform.system() runs uname each time
+_CPU_COUNT = os.cpu_count() or 2
+_SYSTEM = platform.system()
+
 class Config:
     """Configuration management class."""
+    __slots__ = ("settings",)
+
     def __init__(self):
         # Default settings
         self.settings = {
@@ -99,7 +144,7 @@ class Config:
             'charset': 'ascii',  # Changed from unicode to ascii for better compatibility
             'dither': 'fstein',
             'colors': 'thermal',
-            'threads': os.cpu_count() // 2 if os.cpu_count() else 2,
+            'threads': max(1, _CPU_COUNT // 2),
             'gpu': 'auto',
             'latency': 'normal',
             'buffer_size': 1024,
@@ -119,11 +164,24 @@ class Config:
 # =============================================================================
 # LOGGING
 # =============================================================================
-def setup_logging(debug=False):
-    """Set up logging for the application."""
-    log_dir = Path(os.environ.get('TMPDIR', '/tmp')) / "asciisymphony"
-    log_dir.mkdir(parents=True, exist_ok=True)
-    log_file = log_dir / "asymphony.log"
+class _LazyFileHandler(logging.FileHandler):
+    """FileHandler that creates its directory and opens the file on the first record."""
+    def __init__(self, filename):
+        super().__init__(filename, delay=True)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+def setup_logging(debug=False, persistent=True):
+    """Set up logging for the application.
+
+    Informational commands pass persistent=False and only log to stderr.
+    """
+    handlers = [logging.StreamHandler(sys.stderr)]
+    if persistent:
+        log_file = Path(os.environ.get('TMPDIR', '/tmp')) / "asciisymphony" / "asymphony.log"
+        handlers.append(_LazyFileHandler(log_file))
 
     log_level = logging.DEBUG if debug else logging.INFO
 
@@ -131,10 +189,7 @@ def setup_logging(debug=False):
     logging.basicConfig(
         level=log_level,
         format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stderr),
-            logging.FileHandler(log_file)
-        ]
+        handlers=handlers
     )
 
     return logging.getLogger("asciisymphony")
@@ -148,6 +203,47 @@ class ErrorClass(Enum):
     CREATIVE = auto()   # C-Class errors
     HYBRID = auto()     # H-Class errors
 
+# Keywords in an error message that select a fallback, one group per fallback
+_ERROR_KEYWORDS_RE = re.compile(
+    r'(?P<gpu>gpu|hardware)|(?P<memory>memory)|(?P<filter>filter)|(?P<color>color)|(?P<effect>effect)',
+    re.IGNORECASE
+)
+
+# Simpler mode to fall back to when a mode's filters fail
+_FALLBACK_MODES = {
+    "neural": "spectrum",
+    "typography": "waves",
+    "particles": "waves",
+    "fractal": "cqt",
+    "spectrosynth": "spectrum",
+    "vortex": "waves",
+    "kaleidoscope": "spectrum"
+}
+
+# Probed FFmpeg capabilities, reused until the ffmpeg binary changes
+CAPS_CACHE_FILE = Path.home() / ".cache" / "asciisymphony" / "ffmpeg_caps.json"
+# Older entries are still used, but re-probed in the background
+CAPS_CACHE_MAX_AGE = 7 * 24 * 3600
+@functools.lru_cache(maxsize=1)
+def _find_ffmpeg():
+    """Return the absolute path of the ffmpeg binary, or None if not on PATH."""
+    return shutil.which("ffmpeg")
+
+# Arguments for short FFmpeg probes: nothing is read from stdin or stderr,
+# no descriptors need closing in the child, and a hung ffmpeg can't stall
+# startup
+_PROBE_ARGS = dict(
+    stdin=subprocess.DEVNULL,
+    stdout=subprocess.PIPE,
+    stderr=subprocess.DEVNULL,
+    text=True,
+    close_fds=False,
+    timeout=3
+)
+
+# Optional filters looked for in the `ffmpeg -filters` listing
+_CAPS_FILTER_RE = re.compile(r'\b(caca|libplacebo)\b')
+
 class ErrorHandler:
     """Handles errors and implements fallback mechanisms."""
     def __init__(self, app):
@@ -156,6 +252,14 @@ class ErrorHandler:
         self.config = app.config
         self.fallback_attempts = 0
         self.max_fallback_attempts = 3
+        # Fallback for each keyword group of _ERROR_KEYWORDS_RE
+        self._fallbacks = {
+            "gpu": self._disable_gpu,
+            "memory": self._reduce_quality,
+            "filter": self._simplify_mode,
+            "color": self._reset_colors,
+            "effect": self._disable_effects
+        }
 
     def handle_error(self, error, error_class=ErrorClass.TECHNICAL):
         """Handle an error with appropriate fallback."""
@@ -167,91 +271,89 @@ class ErrorHandler:
         
         self.fallback_attempts += 1
         
+        # Classify the message once, in a single regex pass
+        kinds = {match.lastgroup for match in _ERROR_KEYWORDS_RE.finditer(str(error))}
+        
         # Handle different error classes
         if error_class == ErrorClass.TECHNICAL:
-            return self._handle_technical_error(error)
+            return self._handle_technical_error(kinds)
         elif error_class == ErrorClass.CREATIVE:
-            return self._handle_creative_error(error)
+            return self._handle_creative_error(kinds)
         else:  # HYBRID
-            return self._handle_hybrid_error(error)
+            return self._handle_hybrid_error(kinds)
 
-    def _handle_technical_error(self, error):
-        """Handle technical errors (T-Class)."""
-        self.logger.info("Handling technical error with T-Mitigation")
-        
-        # Check error type and apply appropriate fallback
-        if "GPU" in str(error) or "hardware" in str(error).lower():
-            # Disable GPU acceleration
-            self.logger.info("Disabling GPU acceleration")
-            self.config.update({"gpu": 0})
-            return True
-        
-        elif "memory" in str(error).lower():
-            # Reduce quality
-            quality = self.config.get("quality", "balanced")
-            if quality == "ultra":
-                new_quality = "high"
-            elif quality == "high":
-                new_quality = "balanced"
-            else:
-                new_quality = "low"
-            
-            self.logger.info(f"Reducing quality from {quality} to {new_quality}")
-            self.config.update({"quality": new_quality})
-            return True
-        
-        elif "filter" in str(error).lower():
-            # Fall back to simpler visualization mode
-            current_mode = self.config.get("mode", "waves")
-            fallback_modes = {
-                "neural": "spectrum",
-                "typography": "waves",
-                "particles": "waves",
-                "fractal": "cqt",
-                "spectrosynth": "spectrum",
-                "vortex": "waves",
-                "kaleidoscope": "spectrum"
-            }
-            
-            new_mode = fallback_modes.get(current_mode, "waves")
-            self.logger.info(f"Falling back from {current_mode} to {new_mode}")
-            self.config.update({"mode": new_mode})
-            return True
+    def _apply_fallback(self, kinds, priority):
+        """Apply the first fallback in priority order whose keyword was seen."""
+        for kind in priority:
+            if kind in kinds:
+                return self._fallbacks[kind]()
         
         # No specific fallback found
         return False
 
-    def _handle_creative_error(self, error):
+    def _handle_technical_error(self, kinds):
+        """Handle technical errors (T-Class)."""
+        self.logger.info("Handling technical error with T-Mitigation")
+        return self._apply_fallback(kinds, ("gpu", "memory", "filter"))
+
+    def _handle_creative_error(self, kinds):
         """Handle creative errors (C-Class)."""
         self.logger.info("Handling creative error with C-Revision")
         
         # Typically these are errors related to styling or aesthetic issues
-        if "color" in str(error).lower():
-            # Reset to default color scheme
-            self.logger.info("Resetting to default color scheme")
-            self.config.update({"colors": "thermal"})
-            return True
-        
-        elif "effect" in str(error).lower():
-            # Disable effects
-            self.logger.info("Disabling effects")
-            self.config.update({"effects": "none"})
-            return True
+        return self._apply_fallback(kinds, ("color", "effect"))
+
+    def _disable_gpu(self):
+        """Disable GPU acceleration."""
+        self.logger.info("Disabling GPU acceleration")
+        self.config.update({"gpu": 0})
+        return True
+
+    def _reduce_quality(self):
+        """Step the quality level down by one."""
+        quality = self.config.get("quality", "balanced")
+        if quality == "ultra":
+            new_quality = "high"
+        elif quality == "high":
+            new_quality = "balanced"
+        else:
+            new_quality = "low"
         
-        # No specific fallback found
-        return False
+        self.logger.info(f"Reducing quality from {quality} to {new_quality}")
+        self.config.update({"quality": new_quality})
+        return True
 
-    def _handle_hybrid_error(self, error):
+    def _simplify_mode(self):
+        """Fall back to simpler visualization mode."""
+        current_mode = self.config.get("mode", "waves")
+        new_mode = _FALLBACK_MODES.get(current_mode, "waves")
+        self.logger.info(f"Falling back from {current_mode} to {new_mode}")
+        self.config.update({"mode": new_mode})
+        return True
+
+    def _reset_colors(self):
+        """Reset to default color scheme."""
+        self.logger.info("Resetting to default color scheme")
+        self.config.update({"colors": "thermal"})
+        return True
+
+    def _disable_effects(self):
+        """Disable effects."""
+        self.logger.info("Disabling effects")
+        self.config.update({"effects": "none"})
+        return True
+
+    def _handle_hybrid_error(self, kinds):
         """Handle hybrid errors (H-Class)."""
         self.logger.info("Handling hybrid error with Cross-Domain Review")
         
         # These are more complex errors that might require multiple changes
         # First try technical fallback
-        if self._handle_technical_error(error):
+        if self._handle_technical_error(kinds):
             return True
         
         # Then try creative fallback
-        if self._handle_creative_error(error):
+        if self._handle_creative_error(kinds):
             return True
         
         # If all else fails, reset to most basic configuration
@@ -269,65 +371,25 @@ class ErrorHandler:
 
     def check_ffmpeg_capabilities(self):
         """Check FFmpeg capabilities and set fallback paths if needed."""
-        # Check for libcaca support using -formats instead of -filters
         try:
-            format_info = subprocess.run(
-                ["ffmpeg", "-formats"],
-                capture_output=True,
-                text=True,
-                timeout=3
-            )
-            # Set defaults directly if command fails
-            if format_info.returncode != 0:
-                raise subprocess.SubprocessError("FFmpeg formats command failed")
-        except Exception as e:
-            self.logger.warning(f"FFmpeg format check failed: {str(e)}")
-            format_info = type('obj', (object,), {'stdout': '', 'returncode': 1})
+            ffmpeg_path = _find_ffmpeg()
+            caps = self._load_caps_cache(ffmpeg_path) if ffmpeg_path else None
+            if caps is None:
+                caps = self._probe_capabilities()
+                if ffmpeg_path:
+                    self._save_caps_cache(ffmpeg_path, caps)
             
-        try:
-            # Check if FFmpeg is installed
-            result = subprocess.run(
-                ["ffmpeg", "-version"], 
-                capture_output=True, 
-                text=True, 
-                check=True
-            )
-            
-            # Check for libcaca support
-            result = subprocess.run(
-                ["ffmpeg", "-filters"], 
-                capture_output=True, 
-                text=True, 
-                check=True
-            )
-            
-            if "caca" not in result.stdout:
+            if not caps["caca"]:
                 self.logger.warning("FFmpeg does not have libcaca support, ASCII output may be limited")
             
-            # Check for GPU acceleration support
-            result = subprocess.run(
-                ["ffmpeg", "-hwaccels"], 
-                capture_output=True, 
-                text=True, 
-                check=True
-            )
-            
             # Update config based on available hardware acceleration
-            if "vulkan" in result.stdout:
+            if caps["vulkan"]:
                 self.logger.info("Vulkan hardware acceleration available")
                 self.config.update({"vulkan": 1})
             else:
                 self.config.update({"vulkan": 0})
             
-            # Check for libplacebo support
-            result = subprocess.run(
-                ["ffmpeg", "-v", "quiet", "-filters"], 
-                capture_output=True, 
-                text=True, 
-                check=True
-            )
-            
-            if "libplacebo" in result.stdout:
+            if caps["libplacebo"]:
                 self.logger.info("libplacebo GPU processing available")
                 self.config.update({"gpu": 1})
             else:
@@ -344,6 +406,86 @@ class ErrorHandler:
             self.logger.error(f"Unexpected error checking FFmpeg: {str(e)}")
             return False
 
+    def _probe_capabilities(self):
+        """Run FFmpeg to find out which optional features it supports."""
+        # One -filters listing answers both the libcaca and libplacebo
+        # checks; a failing run already tells us FFmpeg is missing or broken
+        ffmpeg = _find_ffmpeg() or "ffmpeg"
+        filters = subprocess.run(
+            [ffmpeg, "-hide_banner", "-v", "error", "-filters"],
+            check=True,
+            **_PROBE_ARGS
+        )
+        found = set(_CAPS_FILTER_RE.findall(filters.stdout))
+        
+        # Check for GPU acceleration support; older builds may lack -hwaccels
+        try:
+            hwaccels = subprocess.run(
+                [ffmpeg, "-hide_banner", "-hwaccels"],
+                check=True,
+                **_PROBE_ARGS
+            )
+            vulkan = "vulkan" in hwaccels.stdout
+        except subprocess.SubprocessError as e:
+            self.logger.warning(f"FFmpeg hwaccel check failed: {str(e)}")
+            vulkan = False
+        
+        return {
+            "caca": "caca" in found,
+            "vulkan": vulkan,
+            "libplacebo": "libplacebo" in found
+        }
+
+    @staticmethod
+    def _caps_cache_key(ffmpeg_path):
+        """Identify an ffmpeg binary by its path, mtime and size."""
+        st = os.stat(ffmpeg_path)
+        return [ffmpeg_path, st.st_mtime_ns, st.st_size]
+
+    def _load_caps_cache(self, ffmpeg_path):
+        """Return cached capabilities for this ffmpeg binary, or None.
+
+        Entries older than CAPS_CACHE_MAX_AGE are still returned, and a
+        background thread probes FFmpeg again and rewrites the cache.
+        """
+        try:
+            with open(CAPS_CACHE_FILE) as f:
+                cached = json.load(f)
+            if cached["key"] != self._caps_cache_key(ffmpeg_path):
+                return None
+            caps = cached["caps"]
+            if time.time() - cached["timestamp"] > CAPS_CACHE_MAX_AGE:
+                threading.Thread(
+                    target=self._refresh_caps_cache,
+                    args=(ffmpeg_path,),
+                    daemon=True
+                ).start()
+            return caps
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _refresh_caps_cache(self, ffmpeg_path):
+        """Probe FFmpeg again and rewrite the capability cache."""
+        try:
+            self._save_caps_cache(ffmpeg_path, self._probe_capabilities())
+        except Exception as e:
+            self.logger.debug(f"Could not refresh FFmpeg capability cache: {str(e)}")
+
+    def _save_caps_cache(self, ffmpeg_path, caps):
+        """Store probed capabilities, replacing the cache file atomically."""
+        try:
+            CAPS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = CAPS_CACHE_FILE.with_name(f"{CAPS_CACHE_FILE.name}.{os.getpid()}")
+            with open(temp_path, "w") as f:
+                json.dump({
+                    "key": self._caps_cache_key(ffmpeg_path),
+                    "timestamp": time.time(),
+                    "caps": caps
+                }, f)
+            os.replace(temp_path, CAPS_CACHE_FILE)
+        except OSError as e:
+            self.logger.debug(f"Could not write FFmpeg capability cache: {str(e)}")
+
 # =============================================================================
 # AUDIO DEVICE MANAGEMENT
 # =============================================================================
@@ -363,7 +505,7 @@ class AudioDeviceManager:
 
     def _detect_system(self):
         """Detect the audio system to use based on platform."""
-        system = platform.system()
+        system = _SYSTEM
         
         if system == "Linux":
             # Check for PulseAudio/PipeWire
@@ -400,7 +542,8 @@ class AudioDeviceManager:
         self.devices = []
         
         # Check if PyAudio is available
-        if not PYAUDIO_AVAILABLE:
+        pyaudio = _load_pyaudio()
+        if pyaudio is None:
             self.logger.warning("PyAudio is not available. Using fallback device.")
             # Add a fallback default device
             self.devices.append({
@@ -486,7 +629,7 @@ class AudioDeviceManager:
         args = []
         
         # System-specific arguments
-        system = platform.system()
+        system = _SYSTEM
         
         if system == "Linux":
             if device['system'] == 'pulse':
@@ -524,7 +667,7 @@ class LiveAudioProcessor:
         self.audio_thread = None
         
         # Check if live audio processing is available
-        if not PYAUDIO_AVAILABLE:
+        if _load_pyaudio() is None:
             self.logger.error("PyAudio is not available. Live audio processing is disabled.")
             raise ImportError("PyAudio is required for live audio processing")
 
@@ -568,6 +711,8 @@ class LiveAudioProcessor:
         buffer_size = int(self.config.get('buffer_size', 1024))
         
         # Initialize PyAudio
+        pyaudio = _load_pyaudio()
+        np = _load_numpy()
         pa = pyaudio.PyAudio()
         
         try:
@@ -625,6 +770,8 @@ class LiveAudioProcessor:
         buffer_size = int(self.config.get('buffer_size', 1024))
         
         # Initialize PyAudio
+        import wave
+        pyaudio = _load_pyaudio()
         pa = pyaudio.PyAudio()
         
         try:
@@ -699,7 +846,7 @@ class PresetManager:
             "dither": "fstein",
             "hue": 1.5,
             "saturation": 1.2,
-            "threads": os.cpu_count() // 2 if os.cpu_count() else 2,
+            "threads": max(1, _CPU_COUNT // 2),
             "gpu": "auto",
             "latency": "normal",
             "width": 1280,
@@ -765,9 +912,11 @@ class PresetManager:
         return preset_data
 
     def list_presets(self):
-        """List all available presets."""
-        presets = []
-        
+        """Yield a summary of each available preset.
+
+        Presets are parsed one at a time as the caller iterates, so the
+        first result is available without reading the whole directory.
+        """
         for preset_file in self.preset_dir.glob("*.preset"):
             try:
                 with open(preset_file, 'r') as f:
@@ -781,12 +930,11 @@ class PresetManager:
                     "created": meta.get("created", "unknown"),
                     "mode": preset_data.get("mode", "unknown")
                 }
-                presets.append(preset_info)
             except:
                 # Skip invalid presets
                 continue
-        
-        return presets
+            
+            yield preset_info
 
     def export_preset(self, name, export_path=None):
         """Export a preset to a shareable file."""
@@ -1123,7 +1271,7 @@ class TerminalRenderer(Renderer):
     def _get_terminal_size(self):
         """Get the terminal size."""
         try:
-            if platform.system() == 'Windows':
+            if _SYSTEM == 'Windows':
                 # Windows
                 from ctypes import windll, create_string_buffer
                 h = windll.kernel32.GetStdHandle(-12)  # stderr
@@ -1135,6 +1283,8 @@ class TerminalRenderer(Renderer):
                 height = bottom - top + 1
             else:
                 # Unix/Linux/macOS
+                import fcntl
+                import termios
                 width, height = struct.unpack('HHHH', 
                     fcntl.ioctl(sys.stdout.fileno(), termios.TIOCGWINSZ, 
                                 struct.pack('HHHH', 0, 0, 0, 0))
@@ -2089,6 +2239,147 @@ def _run_ascii_generator(self, cmd, output_file):
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
+# Boxes that hold other boxes on the path from moov down to the chunk tables
+_MP4_CONTAINER_BOXES = frozenset({b'moov', b'trak', b'mdia', b'minf', b'stbl'})
+# Read size for copies that can't be done in the kernel
+_COPY_CHUNK = 1 << 20
+# Page cache hints are POSIX-only
+_FADVISE = hasattr(os, 'posix_fadvise')
+
+def _mp4_box_header(data, pos, end):
+    """Return (size, type, header_size) of the MP4 box starting at pos."""
+    size, box_type = struct.unpack_from('>I4s', data, pos)
+    header_size = 8
+    if size == 1:
+        size = struct.unpack_from('>Q', data, pos + 8)[0]
+        header_size = 16
+    elif size == 0:
+        size = end - pos
+    if size < header_size or pos + size > end:
+        raise ValueError(f"Corrupt MP4 box {box_type!r} at {pos}")
+    return size, box_type, header_size
+
+def _read_mp4_boxes(f, file_size):
+    """List the (type, offset, size) of each top-level box in an MP4 file."""
+    boxes = []
+    offset = 0
+    while offset < file_size:
+        f.seek(offset)
+        header = f.read(16)
+        if len(header) < 8:
+            raise ValueError(f"Truncated MP4 box header at {offset}")
+        # Box sizes are relative to the file, not to the header buffer
+        size, box_type, _ = _mp4_box_header(header, 0, file_size - offset)
+        boxes.append((box_type, offset, size))
+        offset += size
+    return boxes
+
+def _shift_chunk_offsets(moov, start, end, low, high, delta):
+    """Add delta to every stco/co64 chunk offset in [low, high), in place."""
+    pos = start
+    while pos + 8 <= end:
+        size, box_type, header_size = _mp4_box_header(moov, pos, end)
+        body = pos + header_size
+        if box_type in _MP4_CONTAINER_BOXES:
+            _shift_chunk_offsets(moov, body, pos + size, low, high, delta)
+        elif box_type in (b'stco', b'co64'):
+            # version/flags, entry count, then one offset per chunk
+            count = struct.unpack_from('>I', moov, body + 4)[0]
+            fmt = f">{count}{'I' if box_type == b'stco' else 'Q'}"
+            offsets = [
+                offset + delta if low <= offset < high else offset
+                for offset in struct.unpack_from(fmt, moov, body + 8)
+            ]
+            if box_type == b'stco' and offsets and max(offsets) > 0xFFFFFFFF:
+                raise ValueError("Chunk offsets no longer fit in a 32-bit stco box")
+            struct.pack_into(fmt, moov, body + 8, *offsets)
+        elif box_type == b'cmov':
+            raise ValueError("Compressed moov boxes are not supported")
+        pos += size
+
+def _copy_range(src, dst, offset, length):
+    """Copy length bytes at offset in file src to the current position of dst.
+
+    On Linux the data is copied by the kernel with os.copy_file_range();
+    elsewhere, or when the filesystems don't support it, through a buffer.
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            while length:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), min(length, 1 << 30),
+                                            offset_src=offset)
+                if not copied:
+                    raise ValueError("Unexpected end of MP4 file")
+                offset += copied
+                length -= copied
+            return
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+    
+    src.seek(offset)
+    buffer = bytearray(min(length, _COPY_CHUNK))
+    while length:
+        view = memoryview(buffer)[:min(length, _COPY_CHUNK)]
+        count = src.readinto(view)
+        if not count:
+            raise ValueError("Unexpected end of MP4 file")
+        dst.write(view[:count])
+        length -= count
+
+def _mp4_faststart(src_path, dst_path):
+    """Write src_path to dst_path with its moov box moved before the media data.
+
+    This is what `ffmpeg -c copy -movflags faststart` does, without
+    demuxing: the moov box is read into memory and its chunk offsets are
+    patched, and every other box is copied unchanged. Returns False, and
+    writes nothing, if the moov box already comes first. Raises ValueError
+    if the file can't be handled this way.
+    """
+    with open(src_path, 'rb') as src:
+        if _FADVISE:
+            # The whole file is read once, front to back
+            os.posix_fadvise(src.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        boxes = _read_mp4_boxes(src, os.fstat(src.fileno()).st_size)
+        moov = next((box for box in boxes if box[0] == b'moov'), None)
+        mdat = next((box for box in boxes if box[0] == b'mdat'), None)
+        if moov is None or mdat is None:
+            raise ValueError("MP4 file has no moov or mdat box")
+        
+        _, moov_offset, moov_size = moov
+        insert_at = mdat[1]
+        if moov_offset < insert_at:
+            return False
+        
+        # Everything between the first mdat and the old moov position moves
+        # down by the size of moov
+        src.seek(moov_offset)
+        moov_data = bytearray(src.read(moov_size))
+        _, _, header_size = _mp4_box_header(moov_data, 0, moov_size)
+        _shift_chunk_offsets(moov_data, header_size, moov_size, insert_at, moov_offset, moov_size)
+        
+        try:
+            # Unbuffered, so plain writes and kernel copies share one file position
+            with open(dst_path, 'wb', buffering=0) as dst:
+                for box_type, offset, size in boxes:
+                    if offset == moov_offset:
+                        continue
+                    if offset == insert_at:
+                        dst.write(moov_data)
+                    _copy_range(src, dst, offset, size)
+                    if _FADVISE:
+                        # Copied source pages won't be read again; don't let
+                        # a large video push everything else out of the cache
+                        os.posix_fadvise(src.fileno(), offset, size, os.POSIX_FADV_DONTNEED)
+        except BaseException:
+            try:
+                os.remove(dst_path)
+            except OSError:
+                pass
+            raise
+    
+    return True
+
 class ProgressBar:
     """Simple text-based progress bar for terminal."""
     def __init__(self, total=100, prefix='Progress:', suffix='Complete', length=50, fill='█', print_end='\r'):
@@ -2177,10 +2468,21 @@ def progress_tracker(total, description="Processing"):
 # =============================================================================
 # MAIN APPLICATION
 # =============================================================================
+# Allowed values for the command line options that take a fixed set
+_QUALITY = ('low', 'balanced', 'high', 'ultra')
+_CHARSET = ('ascii', 'unicode', 'blocks')
+_LATENCY = ('normal', 'low', 'realtime')
+_GPU = (0, 1)
+_ENCODER = ('h264', 'vp9', 'gif')
+_RENDERER = ('terminal', 'file')
+
 class AsciiSymphony:
     """Main AsciiSymphony application class."""
     VERSION = "3.0.0"
     DESCRIPTION = "AsciiSymphony Pro: Enterprise-Grade ASCII Art Audio Visualizer"
+    _PARSER = None
+    # Commands that only report or manage presets, without processing audio
+    _INFO_COMMANDS = ('list_devices', 'list_presets', 'save_preset', 'export_preset', 'import_preset')
 
     def __init__(self):
         self.config = None
@@ -2189,6 +2491,7 @@ class AsciiSymphony:
         self.visualization_engine = None
         self.preset_manager = None
         self.renderer = None
+        self._renderer_type = None
         self.error_handler = None
         self.initialized = False
 
@@ -2198,9 +2501,10 @@ class AsciiSymphony:
         self.config = Config()
         self.parse_args(args)
         
-        # Set up logging
+        # Set up logging; listing and preset commands leave no log file behind
         debug_mode = self.config.get('debug', False)
-        self.logger = setup_logging(debug_mode)
+        informational = any(self.config.get(key) for key in self._INFO_COMMANDS)
+        self.logger = setup_logging(debug_mode, persistent=not informational)
         
         # Initialize components
         self.audio_manager = AudioDeviceManager(self.config)
@@ -2212,11 +2516,15 @@ class AsciiSymphony:
         self.error_handler.check_ffmpeg_capabilities()
         
         self.initialized = True
-        self.logger.info(f"AsciiSymphony Pro {self.VERSION} initialized")
+        self.logger.info("AsciiSymphony Pro %s initialized", self.VERSION)
 
-    def parse_args(self, args=None):
-        """Parse command line arguments."""
-        parser = argparse.ArgumentParser(description=self.DESCRIPTION)
+    @classmethod
+    def _get_parser(cls):
+        """Return the argument parser, building it on first use."""
+        if cls._PARSER is not None:
+            return cls._PARSER
+        
+        parser = argparse.ArgumentParser(description=cls.DESCRIPTION)
         
         # Input/output options
         parser.add_argument('input', nargs='?', help='Input audio file')
@@ -2225,10 +2533,10 @@ class AsciiSymphony:
         # Basic options
         parser.add_argument('--mode', help='Visualization mode')
         parser.add_argument('--fps', type=int, help='Frames per second')
-        parser.add_argument('--quality', choices=['low', 'balanced', 'high', 'ultra'],
+        parser.add_argument('--quality', choices=_QUALITY,
                             help='Quality level')
         parser.add_argument('--colors', help='Color scheme')
-        parser.add_argument('--charset', choices=['ascii', 'unicode', 'blocks'],
+        parser.add_argument('--charset', choices=_CHARSET,
                             help='ASCII character set')
         parser.add_argument('--dither', help='Dithering algorithm')
         parser.add_argument('--ascii-density', type=float,
@@ -2239,7 +2547,7 @@ class AsciiSymphony:
         parser.add_argument('--device', help='Audio input device')
         parser.add_argument('--list-devices', action='store_true', 
                             help='List available audio input devices')
-        parser.add_argument('--latency', choices=['normal', 'low', 'realtime'], 
+        parser.add_argument('--latency', choices=_LATENCY, 
                             help='Latency mode for live input')
         parser.add_argument('--buffer', type=int, help='Audio buffer size')
         
@@ -2255,14 +2563,14 @@ class AsciiSymphony:
         # Advanced options
         parser.add_argument('--width', type=int, help='Width in pixels')
         parser.add_argument('--height', type=int, help='Height in pixels')
-        parser.add_argument('--gpu', type=int, choices=[0, 1],
+        parser.add_argument('--gpu', type=int, choices=_GPU,
                             help='Enable/disable GPU acceleration')
         parser.add_argument('--hdr', action='store_true',
                             help='Enable HDR processing')
-        parser.add_argument('--encoder', choices=['h264', 'vp9', 'gif'],
+        parser.add_argument('--encoder', choices=_ENCODER,
                             help='Output encoder')
         parser.add_argument('--threads', type=int, help='Number of threads')
-        parser.add_argument('--renderer', choices=['terminal', 'file'],
+        parser.add_argument('--renderer', choices=_RENDERER,
                             help='Renderer type')
         parser.add_argument('--preview', action='store_true',
                             help='Show libcaca ASCII preview in terminal while generating file output')
@@ -2271,77 +2579,98 @@ class AsciiSymphony:
         parser.add_argument('--debug', action='store_true', 
                             help='Enable debug logging')
         
-        # Parse arguments
-        parsed_args = parser.parse_args(args)
+        cls._PARSER = parser
+        return parser
+
+    def parse_args(self, args=None):
+        """Parse command line arguments."""
+        parsed_args = self._get_parser().parse_args(args)
         
-        # Convert args to config
-        for key, value in vars(parsed_args).items():
-            if value is not None:
-                self.config.settings[key] = value
+        # Convert args to config; argparse builds the dest names at runtime,
+        # so intern them to match the literal keys used by config.get()
+        self.config.update({sys.intern(k): v for k, v in vars(parsed_args).items() if v is not None})
         
         return parsed_args
 
     def run(self):
-        """Run the application based on configuration."""
+        """Run the application based on configuration.
+
+        Failed runs are retried in a loop for as long as the error
+        handler can apply a fallback.
+        """
         if not self.initialized:
             self.initialize()
         
-        try:
-            # Handle special commands
-            if self.config.get('list_devices'):
-                return self.list_devices()
-            
-            if self.config.get('list_presets'):
-                return self.list_presets()
-            
-            if self.config.get('save_preset'):
-                return self.save_preset(self.config.get('save_preset'))
-            
-            if self.config.get('load_preset'):
-                self.load_preset(self.config.get('load_preset'))
-                # Continue with normal execution using loaded preset
-            
-            if self.config.get('export_preset'):
-                args = self.config.get('export_preset')
-                preset_name = args[0]
-                export_file = args[1] if len(args) > 1 else None
-                return self.export_preset(preset_name, export_file)
-            
-            if self.config.get('import_preset'):
-                return self.import_preset(self.config.get('import_preset'))
-            
-            # Regular execution
-            if self.config.get('live'):
-                return self.process_live(self.config.get('device'))
-            else:
-                input_file = self.config.get('input')
-                output_file = self.config.get('output')
+        while True:
+            try:
+                return self._run_once()
+            except Exception as e:
+                self.logger.error("Error: %s", e)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.error(traceback.format_exc())
                 
-                if not input_file:
-                    self.logger.error("Input file required for processing")
+                # Try to handle the error
+                try:
+                    recovered = self.error_handler.handle_error(e)
+                except Exception as recovery_error:
+                    self.logger.error("Error recovery failed: %s", recovery_error)
                     return 1
                 
-                if not output_file:
-                    self.logger.error("Output file required for processing")
+                # Retrying with an unchanged configuration would fail the same way
+                if not recovered:
+                    self.logger.error("Error recovery failed: no fallback applies")
                     return 1
                 
-                return self.process_file(input_file, output_file)
-            
-        except Exception as e:
-            self.logger.error(f"Error: {str(e)}")
-            if self.config.get('debug'):
-                import traceback
-                self.logger.error(traceback.format_exc())
-            
-            # Try to handle the error
-            try:
-                self.error_handler.handle_error(e)
                 # If error handling succeeded, retry
                 self.logger.info("Retrying after error recovery")
-                return self.run()
-            except Exception as recovery_error:
-                self.logger.error(f"Error recovery failed: {str(recovery_error)}")
+
+    def _run_once(self):
+        """Dispatch the configured command once."""
+        # Each setting is looked up once, straight from the settings dict
+        settings = self.config.settings
+        
+        # Handle special commands
+        if settings.get('list_devices'):
+            return self.list_devices()
+        
+        if settings.get('list_presets'):
+            return self.list_presets()
+        
+        save_name = settings.get('save_preset')
+        if save_name:
+            return self.save_preset(save_name)
+        
+        load_name = settings.get('load_preset')
+        if load_name:
+            self.load_preset(load_name)
+            # Continue with normal execution using loaded preset
+        
+        export_args = settings.get('export_preset')
+        if export_args:
+            preset_name = export_args[0]
+            export_file = export_args[1] if len(export_args) > 1 else None
+            return self.export_preset(preset_name, export_file)
+        
+        import_path = settings.get('import_preset')
+        if import_path:
+            return self.import_preset(import_path)
+        
+        # Regular execution
+        if settings.get('live'):
+            return self.process_live(settings.get('device'))
+        else:
+            input_file = settings.get('input')
+            output_file = settings.get('output')
+            
+            if not input_file:
+                self.logger.error("Input file required for processing")
                 return 1
+            
+            if not output_file:
+                self.logger.error("Output file required for processing")
+                return 1
+
+            return self.process_file(input_file, output_file)
 
     def list_devices(self):
         """List available audio input devices."""
@@ -2360,12 +2689,11 @@ class AsciiSymphony:
 
     def list_presets(self):
         """List available presets."""
-        presets = self.preset_manager.list_presets()
-        
         print("Available presets:")
         print("-----------------")
         
-        for preset in presets:
+        # Print each row as soon as its preset has been read
+        for preset in self.preset_manager.list_presets():
             print(f"{preset['name']:<20} | {preset['mode']:<15} | {preset['created']}")
         
         print("\nUsage:")
@@ -2383,7 +2711,7 @@ class AsciiSymphony:
             print(f"Preset saved: {preset_name}")
             return 0
         except Exception as e:
-            self.logger.error(f"Error saving preset: {str(e)}")
+            self.logger.error("Error saving preset: %s", e)
             return 1
 
     def load_preset(self, preset_name):
@@ -2393,7 +2721,7 @@ class AsciiSymphony:
             print(f"Preset loaded: {preset_name}")
             return 0
         except Exception as e:
-            self.logger.error(f"Error loading preset: {str(e)}")
+            self.logger.error("Error loading preset: %s", e)
             return 1
 
     def export_preset(self, preset_name, export_path=None):
@@ -2403,7 +2731,7 @@ class AsciiSymphony:
             print(f"Preset exported: {export_path}")
             return 0
         except Exception as e:
-            self.logger.error(f"Error exporting preset: {str(e)}")
+            self.logger.error("Error exporting preset: %s", e)
             return 1
 
     def import_preset(self, import_path):
@@ -2413,17 +2741,23 @@ class AsciiSymphony:
             print(f"Preset imported: {Path(preset_path).stem}")
             return 0
         except Exception as e:
-            self.logger.error(f"Error importing preset: {str(e)}")
+            self.logger.error("Error importing preset: %s", e)
             return 1
 
     def process_file(self, input_file, output_file):
         """Process an audio file."""
-        self.logger.info(f"Processing file: {input_file} -> {output_file}")
+        self.logger.info("Processing file: %s -> %s", input_file, output_file)
 
         try:
-            # Check input file
-            if not os.path.exists(input_file):
-                raise FileNotFoundError(f"Input file not found: {input_file}")
+            # Check input file up front, since FFmpeg only opens it after the
+            # preview; stat() reports permission errors as themselves instead
+            # of as a missing file, and catches directories too
+            try:
+                input_stat = os.stat(input_file)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Input file not found: {input_file}") from None
+            if stat.S_ISDIR(input_stat.st_mode):
+                raise IsADirectoryError(f"Input is a directory: {input_file}")
 
             # Check if preview is enabled - remove the preview flag to prevent recursion
             preview_enabled = self.config.settings.pop('preview', False)
@@ -2474,14 +2808,14 @@ class AsciiSymphony:
                     self.config.update({'renderer': original_renderer})
 
             # Create renderer for file output
-            self.renderer = Renderer.create(self.config)
+            self._get_renderer()
 
             # Process file
             start_time = time.time()
             result = self.renderer.render(input_file, output_file)
             elapsed_time = time.time() - start_time
 
-            self.logger.info(f"Processing completed in {elapsed_time:.2f} seconds")
+            self.logger.info("Processing completed in %.2f seconds", elapsed_time)
 
             # Optimize output if needed
             if output_file.endswith('.mp4'):
@@ -2490,15 +2824,28 @@ class AsciiSymphony:
             return result
 
         except Exception as e:
-            self.logger.error(f"Error processing file: {str(e)}")
+            self.logger.error("Error processing file: %s", e)
             raise
 
+    def _get_renderer(self):
+        """Return the renderer for the configured type, creating it if needed.
+
+        Renderers read the shared config when they render, so a retry
+        after error recovery can reuse the previous one unless the
+        renderer type itself changed.
+        """
+        render_type = self.config.get('renderer', 'terminal')
+        if self.renderer is None or render_type != self._renderer_type:
+            self.renderer = Renderer.create(self.config)
+            self._renderer_type = render_type
+        return self.renderer
+
     def process_live(self, device_id=None):
         """Process live audio input."""
-        self.logger.info(f"Processing live audio input")
+        self.logger.info("Processing live audio input")
         
         # Check if PyAudio is available for live processing
-        if not PYAUDIO_AVAILABLE:
+        if _load_pyaudio() is None:
             self.logger.error("Live audio processing requires PyAudio.")
             print("Error: PyAudio is not installed or couldn't be imported.")
             print("Install PyAudio with: pip install pyaudio")
@@ -2517,7 +2864,7 @@ class AsciiSymphony:
             if 'renderer' not in self.config.settings:
                 self.config.settings['renderer'] = 'terminal'
             
-            self.renderer = Renderer.create(self.config)
+            self._get_renderer()
             
             # Get FFmpeg input arguments for live audio
             ffmpeg_args = live_processor.get_ffmpeg_input_args(device_id)
@@ -2529,14 +2876,21 @@ class AsciiSymphony:
             return result
         
         except Exception as e:
-            self.logger.error(f"Error processing live audio: {str(e)}")
+            self.logger.error("Error processing live audio: %s", e)
             raise
 
     def optimize_mp4(self, output_file):
         """Optimize MP4 file for streaming."""
-        self.logger.info(f"Optimizing MP4 file for streaming: {output_file}")
-
-        temp_file = f"{output_file}.temp.mp4"
+        self.logger.info("Optimizing MP4 file for streaming: %s", output_file)
+
+        # A unique temp file beside the output, so the final rename is atomic
+        # and concurrent runs can't collide on a fixed temp name
+        fd, temp_file = tempfile.mkstemp(
+            suffix=".mp4",
+            prefix=".optimize-",
+            dir=os.path.dirname(output_file) or "."
+        )
+        os.close(fd)
 
         try:
             # Show a simple progress message
@@ -2544,54 +2898,70 @@ class AsciiSymphony:
             progress = ProgressBar(total=100, prefix="Optimizing MP4:", suffix="Complete")
             progress.print(0)
 
-            # Use FFmpeg to optimize MP4
-            cmd = [
-                'ffmpeg',
-                '-v', 'warning',
-                '-i', output_file,
-                '-c', 'copy',
-                '-movflags', 'faststart',
-                temp_file
-            ]
-
-            # Run process
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True
-            )
-
-            # Show simple progress (we don't get much feedback for this operation)
-            while process.poll() is None:
-                # Simulate progress
-                for i in range(10, 95, 5):
-                    time.sleep(0.1)
-                    progress.print(i)
-
-                # If still running, just wait a bit
-                time.sleep(0.5)
+            try:
+                # Moving the moov box needs no demuxing, so FFmpeg is only
+                # needed for files the in-process rewrite can't handle
+                rewritten = _mp4_faststart(output_file, temp_file)
+            except (ValueError, struct.error) as e:
+                self.logger.debug("In-process faststart failed, using FFmpeg: %s", e)
+                self._ffmpeg_faststart(output_file, temp_file, progress)
+                rewritten = True
 
             # Finish progress
             progress.print(100)
 
-            # Check result
-            if process.returncode != 0:
-                stderr_output = process.stderr.read()
-                self.logger.error(f"MP4 optimization error: {stderr_output}")
-                raise RuntimeError(f"MP4 optimization failed: {stderr_output}")
-
-            # Replace original with optimized version
-            os.replace(temp_file, output_file)
+            # Replace original with optimized version, keeping its permissions
+            # rather than mkstemp's owner-only mode
+            if rewritten:
+                os.chmod(temp_file, stat.S_IMODE(os.stat(output_file).st_mode))
+                os.replace(temp_file, output_file)
 
             self.logger.info("MP4 optimization complete")
             print("MP4 optimization complete - video is now ready for streaming!")
 
         except Exception as e:
-            self.logger.error(f"MP4 optimization failed: {str(e)}")
-            # Clean up temp file if it exists
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
+            self.logger.error("MP4 optimization failed: %s", e)
+        finally:
+            # Gone already after a successful replace
+            Path(temp_file).unlink(missing_ok=True)
+
+    def _ffmpeg_faststart(self, output_file, temp_file, progress):
+        """Remux output_file into temp_file with FFmpeg's faststart flag."""
+        cmd = [
+            _find_ffmpeg() or 'ffmpeg',
+            '-y',
+            '-v', 'warning',
+            '-i', output_file,
+            '-c', 'copy',
+            '-movflags', 'faststart',
+            temp_file
+        ]
+
+        # Run process; only stderr is read, for the error report
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            close_fds=False
+        )
+
+        # Show simple progress (we don't get much feedback for this operation)
+        while process.poll() is None:
+            # Simulate progress
+            for i in range(10, 95, 5):
+                time.sleep(0.1)
+                progress.print(i)
+
+            # If still running, just wait a bit
+            time.sleep(0.5)
+
+        # Check result
+        if process.returncode != 0:
+            stderr_output = process.stderr.read()
+            self.logger.error("MP4 optimization error: %s", stderr_output)
+            raise RuntimeError(f"MP4 optimization failed: {stderr_output}")
 
 def check_dependencies():
     """Check and report on critical dependencies."""
@@ -2600,32 +2970,33 @@ def check_dependencies():
     # Check FFmpeg
     try:
         result = subprocess.run(
-            ["ffmpeg", "-version"], 
-            capture_output=True, 
-            text=True
+            [_find_ffmpeg() or "ffmpeg", "-version"],
+            **_PROBE_ARGS
         )
         if result.returncode == 0:
             version = result.stdout.split("\n")[0]
             dependencies.append(f"✓ FFmpeg: {version}")
         else:
             dependencies.append("✗ FFmpeg: Not found")
-    except FileNotFoundError:
+    except (FileNotFoundError, subprocess.TimeoutExpired):
         dependencies.append("✗ FFmpeg: Not found or not in PATH")
     
+    # Versions come from the installed package metadata, so reporting
+    # them does not import NumPy or PyAudio
     # Check NumPy
     if NUMPY_AVAILABLE:
         try:
-            dependencies.append(f"✓ NumPy: {np.__version__}")
-        except AttributeError:
+            dependencies.append(f"✓ NumPy: {importlib.metadata.version('numpy')}")
+        except importlib.metadata.PackageNotFoundError:
             dependencies.append(f"✓ NumPy: Available (version unknown)")
     else:
         dependencies.append("✗ NumPy: Not available - install with 'pip install numpy'")
     
     # Check PyAudio
-    if PYAUDIO_AVAILABLE:
+    if _load_pyaudio() is not None:
         try:
-            dependencies.append(f"✓ PyAudio: {pyaudio.__version__}")
-        except AttributeError:
+            dependencies.append(f"✓ PyAudio: {importlib.metadata.version('PyAudio')}")
+        except importlib.metadata.PackageNotFoundError:
             dependencies.append(f"✓ PyAudio: Available (version unknown)")
     else:
         dependencies.append("✗ PyAudio: Not available - install with 'pip install pyaudio'")